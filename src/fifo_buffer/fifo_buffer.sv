@@ -23,22 +23,23 @@ module fifo_buffer #(
     output logic empty,
     output logic full
 );
+    localparam int AddrWidth = $clog2(CAPACITY);
+
+    // The pointers carry an extra wrap bit so that full and empty can be told apart without a
+    // count driven from both clock domains.
     logic [CAPACITY - 1:0][DATA_WIDTH - 1:0] buffer;
-    logic [$clog2(CAPACITY) - 1:0] write_ptr_reg, write_ptr_next;
-    logic [$clog2(CAPACITY) - 1:0] read_ptr_reg, read_ptr_next;
-    logic [$clog2(CAPACITY):0] count_reg;
+    logic [AddrWidth:0] write_ptr_reg, write_ptr_next;
+    logic [AddrWidth:0] read_ptr_reg, read_ptr_next;
 
     // Write logic.
     always_ff @(posedge write_clk or negedge reset) begin
         if (!reset) begin
             buffer <= '0;
             write_ptr_reg <= '0;
-            count_reg <= '0;
 
         end else begin
             if (write_enable) begin
-                buffer[write_ptr_reg] <= write_data;
-                count_reg <= count_reg + 1;
+                buffer[write_ptr_reg[AddrWidth-1:0]] <= write_data;
             end
 
             write_ptr_reg <= write_ptr_next;
@@ -51,14 +52,7 @@ module fifo_buffer #(
             // read_data <= '0;
             read_ptr_reg <= '0;
 
-            count_reg <= '0;
-
         end else begin
-            if (read_enable) begin
-                // read_data <= buffer[read_ptr_reg];
-                count_reg <= count_reg - 1;
-            end
-
             read_ptr_reg <= read_ptr_next;
         end
     end
@@ -70,7 +64,7 @@ module fifo_buffer #(
         read_ptr_next = read_ptr_reg;
 
         if (write_enable && read_enable) begin
-            read_data = buffer[read_ptr_reg];
+            read_data = buffer[read_ptr_reg[AddrWidth-1:0]];
 
             write_ptr_next = write_ptr_reg + 1;
             read_ptr_next = read_ptr_reg + 1;
@@ -79,21 +73,13 @@ module fifo_buffer #(
             write_ptr_next = write_ptr_reg + 1;
 
         end else if (read_enable) begin
-            read_data = buffer[read_ptr_reg];
+            read_data = buffer[read_ptr_reg[AddrWidth-1:0]];
             read_ptr_next = read_ptr_reg + 1;
         end
     end
 
     assign empty = write_ptr_reg == read_ptr_reg;
-    assign full  = count_reg == CAPACITY;
-
-`ifdef COCOTB_SIM
-    initial begin
-        $dumpfile("waveforms.vcd");
-        $dumpvars(0, fifo_buffer);
-        #1;
-    end
-`endif
+    assign full  = write_ptr_reg == {~read_ptr_reg[AddrWidth], read_ptr_reg[AddrWidth-1:0]};
 
 endmodule
 
@@ -110,7 +110,7 @@ module main (
         .motor_phase_na,
         .motor_phase_nb,
 
-        .line_advance_tick(mech_line_ready),
+        .print_line_ready(mech_line_ready),
         .print_line(mech_print_line)
     );
 
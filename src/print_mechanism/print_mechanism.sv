@@ -32,6 +32,7 @@ module print_mechanism #(
     logic head_active;
     logic [HEAD_WIDTH-1:0] head_active_dots;
     logic line_advance_tick, line_reverse_tick;
+    logic invalid_step, invalid_state;
 
     thermal_head #(
         .HEAD_WIDTH(HEAD_WIDTH)
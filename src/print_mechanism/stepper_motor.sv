@@ -73,6 +73,9 @@ module stepper_motor (
         invalid_step_next   = '0;
 
         unique case (step_next)
+            // Holding position.
+            step_reg: ;
+
             (step_reg + 3'd1): motor_adv_step_next = motor_adv_step_reg + 2'd1;
             (step_reg + 3'd2): motor_adv_step_next = motor_adv_step_reg + 2'd2;
 
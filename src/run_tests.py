@@ -4,20 +4,6 @@ from pathlib import Path
 import cocotb_test.simulator
 
 
-def test_uart_transmitter():
-    src: list[str] = ["uart_transmitter.sv"]
-    src_dir = Path(os.path.dirname(__file__), "uart_transmitter")
-
-    src_path: list[Path] = [Path(src_dir, s) for s in src]
-
-    cocotb_test.simulator.run(
-        verilog_sources=src_path,
-        toplevel="uart_transmitter",
-        module="uart_transmitter.uart_transmitter_tb",
-        sim_build="./sim_build/uart_transmitter",
-    )
-
-
 def test_fifo_buffer():
     src: list[str] = ["fifo_buffer.sv"]
     src_dir = Path(os.path.dirname(__file__), "fifo_buffer")
@@ -134,14 +134,6 @@ module uart_transmitter #(
     assign active = state == STATE_TX_START || state == STATE_TX_DATA || state == STATE_TX_STOP;
     assign ready = state == STATE_IDLE;
 
-`ifdef COCOTB_SIM
-    initial begin
-        $dumpfile("waveforms.vcd");
-        $dumpvars(0, uart_transmitter);
-        #1;
-    end
-`endif
-
 endmodule
 
 `endif
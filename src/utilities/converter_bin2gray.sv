@@ -10,7 +10,7 @@ module converter_bin2gray #(
     input  logic [DATA_WIDTH-1:0] data_in,
     output logic [DATA_WIDTH-1:0] data_out
 );
-    assign data_out = {data_in[DATA_WIDTH-1], data_in[DATA_WIDTH-1:1] ^ data_in[DATA_WIDTH-2:0]};
+    assign data_out = data_in ^ (data_in >> 1);
 
 endmodule
 
@@ -11,12 +11,12 @@ module incrementer #(
     output logic [$clog2(MAX_VALUE+1)-1:0] data_out
 );
     localparam logic [$clog2(MAX_VALUE+1)-1:0] Increment = INCREMENT[$clog2(MAX_VALUE+1)-1:0];
-    localparam logic [$clog2(MAX_VALUE+1)-1:0] MaxValue = MAX_VALUE[$clog2(MAX_VALUE+1)-1:0];
 
     always_comb begin
         data_out = data_in + Increment;
 
-        if (data_in > (MaxValue - Increment)) begin
+        // Compared at full width as an increment larger than the count wouldn't fit in it.
+        if (32'(data_in) + INCREMENT > MAX_VALUE) begin
             data_out = '0;
         end
     end
@@ -0,0 +1,52 @@
+import random
+import time
+from typing import Final
+
+import cocotb
+
+from ..clock_domain import ClockDomainDriver
+from ..fifo.fifo_driver import FifoReadDriver, FifoWriteDriver
+from ..fifo.fifo_monitor import FifoDataMonitor
+from ..instrumentation import record_throughput
+
+WORDS: Final = 2100
+
+##################################################
+
+
+@cocotb.test()  # type: ignore
+async def bench_words(dut):
+    read_clock_domain: Final = ClockDomainDriver(dut.read_clk, dut.reset)
+    write_clock_domain: Final = ClockDomainDriver(dut.write_clk, dut.reset)
+
+    read_driver: Final = FifoReadDriver(clock=dut.read_clk, enable=dut.read_enable, empty=dut.empty)
+    write_driver: Final = FifoWriteDriver(
+        clock=dut.write_clk, enable=dut.write_enable, data=dut.write_data, full=dut.full
+    )
+    read_monitor: Final = FifoDataMonitor(
+        clock=dut.read_clk, enable=dut.read_enable, data=dut.read_data
+    )
+
+    read_clock_domain.start(frequency=1_000_000)
+    write_clock_domain.start(frequency=2_000_000)
+    await read_clock_domain.reset(2)
+    await write_clock_domain.reset(2)
+    read_monitor.start()
+
+    # Fill the FIFO up to one short of its depth then drain it again.
+    burst: Final = dut.DEPTH.value - 1
+    rng: Final = random.Random(0)
+    words: Final = [rng.getrandbits(8) for _ in range(WORDS)]
+    start: Final = time.perf_counter()
+
+    for i in range(0, WORDS, burst):
+        for word in words[i : i + burst]:
+            await write_driver.write(word)
+
+        for _ in words[i : i + burst]:
+            await read_driver.read()
+
+    record_throughput("fifo_async.words", WORDS, "words", time.perf_counter() - start)
+
+    read_monitor.stop()
+    assert [read_monitor.transactions.get_nowait() for _ in words] == words
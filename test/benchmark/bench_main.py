@@ -0,0 +1,74 @@
+import time
+from typing import Final
+
+import cocotb
+from cocotb.triggers import ClockCycles
+
+import numpy as np
+from numpy import uint8
+
+from ..clock_domain import ClockDomainDriver
+from ..instrumentation import record_throughput
+from ..print_mechanism.image_compare import compare_images
+from ..print_mechanism.line_buffer import LineBuffer
+from ..print_mechanism.print_stimulus import PrintStimulus
+from ..print_mechanism.stepper_motor_driver import StepperMotorDriver
+from ..print_mechanism.thermal_head_driver import ThermalHeadDriver
+from ..uart.line_frame_parser import LINE_FOOTER, LINE_HEADER, LineFrameParser
+from ..uart.uart_monitor import UartMonitor
+
+CLOCK_PERIOD_NS: Final = 10
+MECH_HEAD_WIDTH: Final = 384
+LINES: Final = 4
+
+# Every line is sent back as a frame over the UART, which takes far longer than printing it.
+LINE_FRAME_BYTES: Final = len(LINE_HEADER) + MECH_HEAD_WIDTH // 8 + len(LINE_FOOTER)
+
+##################################################
+
+
+@cocotb.test()  # type: ignore
+async def bench_lines(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
+    head_driver: Final = ThermalHeadDriver(
+        clock=dut.mech_clk, data=dut.mech_data, latch=dut.mech_latch, dst=dut.mech_dst
+    )
+    motor_driver: Final = StepperMotorDriver(
+        clock=dut.clk,
+        phase_a=dut.motor_phase_a,
+        phase_b=dut.motor_phase_b,
+        phase_na=dut.motor_phase_na,
+        phase_nb=dut.motor_phase_nb,
+    )
+
+    clks_per_bit: Final = dut.uart_tx.CLKS_PER_BIT.value
+    lines: Final = LineBuffer(width=MECH_HEAD_WIDTH)
+    monitor: Final = UartMonitor(
+        line=dut.uart_tx_pin_1,
+        clks_per_bit=clks_per_bit,
+        clock_period_ns=CLOCK_PERIOD_NS,
+        callback=LineFrameParser(lines).feed_byte,
+    )
+
+    clock_domain.start(1_000_000_000 // CLOCK_PERIOD_NS)
+    await clock_domain.reset(2)
+    monitor.start()
+
+    image: Final = np.random.default_rng(0).integers(0, 2, (LINES, MECH_HEAD_WIDTH), dtype=uint8)
+    start: Final = time.perf_counter()
+
+    await PrintStimulus(head_driver, motor_driver).print_image(image)
+
+    # Wait a frame at a time for the lines to come back, giving up after twice the expected time.
+    frame_cycles: Final = 10 * clks_per_bit
+    for _ in range(2 * LINES * LINE_FRAME_BYTES):
+        if len(lines) == LINES:
+            break
+
+        await ClockCycles(dut.clk, frame_cycles)
+
+    record_throughput("main.lines", LINES, "lines", time.perf_counter() - start)
+
+    comparison: Final = compare_images(lines.to_bitmap(), image)
+    assert comparison.passed, str(comparison)
@@ -0,0 +1,54 @@
+import time
+from typing import Final
+
+import cocotb
+from cocotb.triggers import ClockCycles
+
+import numpy as np
+from numpy import uint8
+
+from ..clock_domain import ClockDomainDriver
+from ..instrumentation import record_throughput
+from ..print_mechanism.image_compare import compare_images
+from ..print_mechanism.print_mech_monitor import PrintMechMonitor
+from ..print_mechanism.print_stimulus import PrintStimulus
+from ..print_mechanism.stepper_motor_driver import StepperMotorDriver
+from ..print_mechanism.thermal_head_driver import ThermalHeadDriver
+
+LINES: Final = 25
+
+##################################################
+
+
+@cocotb.test()  # type: ignore
+async def bench_lines(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
+    head_driver: Final = ThermalHeadDriver(
+        clock=dut.mech_clk, data=dut.mech_data, latch=dut.mech_latch, dst=dut.mech_dst
+    )
+    motor_driver: Final = StepperMotorDriver(
+        clock=dut.clk,
+        phase_a=dut.motor_phase_a,
+        phase_b=dut.motor_phase_b,
+        phase_na=dut.motor_phase_na,
+        phase_nb=dut.motor_phase_nb,
+    )
+    print_monitor: Final = PrintMechMonitor(
+        print_line_ready=dut.print_line_ready, print_line=dut.print_line
+    )
+
+    clock_domain.start(100_000_000)
+    await clock_domain.reset(2)
+    print_monitor.start()
+
+    image: Final = np.random.default_rng(0).integers(0, 2, (LINES, dut.HEAD_WIDTH.value), dtype=uint8)
+    start: Final = time.perf_counter()
+
+    await PrintStimulus(head_driver, motor_driver).print_image(image)
+    await ClockCycles(dut.clk, 4)
+
+    record_throughput("print_mechanism.lines", LINES, "lines", time.perf_counter() - start)
+
+    comparison: Final = compare_images(print_monitor.to_bitmap(), image)
+    assert comparison.passed, str(comparison)
@@ -0,0 +1,54 @@
+import time
+from typing import Final
+
+import cocotb
+from cocotb.triggers import ClockCycles
+
+from ..clock_domain import ClockDomainDriver
+from ..instrumentation import record_throughput
+from ..print_mechanism.motion_profile import MotionProfile
+from ..print_mechanism.stepper_motor_driver import StepperMotorDriver
+from ..print_mechanism.stepper_motor_monitor import StepperMotorMonitor
+
+# A page feed of 1000 lines, ramping up to full speed over the first and last 200 half steps.
+HALF_STEPS: Final = 4000
+RATE: Final = 20_000_000
+ACCELERATION: Final = RATE**2 / (2 * 200)
+
+##################################################
+
+
+@cocotb.test()  # type: ignore
+async def bench_page_feed(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
+    motor_driver: Final = StepperMotorDriver(
+        clock=dut.clk,
+        phase_a=dut.motor_phase_a,
+        phase_b=dut.motor_phase_b,
+        phase_na=dut.motor_phase_na,
+        phase_nb=dut.motor_phase_nb,
+    )
+    monitor: Final = StepperMotorMonitor(
+        line_advance_tick=dut.line_advance_tick,
+        line_reverse_tick=dut.line_reverse_tick,
+        invalid_step=dut.invalid_step,
+    )
+
+    clock_domain.start(100_000_000)
+    await clock_domain.reset(2)
+    await motor_driver.step_forward(1)
+    await ClockCycles(dut.clk, 4)
+
+    monitor.start()
+
+    profile: Final = MotionProfile.trapezoidal(HALF_STEPS, RATE, ACCELERATION)
+    start: Final = time.perf_counter()
+
+    await motor_driver.play(profile)
+    await ClockCycles(dut.clk, 8)
+
+    record_throughput("stepper_motor.page_feed", HALF_STEPS, "half_steps", time.perf_counter() - start)
+
+    assert monitor.invalid_steps == 0
+    assert monitor.lines_moved == HALF_STEPS // 4
@@ -0,0 +1,74 @@
+import time
+from typing import Final
+
+import cocotb
+from cocotb.binary import BinaryValue
+
+import numpy as np
+from numpy import uint8
+
+from ..instrumentation import record_throughput
+from ..print_mechanism.image_compare import compare_images
+from ..print_mechanism.thermal_head_driver import ThermalHeadDriver
+from ..print_mechanism.thermal_head_monitor import ThermalHeadMonitor
+
+LINES: Final = 50
+BIT_STREAM_LINES: Final = 25
+BURN_TIME: Final = 0.000001
+
+##################################################
+
+
+def random_lines(lines: int, width: int) -> np.ndarray:
+    return np.random.default_rng(0).integers(0, 2, (lines, width), dtype=uint8)
+
+
+@cocotb.test()  # type: ignore
+async def bench_lines(dut):
+    head_driver: Final = ThermalHeadDriver(
+        clock=dut.clk, data=dut.data, latch=dut.latch, dst=dut.dst
+    )
+    head_monitor: Final = ThermalHeadMonitor(
+        head_active=dut.head_active, head_active_dots=dut.head_active_dots
+    )
+
+    dut.reset.value = 1
+    head_monitor.start()
+
+    lines: Final = random_lines(LINES, dut.HEAD_WIDTH.value)
+    start: Final = time.perf_counter()
+
+    await head_driver.write_lines(lines, BURN_TIME)
+
+    record_throughput("thermal_head.lines", LINES, "lines", time.perf_counter() - start)
+
+    comparison: Final = compare_images(head_monitor.to_bitmap(), lines)
+    assert comparison.passed, str(comparison)
+
+
+@cocotb.test()  # type: ignore
+async def bench_bit_stream_lines(dut):
+    head_driver: Final = ThermalHeadDriver(
+        clock=dut.clk, data=dut.data, latch=dut.latch, dst=dut.dst
+    )
+    head_monitor: Final = ThermalHeadMonitor(
+        head_active=dut.head_active, head_active_dots=dut.head_active_dots
+    )
+
+    dut.reset.value = 1
+    head_monitor.start()
+
+    lines: Final = random_lines(BIT_STREAM_LINES, dut.HEAD_WIDTH.value)
+    start: Final = time.perf_counter()
+
+    for line in lines:
+        await head_driver.write_bit_stream(BinaryValue("".join(str(dot) for dot in line)))
+        await head_driver.latch_data()
+        await head_driver.burn(BURN_TIME)
+
+    record_throughput(
+        "thermal_head.bit_stream_lines", BIT_STREAM_LINES, "lines", time.perf_counter() - start
+    )
+
+    comparison: Final = compare_images(head_monitor.to_bitmap(), lines)
+    assert comparison.passed, str(comparison)
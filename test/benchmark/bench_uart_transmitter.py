@@ -0,0 +1,51 @@
+import random
+import time
+from typing import Final
+
+import cocotb
+from cocotb.triggers import RisingEdge
+
+from ..clock_domain import ClockDomainDriver
+from ..instrumentation import record_throughput
+from ..uart.uart_monitor import UartMonitor
+
+CLOCK_PERIOD_NS: Final = 10
+BYTES: Final = 400
+
+##################################################
+
+
+@cocotb.test()  # type: ignore
+async def bench_bytes(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
+    monitor: Final = UartMonitor(
+        line=dut.port,
+        clks_per_bit=dut.CLKS_PER_BIT.value,
+        clock_period_ns=CLOCK_PERIOD_NS,
+    )
+
+    dut.enable.value = 0
+    dut.data.value = 0
+
+    clock_domain.start(1_000_000_000 // CLOCK_PERIOD_NS)
+    await clock_domain.reset(2)
+    monitor.start()
+
+    rng: Final = random.Random(0)
+    words: Final = bytes(rng.getrandbits(8) for _ in range(BYTES))
+    start: Final = time.perf_counter()
+
+    # Keep the transmitter busy by loading the next byte as soon as it's ready.
+    for word in words:
+        await RisingEdge(dut.clk)
+        dut.data.value = word
+        dut.enable.value = 1
+
+        await RisingEdge(dut.clk)
+        dut.enable.value = 0
+        await RisingEdge(dut.ready)
+
+    record_throughput("uart_transmitter.bytes", BYTES, "bytes", time.perf_counter() - start)
+
+    assert monitor.data == words
@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Final, Optional, Sequence
+
+from .. import config
+from ..instrumentation import read_report
+from ..scheduler import Job, JobResult, run_job
+
+BENCHMARK_DIRECTORY: Final = Path(config.OUTPUT_DIRECTORY, "benchmark")
+# Baselines are stored relative to the time a fixed Python workload takes on the machine that
+# recorded them, so that they can be compared between machines. They're re-recorded with
+# `python -m test.benchmark.benchmark --update` after a change that's meant to alter the
+# throughput, on an otherwise idle machine.
+BASELINE_FILE: Final = Path(os.path.dirname(__file__), "baselines.json")
+CALIBRATION_ITERATIONS: Final = 2_000_000
+CALIBRATION_RUNS: Final = 5
+
+# Fraction of its baseline throughput a benchmark may lose before it counts as a regression.
+THRESHOLD_ENV: Final = "BENCHMARK_THRESHOLD"
+DEFAULT_THRESHOLD: Final = 0.2
+
+##################################################
+
+
+def benchmark_job(toplevel: str, parameters: Optional[dict[str, int]] = None) -> Job:
+    return Job(
+        toplevel=toplevel,
+        test_module=f"test.benchmark.bench_{toplevel}",
+        output_directory=Path(BENCHMARK_DIRECTORY, toplevel),
+        parameters=parameters or {},
+    )
+
+
+BENCHMARKS: Final[list[Job]] = [
+    benchmark_job("uart_transmitter"),
+    benchmark_job("thermal_head", {"HEAD_WIDTH": 384}),
+    benchmark_job("stepper_motor"),
+    benchmark_job("print_mechanism"),
+    benchmark_job("fifo_async"),
+    benchmark_job("main"),
+]
+
+##################################################
+
+
+def calibrate() -> float:
+    # Seconds the calibration workload takes at best, as the testbenches are mostly Python.
+    def workload() -> int:
+        values: dict[int, int] = {}
+        for i in range(CALIBRATION_ITERATIONS):
+            values[i % 64] = values.get(i % 64, 0) + i
+
+        return sum(values.values())
+
+    runs: Final[list[float]] = []
+    for _ in range(CALIBRATION_RUNS):
+        start: float = time.perf_counter()
+        workload()
+        runs.append(time.perf_counter() - start)
+
+    return min(runs)
+
+
+def run_benchmarks(jobs: Sequence[Job]) -> tuple[dict[str, dict[str, Any]], list[JobResult]]:
+    throughput: Final[dict[str, dict[str, Any]]] = {}
+    failed: Final[list[JobResult]] = []
+
+    # Run one at a time so the benchmarks don't compete with each other for the CPU.
+    for job in jobs:
+        result: JobResult = run_job(job, os.cpu_count() or 1)
+        if not result.passed:
+            failed.append(result)
+
+        report: dict[str, Any] = read_report(Path(job.output_directory, "instrumentation.json"))
+        throughput.update(report.get("benchmarks", {}))
+
+    # Calibrated after the benchmarks have warmed the machine up, in the same conditions.
+    calibration_seconds: Final = calibrate()
+    for result in throughput.values():
+        result["relative_throughput"] = result["throughput"] * calibration_seconds
+
+    return throughput, failed
+
+
+def read_baselines(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def write_baselines(path: Path, results: dict[str, dict[str, Any]]) -> None:
+    baselines: Final = {
+        name: {"relative_throughput": result["relative_throughput"], "unit": result["unit"]}
+        for name, result in results.items()
+    }
+    path.write_text(json.dumps(baselines, indent=4, sort_keys=True) + "\n")
+
+
+def find_regressions(
+    results: dict[str, dict[str, Any]], baselines: dict[str, dict[str, Any]], threshold: float
+) -> list[str]:
+    return [
+        name
+        for name, result in results.items()
+        if name in baselines
+        and result["relative_throughput"]
+        < baselines[name]["relative_throughput"] * (1 - threshold)
+    ]
+
+
+def summarise(
+    results: dict[str, dict[str, Any]], baselines: dict[str, dict[str, Any]], threshold: float
+) -> str:
+    regressions: Final = find_regressions(results, baselines, threshold)
+    width: Final = max([len("BENCHMARK"), *(len(name) for name in results)])
+
+    lines: list[str] = [
+        f"{'BENCHMARK':<{width}}  {'UNITS':>6}  {'WALL (s)':>8}  {'THROUGHPUT':>20}  "
+        f"{'RELATIVE':>10}  {'BASELINE':>10}  {'CHANGE':>7}  STATUS"
+    ]
+    for name, result in sorted(results.items()):
+        rate: str = f"{result['throughput']:.4g} {result['unit']}/s"
+
+        baseline: str = "-"
+        change: str = "-"
+        status: str = "NEW"
+        if name in baselines:
+            expected: float = baselines[name]["relative_throughput"]
+            baseline = f"{expected:.4g}"
+            change = f"{(result['relative_throughput'] / expected - 1) * 100:+.0f}%"
+            status = "SLOWER" if name in regressions else "OK"
+
+        lines.append(
+            f"{name:<{width}}  {result['units']:>6}  {result['wall_seconds']:>8.2f}  "
+            f"{rate:>20}  {result['relative_throughput']:>10.4g}  {baseline:>10}  {change:>7}  "
+            f"{status}"
+        )
+
+    lines.append(f"{len(regressions)} of {len(results)} benchmarks regressed by more than {threshold:.0%}")
+
+    return "\n".join(lines)
+
+
+##################################################
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser: Final = argparse.ArgumentParser(
+        description="Run the testbench benchmarks and compare them against the stored baselines."
+    )
+    parser.add_argument(
+        "-k", "--filter", default="", help="Only run benchmarks whose name contains this string."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=float(os.environ.get(THRESHOLD_ENV, DEFAULT_THRESHOLD)),
+        help="Fraction of baseline throughput a benchmark may lose before failing.",
+    )
+    parser.add_argument(
+        "--baselines", type=Path, default=BASELINE_FILE, help="Baseline throughput file."
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="Store the results as the new baselines."
+    )
+    args: Final = parser.parse_args(argv)
+
+    jobs: Final = [job for job in BENCHMARKS if args.filter in job.name]
+
+    results, failed = run_benchmarks(jobs)
+    baselines: Final = read_baselines(args.baselines)
+
+    print(summarise(results, baselines, args.threshold))
+    for result in failed:
+        print(f"FAIL {result.job.name}: {result.error or f'{result.failures} tests failed'}")
+
+    if args.update and not failed:
+        write_baselines(args.baselines, {**baselines, **results})
+        return 0
+
+    regressions: Final = find_regressions(results, baselines, args.threshold)
+    return 0 if not failed and not regressions else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+from . import benchmark
+
+##################################################
+
+
+# The benchmarks take minutes and their results depend on the machine, so only run on request.
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="RUN_BENCHMARKS isn't set")
+def test_benchmarks():
+    assert benchmark.main([]) == 0
@@ -0,0 +1,166 @@
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+from functools import cache
+from logging import Logger
+from pathlib import Path
+from typing import Callable, Final, Iterator, Mapping, Optional, Sequence
+
+import cocotb
+
+STAMP_FILE: Final = "cache_entry.json"
+LOCK_SUFFIX: Final = ".lock"
+
+
+class BuildCache:
+    def __init__(
+        self,
+        directory: Path,
+        size_limit: int,
+        name: Optional[str] = None,
+    ) -> None:
+        self._directory: Final[Path] = directory
+        self._size_limit: Final[int] = size_limit
+
+        self._log: Final[Optional[Logger]] = logging.getLogger(name) if name else None
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @staticmethod
+    def key(
+        sources: Sequence[Path],
+        toplevel: str,
+        parameters: Mapping[str, object],
+        build_args: Sequence[str],
+        toolchain: Sequence[str] = (),
+    ) -> str:
+        digest = hashlib.sha256()
+
+        for source in sources:
+            digest.update(str(source).encode())
+            digest.update(Path(source).read_bytes())
+
+        digest.update(toplevel.encode())
+        digest.update(json.dumps({k: str(v) for k, v in parameters.items()}, sort_keys=True).encode())
+        digest.update(json.dumps(list(build_args)).encode())
+        digest.update(cocotb.__version__.encode())
+
+        for version in toolchain:
+            digest.update(version.encode())
+
+        return digest.hexdigest()
+
+    @contextmanager
+    def use(self, key: str, build: Callable[[Path], None]) -> Iterator[Path]:
+        # The entry is built if it's missing and then held with a shared lock for as long as it's
+        # in use, so that it can't be evicted from under a running simulation.
+        entry: Final = Path(self._directory, key)
+        stamp: Final = Path(entry, STAMP_FILE)
+
+        while True:
+            with self._lock(key):
+                if stamp.exists():
+                    if self._log is not None:
+                        self._log.info(f"Cache hit: {key}")
+
+                    os.utime(stamp)
+
+                else:
+                    if self._log is not None:
+                        self._log.info(f"Cache miss: {key}")
+
+                    # A directory without a stamp is left over from a failed or interrupted build.
+                    shutil.rmtree(entry, ignore_errors=True)
+
+                    start: float = time.perf_counter()
+                    build(entry)
+
+                    stamp.write_text(
+                        json.dumps(
+                            {
+                                "size": _directory_size(entry),
+                                "build_seconds": time.perf_counter() - start,
+                            }
+                        )
+                    )
+
+            with self._lock(key, shared=True):
+                # The entry may have been evicted between the two locks.
+                if not stamp.exists():
+                    continue
+
+                self.evict(keep=key)
+                yield entry
+                return
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        entries: list[tuple[float, int, str]] = []
+
+        for stamp in self._directory.glob(f"*/{STAMP_FILE}"):
+            try:
+                size: int = json.loads(stamp.read_text())["size"]
+                entries.append((stamp.stat().st_mtime, size, stamp.parent.name))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        total: int = sum(size for _, size, _ in entries)
+
+        for _, size, key in sorted(entries):
+            if total <= self._size_limit:
+                break
+
+            if key == keep:
+                continue
+
+            with self._lock(key, blocking=False) as locked:
+                if not locked:
+                    continue
+
+                if self._log is not None:
+                    self._log.info(f"Evicting: {key}")
+
+                shutil.rmtree(Path(self._directory, key), ignore_errors=True)
+                total -= size
+
+    @contextmanager
+    def _lock(self, key: str, blocking: bool = True, shared: bool = False) -> Iterator[bool]:
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        operation: Final = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | (
+            0 if blocking else fcntl.LOCK_NB
+        )
+
+        with open(Path(self._directory, key + LOCK_SUFFIX), "w") as lock_file:
+            try:
+                fcntl.flock(lock_file, operation)
+            except BlockingIOError:
+                yield False
+                return
+
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@cache
+def tool_version(*command: str) -> str:
+    # First line of a tool's version output, or nothing if the tool can't be run.
+    try:
+        output: Final = subprocess.run(command, capture_output=True, text=True).stdout
+    except OSError:
+        return ""
+
+    return output.strip().split("\n")[0]
+
+
+def _directory_size(directory: Path) -> int:
+    return sum(path.stat().st_size for path in directory.rglob("*") if path.is_file())
@@ -0,0 +1,105 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Final, Optional, Sequence
+
+from . import config
+from .fifo.characterise_fifo_async import CLOCKS_ENV, FIELDS, RESULTS_FILE, WORDS_ENV
+from .scheduler import add_cores_argument, run_jobs
+from .sweep import Sweep
+
+CHARACTERISATION_DIRECTORY: Final = Path(config.OUTPUT_DIRECTORY, "characterisation")
+
+# Every DEPTH is a separate build. Clock ratios are swept within each simulation.
+FIFO_ASYNC: Final = Sweep(
+    toplevel="fifo_async",
+    test_module="test.fifo.characterise_fifo_async",
+    grid={"DEPTH": [8, 16, 32]},
+    directory=CHARACTERISATION_DIRECTORY,
+)
+
+##################################################
+
+
+def summarise(rows: Sequence[dict[str, str]]) -> str:
+    lines: list[str] = [
+        f"{'DEPTH':>5}  {'WRITE':>5}  {'READ':>5}  {'MWORDS/S':>8}  {'FULL':>5}  {'EMPTY':>5}  "
+        f"{'IDLE (ns)':>9}  {'P50 (ns)':>8}  {'P90 (ns)':>8}  {'P99 (ns)':>8}  {'MAX (ns)':>8}"
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['depth']:>5}  {row['write_mhz']:>5}  {row['read_mhz']:>5}  "
+            f"{float(row['words_per_second']) / 1_000_000:>8.2f}  "
+            f"{float(row['full_fraction']):>5.0%}  {float(row['empty_fraction']):>5.0%}  "
+            f"{float(row['idle_latency_ns']):>9.0f}  {float(row['latency_p50_ns']):>8.0f}  "
+            f"{float(row['latency_p90_ns']):>8.0f}  {float(row['latency_p99_ns']):>8.0f}  "
+            f"{float(row['latency_max_ns']):>8.0f}"
+        )
+
+    return "\n".join(lines)
+
+
+##################################################
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser: Final = argparse.ArgumentParser(
+        description="Characterise fifo_async throughput and latency across clock ratios and depths."
+    )
+    add_cores_argument(parser)
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=FIFO_ASYNC.grid["DEPTH"], help="FIFO depths."
+    )
+    parser.add_argument(
+        "--clocks", type=int, nargs="+", help="Clock frequencies in MHz to pair up."
+    )
+    parser.add_argument("--words", type=int, help="Words pushed through at each pair of clocks.")
+    parser.add_argument(
+        "--csv",
+        type=Path,
+        default=Path(CHARACTERISATION_DIRECTORY, "fifo_async.csv"),
+        help="Combined results.",
+    )
+    args: Final = parser.parse_args(argv)
+
+    # The simulations pick these up from the environment.
+    if args.clocks:
+        os.environ[CLOCKS_ENV] = ",".join(str(mhz) for mhz in args.clocks)
+    if args.words:
+        os.environ[WORDS_ENV] = str(args.words)
+
+    sweep: Final = Sweep(
+        FIFO_ASYNC.toplevel,
+        FIFO_ASYNC.test_module,
+        {"DEPTH": args.depths},
+        directory=FIFO_ASYNC.directory,
+    )
+
+    start: Final = time.perf_counter()
+    results: Final = run_jobs(sweep.jobs(), args.cores)
+
+    rows: Final[list[dict[str, str]]] = []
+    for result in results:
+        if result.passed:
+            with open(Path(result.job.output_directory, RESULTS_FILE), newline="") as file:
+                rows.extend(csv.DictReader(file))
+        else:
+            print(f"FAIL {result.job.name}: {result.error or f'{result.failures} tests failed'}")
+
+    args.csv.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.csv, "w", newline="") as file:
+        writer: csv.DictWriter = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(summarise(rows))
+    print(f"Written to {args.csv} in {time.perf_counter() - start:.1f}s")
+
+    return 0 if all(result.passed for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
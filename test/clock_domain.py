@@ -28,7 +28,7 @@ class ClockDomainDriver:
         if self._coroutine is not None:
             return
 
-        period_ns: Final = int((1 / frequency) * 1_000_000_000)
+        period_ns: Final = round((1 / frequency) * 1_000_000_000)
         clock: Final = Clock(self._clock, period_ns, units="ns")
 
         self._coroutine = cocotb.start_soon(clock.start())
@@ -1,8 +1,23 @@
-from typing import Final
+import os
+import resource
+import time
+from contextlib import contextmanager
+from typing import Final, Iterator, Optional
 from pathlib import Path
 
 from cocotb import runner
 
+from .build_cache import BuildCache, STAMP_FILE, tool_version
+from .instrumentation import (
+    INSTRUMENTATION_FILE_ENV,
+    INSTRUMENTATION_MODULE,
+    PROFILE_ENV,
+    read_report,
+    sim_time_ns,
+    write_report,
+)
+from .tracing import SIGNAL_TRACE_ENV, TRACING_MODULE, TraceConfig
+
 VERLIOG_SOURCES: Final[list[Path]] = [
     Path("src/fifo_async/fifo_async.sv"),
     Path("src/fifo_async/fifo_counter.sv"),
@@ -21,28 +36,29 @@ VERLIOG_SOURCES: Final[list[Path]] = [
     Path("src/utilities/shift_register.sv"),
     Path("src/utilities/synchroniser.sv"),
     Path("src/utilities/incrementer.sv"),
+    Path("src/main/main.sv"),
 ]
 
 MODULES: Final = [
     "fifo_async",
+    "fifo_buffer",
     "stepper_motor",
     "thermal_head",
+    "print_mechanism",
     "counter_binary",
     "counter_gray",
     "shift_register",
+    "synchroniser",
+    "uart_transmitter",
+    "main",
 ]
 
 OUTPUT_DIRECTORY: Final = Path("sim_build")
 BUILD_DIRECTORY: Final[Path] = Path(OUTPUT_DIRECTORY, "build")
 
 SIMULATOR: Final = runner.get_runner("verilator")
+BUILD_JOBS: Final = 8
 SIM_ARGS: Final[list[str]] = [
-    "--build-jobs",
-    "8",
-    "--verilate-jobs",
-    "8",
-    "--trace-fst",
-    "--trace-structs",
     "-O2",
     "--x-assign",
     "fast",
@@ -53,48 +69,149 @@ SIM_ARGS: Final[list[str]] = [
     "10000",
 ]
 
+# Only traced builds pay for Verilator's tracing, and they're cached separately from the rest.
+TRACE_ARGS: Final[list[str]] = [
+    "--trace-fst",
+    "--trace-structs",
+]
+
+
+BUILD_CACHE: Final = BuildCache(
+    directory=Path(os.environ.get("BUILD_CACHE_DIRECTORY", BUILD_DIRECTORY)),
+    size_limit=int(os.environ.get("BUILD_CACHE_SIZE_LIMIT", 4 * 1024**3)),
+    name="BuildCache",
+)
+
 
 def run_test(
-    toplevel: str, output_directory: Path, test_module: str, parameters: dict[str, int] | None = None
-) -> None:
-    if parameters:
-        SIMULATOR.build(
-            verilog_sources=VERLIOG_SOURCES,
-            hdl_toplevel=toplevel,
-            build_dir=output_directory,
-            build_args=SIM_ARGS,
-            parameters=parameters,
-        )
-    else:
-        SIMULATOR.build(
-            verilog_sources=VERLIOG_SOURCES,
-            hdl_toplevel=toplevel,
-            build_dir=output_directory,
-            build_args=SIM_ARGS,
-        )
-    
-    SIMULATOR.test(
-        hdl_toplevel_lang="verilog",
-        hdl_toplevel=toplevel,
-        test_module=test_module,
-        build_dir=output_directory,
-        test_dir=output_directory,
-    )
-
-
-def build_sources(toplevel: str, parameters: dict[str, int] | None = None) -> None:
-    if parameters:
+    toplevel: str,
+    output_directory: Path,
+    test_module: str,
+    parameters: dict[str, int] | None = None,
+    build_jobs: int = BUILD_JOBS,
+    log_to_file: bool = False,
+    trace: Optional[TraceConfig] = None,
+    profile: Optional[bool] = None,
+) -> Optional[Path]:
+    output_directory.mkdir(parents=True, exist_ok=True)
+
+    # The simulation adds its own measurements to the same report.
+    instrumentation_file: Final = Path(output_directory, "instrumentation.json").absolute()
+    instrumentation_file.unlink(missing_ok=True)
+
+    trace = trace or TraceConfig.from_env()
+    profile = bool(os.environ.get(PROFILE_ENV)) if profile is None else profile
+    waves: Final = trace is not None and trace.full
+
+    test_modules: Final = [test_module]
+    extra_env: Final = {INSTRUMENTATION_FILE_ENV: str(instrumentation_file)}
+
+    # The scheduler is only profiled on request.
+    if profile:
+        test_modules.insert(0, INSTRUMENTATION_MODULE)
+        extra_env[PROFILE_ENV] = "1"
+
+    # Anything short of a full trace is recorded from the testbench.
+    if trace is not None and not trace.full:
+        test_modules.insert(-1, TRACING_MODULE)
+        extra_env[SIGNAL_TRACE_ENV] = str(trace)
+
+    build_start: Final = time.perf_counter()
+    with build_sources(
+        toplevel,
+        parameters,
+        build_jobs,
+        log_file=Path(output_directory, "build.log") if log_to_file else None,
+        waves=waves,
+    ) as build_directory:
+        build_seconds: Final = time.perf_counter() - build_start
+
+        test_start: Final = time.perf_counter()
+        results_file: Optional[Path] = None
+        try:
+            results_file = SIMULATOR.test(
+                hdl_toplevel_lang="verilog",
+                hdl_toplevel=toplevel,
+                test_module=",".join(test_modules),
+                build_dir=build_directory,
+                test_dir=output_directory,
+                extra_env=extra_env,
+                waves=waves,
+                log_file=Path(output_directory, "test.log") if log_to_file else None,
+            )
+
+        finally:
+            report: Final = read_report(instrumentation_file)
+            report.update(
+                {
+                    "toplevel": toplevel,
+                    "test_module": test_module,
+                    "parameters": {
+                        name: str(value) for name, value in (parameters or {}).items()
+                    },
+                    "trace": str(trace) if trace is not None else None,
+                    "profiled": profile,
+                    "build": {
+                        "seconds": build_seconds,
+                        "cache_entry": build_directory.name,
+                        # Time the cached simulator originally took to build.
+                        "compile_seconds": read_report(Path(build_directory, STAMP_FILE)).get(
+                            "build_seconds"
+                        ),
+                    },
+                    "test": {
+                        "wall_seconds": time.perf_counter() - test_start,
+                        # The simulator doesn't write any results when it fails to start.
+                        "sim_time_ns": (
+                            sim_time_ns(results_file)
+                            if results_file is not None and results_file.exists()
+                            else None
+                        ),
+                        # Kilobytes on Linux. This is the largest simulator this process has run
+                        # so far rather than this one, which the profiler records itself.
+                        "largest_child_rss_kb": resource.getrusage(
+                            resource.RUSAGE_CHILDREN
+                        ).ru_maxrss,
+                    },
+                }
+            )
+            write_report(instrumentation_file, report)
+
+    return results_file
+
+
+@contextmanager
+def build_sources(
+    toplevel: str,
+    parameters: dict[str, int] | None = None,
+    build_jobs: int = BUILD_JOBS,
+    log_file: Path | None = None,
+    waves: bool = False,
+) -> Iterator[Path]:
+    # The build is only guaranteed to stay in the cache until the block is exited.
+    parameters = parameters or {}
+    build_args: Final = SIM_ARGS + TRACE_ARGS if waves else SIM_ARGS
+
+    # Job counts don't change the simulator binary so are kept out of the cache key.
+    job_args: Final = ["--build-jobs", str(build_jobs), "--verilate-jobs", str(build_jobs)]
+
+    def build(build_directory: Path) -> None:
         SIMULATOR.build(
             verilog_sources=VERLIOG_SOURCES,
             hdl_toplevel=toplevel,
-            build_dir=Path(OUTPUT_DIRECTORY, toplevel),
-            build_args=SIM_ARGS,
+            build_dir=build_directory,
+            build_args=job_args + build_args,
             parameters=parameters,
+            waves=waves,
+            log_file=log_file,
         )
-    else:
-        SIMULATOR.build(
-            verilog_sources=VERLIOG_SOURCES,
-            hdl_toplevel=toplevel,
-            build_dir=Path(OUTPUT_DIRECTORY, toplevel),
-            build_args=SIM_ARGS,
-        )
+
+    # Simulators built by a different Verilator or C++ compiler aren't reused.
+    toolchain: Final = [
+        tool_version("verilator", "--version"),
+        tool_version(os.environ.get("CXX", "g++"), "--version"),
+    ]
+
+    key: Final = BUILD_CACHE.key(VERLIOG_SOURCES, toplevel, parameters, build_args, toolchain)
+    with BUILD_CACHE.use(key, build) as build_directory:
+        yield build_directory
@@ -0,0 +1,171 @@
+import csv
+import os
+import random
+from pathlib import Path
+from typing import Final
+
+import cocotb
+from cocotb.handle import SimHandleBase
+from cocotb.queue import Queue
+from cocotb.task import Task
+from cocotb.triggers import ReadOnly, RisingEdge
+from cocotb.utils import get_sim_time
+
+import numpy as np
+
+from .fifo_driver import FifoReadDriver, FifoWriteDriver
+from .fifo_monitor import FifoDataMonitor
+
+from ..clock_domain import ClockDomainDriver
+
+# Clock frequencies to pair up for the write and read sides of the FIFO.
+CLOCKS_ENV: Final = "FIFO_CLOCKS_MHZ"
+CLOCKS_MHZ: Final = [int(mhz) for mhz in os.environ.get(CLOCKS_ENV, "25,50,100").split(",")]
+# Words pushed through at each pair of clocks.
+WORDS_ENV: Final = "FIFO_CHARACTERISATION_WORDS"
+WORDS: Final = int(os.environ.get(WORDS_ENV, 500))
+
+RESULTS_FILE: Final = Path("characterisation.csv")
+FIELDS: Final = [
+    "depth",
+    "write_mhz",
+    "read_mhz",
+    "words",
+    "words_per_second",
+    "write_words_per_cycle",
+    "read_words_per_cycle",
+    "full_fraction",
+    "empty_fraction",
+    "idle_latency_ns",
+    "latency_p50_ns",
+    "latency_p90_ns",
+    "latency_p99_ns",
+    "latency_max_ns",
+]
+
+##################################################
+
+
+async def timestamps(transactions: Queue, times_ns: list[float]) -> None:
+    while True:
+        await transactions.get()
+        times_ns.append(get_sim_time("ns"))
+
+
+async def samples(clock: SimHandleBase, signal: SimHandleBase, values: list[int]) -> None:
+    # The signal as it settles after each edge of its own clock.
+    while True:
+        await RisingEdge(clock)
+        await ReadOnly()
+        values.append(int(signal.value))
+
+
+@cocotb.test()  # type: ignore
+async def characterise(dut):
+    read_clock_domain: Final = ClockDomainDriver(dut.read_clk, dut.reset)
+    write_clock_domain: Final = ClockDomainDriver(dut.write_clk, dut.reset)
+
+    read_driver: Final = FifoReadDriver(clock=dut.read_clk, enable=dut.read_enable, empty=dut.empty)
+    write_driver: Final = FifoWriteDriver(
+        clock=dut.write_clk, enable=dut.write_enable, data=dut.write_data, full=dut.full
+    )
+
+    depth: Final = dut.DEPTH.value
+    rng: Final = random.Random(0)
+    rows: Final[list[dict[str, float]]] = []
+
+    for write_mhz in CLOCKS_MHZ:
+        for read_mhz in CLOCKS_MHZ:
+            write_clock_domain.start(frequency=write_mhz * 1_000_000)
+            read_clock_domain.start(frequency=read_mhz * 1_000_000)
+            await write_clock_domain.reset(2)
+            await read_clock_domain.reset(2)
+
+            read_monitor: FifoDataMonitor = FifoDataMonitor(
+                clock=dut.read_clk, enable=dut.read_enable, data=dut.read_data
+            )
+            write_monitor: FifoDataMonitor = FifoDataMonitor(
+                clock=dut.write_clk, enable=dut.write_enable, data=dut.write_data
+            )
+            read_monitor.start()
+            write_monitor.start()
+
+            write_times_ns: list[float] = []
+            read_times_ns: list[float] = []
+            recorders: list[Task] = [
+                cocotb.start_soon(timestamps(write_monitor.transactions, write_times_ns)),
+                cocotb.start_soon(timestamps(read_monitor.transactions, read_times_ns)),
+            ]
+
+            ##################################################
+            # Latency of a single word through an empty FIFO, which is set by the pointer
+            # synchronisers.
+            reader = cocotb.start_soon(read_driver.read_burst(1))
+            await write_driver.write_burst([rng.getrandbits(8)])
+            await reader
+
+            ##################################################
+            # Saturated traffic, with both sides transferring whenever the FIFO lets them.
+            words: list[int] = [rng.getrandbits(8) for _ in range(WORDS)]
+
+            full_samples: list[int] = []
+            empty_samples: list[int] = []
+            recorders += [
+                cocotb.start_soon(samples(dut.write_clk, dut.full, full_samples)),
+                cocotb.start_soon(samples(dut.read_clk, dut.empty, empty_samples)),
+            ]
+
+            start_ns: float = get_sim_time("ns")
+            writer = cocotb.start_soon(write_driver.write_burst(words))
+            read_rate: float = await read_driver.read_burst(WORDS)
+            write_rate: float = await writer
+            await RisingEdge(dut.read_clk)
+            elapsed_ns: float = get_sim_time("ns") - start_ns
+
+            for task in recorders:
+                task.kill()
+            read_monitor.stop()
+            write_monitor.stop()
+
+            write_clock_domain.stop()
+            read_clock_domain.stop()
+
+            ##################################################
+            # The monitors see each transfer on the edge that sets it up. It completes on the next edge
+            # of its own clock, so the difference in periods is added back.
+            offset_ns: float = 1_000 / read_mhz - 1_000 / write_mhz
+            latencies: np.ndarray = (
+                np.array(read_times_ns[1:]) - np.array(write_times_ns[1:]) + offset_ns
+            )
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+
+            rows.append(
+                {
+                    "depth": depth,
+                    "write_mhz": write_mhz,
+                    "read_mhz": read_mhz,
+                    "words": WORDS,
+                    "words_per_second": WORDS / (elapsed_ns / 1_000_000_000),
+                    "write_words_per_cycle": write_rate,
+                    "read_words_per_cycle": read_rate,
+                    # Fraction of each side's clock cycles the FIFO was full or empty for.
+                    "full_fraction": np.mean(full_samples),
+                    "empty_fraction": np.mean(empty_samples),
+                    "idle_latency_ns": read_times_ns[0] - write_times_ns[0] + offset_ns,
+                    "latency_p50_ns": p50,
+                    "latency_p90_ns": p90,
+                    "latency_p99_ns": p99,
+                    "latency_max_ns": latencies.max(),
+                }
+            )
+
+            dut._log.info(
+                f"{write_mhz}MHz -> {read_mhz}MHz: "
+                f"{rows[-1]['words_per_second'] / 1_000_000:.1f}M words/s, "
+                f"latency p50 {p50:.0f}ns p99 {p99:.0f}ns"
+            )
+
+    with open(RESULTS_FILE, "w", newline="") as file:
+        results: csv.DictWriter = csv.DictWriter(file, fieldnames=FIELDS)
+        results.writeheader()
+        results.writerows(rows)
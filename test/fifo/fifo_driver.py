@@ -1,17 +1,23 @@
 from logging import Logger
-from typing import Final, Optional
+from typing import Final, Optional, Sequence
 
 import cocotb
 from cocotb.handle import SimHandleBase
-from cocotb.triggers import RisingEdge
+from cocotb.triggers import ReadWrite, RisingEdge
 
 
 class FifoFull(Exception):
-    pass
+    def __init__(self, words: int = 0) -> None:
+        super().__init__(f"FIFO full after {words} words")
+        # Words written before the FIFO filled up.
+        self.words: Final[int] = words
 
 
 class FifoEmpty(Exception):
-    pass
+    def __init__(self, words: int = 0) -> None:
+        super().__init__(f"FIFO empty after {words} words")
+        # Words read before the FIFO ran dry.
+        self.words: Final[int] = words
 
 
 class FifoReadDriver:
@@ -34,7 +40,9 @@ class FifoReadDriver:
         if self._log is not None:
             self._log.info("Read word")
 
+        # Empty is sampled once the edge has settled, as in read_burst.
         await RisingEdge(self._clock)
+        await ReadWrite()
 
         if self._empty.value == 1:
             raise FifoEmpty
@@ -42,8 +50,49 @@ class FifoReadDriver:
         self._enable.value = 1
 
         await RisingEdge(self._clock)
+        await ReadWrite()
         self._enable.value = 0
 
+    async def read_burst(self, count: int, max_stall_cycles: Optional[int] = None) -> float:
+        # Keeps enable asserted for back to back reads, dropping it for any cycle the FIFO is
+        # empty. Returns the words read per clock cycle.
+        if self._log is not None:
+            self._log.info(f"Read burst: {count} words")
+
+        words: int = 0
+        cycles: int = 0
+        stall_cycles: int = 0
+
+        # Empty is sampled once the edge has settled. When the other domain's clock rises at the
+        # same time it can still be stale in the edge's own callback.
+        clock_edge: Final = RisingEdge(self._clock)
+        settled: Final = ReadWrite()
+
+        await clock_edge
+        await settled
+        while words < count:
+            # Empty only changes on a clock edge, so its value now decides whether the read is
+            # accepted on the next edge.
+            if self._empty.value == 1:
+                self._enable.value = 0
+
+                stall_cycles += 1
+                if max_stall_cycles is not None and stall_cycles > max_stall_cycles:
+                    raise FifoEmpty(words)
+
+            else:
+                self._enable.value = 1
+                words += 1
+                stall_cycles = 0
+
+            await clock_edge
+            await settled
+            cycles += 1
+
+        self._enable.value = 0
+
+        return words / cycles if cycles else 0
+
 
 class FifoWriteDriver:
     def __init__(
@@ -68,7 +117,9 @@ class FifoWriteDriver:
         if self._log is not None:
             self._log.info(f"Write word: {word}")
 
+        # Full is sampled once the edge has settled, as in write_burst.
         await RisingEdge(self._clock)
+        await ReadWrite()
 
         if self._full.value == 1:
             raise FifoFull
@@ -77,5 +128,50 @@ class FifoWriteDriver:
         self._data.value = word
 
         await RisingEdge(self._clock)
+        await ReadWrite()
         self._enable.value = 0
         self._data.value = 0
+
+    async def write_burst(
+        self, words: Sequence[int], max_stall_cycles: Optional[int] = None
+    ) -> float:
+        # Keeps enable asserted for back to back writes, dropping it for any cycle the FIFO is
+        # full. Returns the words written per clock cycle.
+        if self._log is not None:
+            self._log.info(f"Write burst: {len(words)} words")
+
+        index: int = 0
+        cycles: int = 0
+        stall_cycles: int = 0
+
+        # Full is sampled once the edge has settled. When the other domain's clock rises at the
+        # same time it can still be stale in the edge's own callback.
+        clock_edge: Final = RisingEdge(self._clock)
+        settled: Final = ReadWrite()
+
+        await clock_edge
+        await settled
+        while index < len(words):
+            # Full only changes on a clock edge, so its value now decides whether the write is
+            # accepted on the next edge.
+            if self._full.value == 1:
+                self._enable.value = 0
+
+                stall_cycles += 1
+                if max_stall_cycles is not None and stall_cycles > max_stall_cycles:
+                    raise FifoFull(index)
+
+            else:
+                self._enable.value = 1
+                self._data.value = words[index]
+                index += 1
+                stall_cycles = 0
+
+            await clock_edge
+            await settled
+            cycles += 1
+
+        self._enable.value = 0
+        self._data.value = 0
+
+        return len(words) / cycles if cycles else 0
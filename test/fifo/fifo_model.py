@@ -1,27 +1,109 @@
-from typing import Final
+from typing import Callable, Final, Optional, Sequence
+
+import numpy as np
+from numpy import int64
+from numpy.typing import NDArray
+
+from cocotb.utils import get_sim_time
+
+
+def _sim_time_ns() -> float:
+    return get_sim_time("ns")
+
 
 class FifoModel:
-    def __init__(self, depth: int) -> None:
-        self._data: list[int] = []
+    def __init__(self, depth: int, time_ns: Callable[[], float] = _sim_time_ns) -> None:
         self._depth: Final[int] = depth
+        self._time_ns: Final[Callable[[], float]] = time_ns
+
+        # fifo_async keeps one slot free to tell full from empty, so holds at most DEPTH - 1 words.
+        self._capacity: Final[int] = depth - 1
+        self._data: Final[NDArray[int64]] = np.zeros(max(1, self._capacity), dtype=int64)
+        self._read_index: int = 0
+        self._count: int = 0
+
+        self._high_water_mark: int = 0
+        self._full_time_ns: float = 0
+        self._full_since_ns: Optional[float] = None
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def high_water_mark(self) -> int:
+        return self._high_water_mark
+
+    @property
+    def full_time_ns(self) -> float:
+        if self._full_since_ns is None:
+            return self._full_time_ns
+
+        return self._full_time_ns + self._time_ns() - self._full_since_ns
 
     def write(self, word: int) -> None:
         if self.is_full():
             return
 
-        self._data.append(word)
+        self._data[(self._read_index + self._count) % len(self._data)] = word
+        self._set_count(self._count + 1)
 
     def read(self) -> int:
         if self.is_empty():
             return 0
 
-        return self._data.pop(0)
+        word: Final = int(self._data[self._read_index])
+        self._read_index = (self._read_index + 1) % len(self._data)
+        self._set_count(self._count - 1)
+
+        return word
+
+    def write_many(self, words: Sequence[int] | NDArray) -> int:
+        # Words that don't fit are dropped, as the FIFO ignores writes while full.
+        words = np.asarray(words, dtype=int64)[: self._capacity - self._count]
+
+        start: Final = (self._read_index + self._count) % len(self._data)
+        first: Final = min(len(words), len(self._data) - start)
+        self._data[start : start + first] = words[:first]
+        self._data[: len(words) - first] = words[first:]
+
+        self._set_count(self._count + len(words))
+        return len(words)
+
+    def read_many(self, count: int) -> NDArray[int64]:
+        # Only as many words as the FIFO holds are read.
+        count = min(count, self._count)
+
+        first: Final = min(count, len(self._data) - self._read_index)
+        words: Final = np.concatenate(
+            (
+                self._data[self._read_index : self._read_index + first],
+                self._data[: count - first],
+            )
+        )
+
+        self._read_index = (self._read_index + count) % len(self._data)
+        self._set_count(self._count - count)
+
+        return words
 
     def is_empty(self) -> bool:
-        return len(self._data) == 0
+        return self._count == 0
 
     def is_full(self) -> bool:
-        return len(self._data) >= (self._depth - 1)
+        return self._count >= self._capacity
 
     def count(self) -> int:
-        return len(self._data)
\ No newline at end of file
+        return self._count
+
+    def _set_count(self, count: int) -> None:
+        was_full: Final = self.is_full()
+        self._count = count
+        self._high_water_mark = max(self._high_water_mark, count)
+
+        if self.is_full() and not was_full:
+            self._full_since_ns = self._time_ns()
+
+        elif was_full and not self.is_full() and self._full_since_ns is not None:
+            self._full_time_ns += self._time_ns() - self._full_since_ns
+            self._full_since_ns = None
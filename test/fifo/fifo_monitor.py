@@ -7,6 +7,8 @@ from cocotb.handle import SimHandleBase
 from cocotb.triggers import RisingEdge, ReadOnly
 from cocotb.task import Task
 
+from ..signal_monitor import RisingEdgeTracker
+
 
 class FifoDataMonitor:
     def __init__(
@@ -23,6 +25,7 @@ class FifoDataMonitor:
         self.transactions: Queue = Queue()
 
         self._coroutine: Optional[Task] = None
+        self._edges: Final = RisingEdgeTracker(clock)
 
         self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
 
@@ -31,6 +34,7 @@ class FifoDataMonitor:
             self._log.info("Start")
 
         if self._coroutine is None:
+            self._edges.start()
             self._coroutine = cocotb.start_soon(self._monitor())
 
     def stop(self) -> None:
@@ -39,14 +43,27 @@ class FifoDataMonitor:
 
         if self._coroutine is not None:
             self._coroutine.kill()
+            self._edges.stop()
 
     async def _monitor(self) -> None:
+        clock_edge: Final = RisingEdge(self._clock)
+        enable_edge: Final = RisingEdge(self._enable)
+        read_only: Final = ReadOnly()
+
         while True:
-            await RisingEdge(self._clock)
-            await ReadOnly()
+            await clock_edge
+            await read_only
+
+            # Nothing is transferred while enable is low so wait for it to be asserted rather than
+            # waking on every clock. Enable asserted on a rising edge is sampled on that edge, like
+            # it would have been when polling, and enable asserted at any other time on the next.
+            while self._enable.value != 1:
+                await enable_edge
+                await read_only
 
-            if self._enable.value != 1:
-                continue
+                if not self._edges.at_edge():
+                    await clock_edge
+                    await read_only
 
             transaction: Final[int] = self._data.value.integer
             self.transactions.put_nowait(self._data.value)
@@ -0,0 +1,94 @@
+from logging import Logger
+from typing import Final, Optional
+
+import cocotb
+from cocotb.queue import Queue
+from cocotb.task import Task
+
+import numpy as np
+from numpy import int64
+from numpy.typing import NDArray
+
+from .fifo_model import FifoModel
+from .fifo_monitor import FifoDataMonitor
+
+
+class FifoScoreboard:
+    def __init__(
+        self,
+        write_monitor: FifoDataMonitor,
+        read_monitor: FifoDataMonitor,
+        model: FifoModel,
+        name: Optional[str] = None,
+    ) -> None:
+        self._write_monitor: Final[FifoDataMonitor] = write_monitor
+        self._read_monitor: Final[FifoDataMonitor] = read_monitor
+        self._model: Final[FifoModel] = model
+
+        self._matched: int = 0
+
+        self._coroutines: Final[list[Task]] = []
+
+        self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
+
+    @property
+    def matched(self) -> int:
+        return self._matched
+
+    @property
+    def pending(self) -> int:
+        return self._model.count()
+
+    def start(self) -> None:
+        if self._log is not None:
+            self._log.info("Start")
+
+        if not self._coroutines:
+            # Writes are added to the model as they happen so that its occupancy follows the DUT.
+            self._coroutines.append(cocotb.start_soon(self._collect()))
+            self._coroutines.append(cocotb.start_soon(self._check()))
+
+    def stop(self) -> None:
+        if self._log is not None:
+            self._log.info("Stop")
+
+        for coroutine in self._coroutines:
+            coroutine.kill()
+        self._coroutines.clear()
+
+    async def _collect(self) -> None:
+        while True:
+            words: list[int] = await _take_all(self._write_monitor.transactions)
+
+            space: int = self._model.capacity - self._model.count()
+            assert len(words) <= space, f"Word written to full FIFO: {words[space]}"
+            self._model.write_many(words)
+
+    async def _check(self) -> None:
+        while True:
+            actual: list[int] = await _take_all(self._read_monitor.transactions)
+
+            held: int = self._model.count()
+            assert len(actual) <= held, f"Word read from empty FIFO: {actual[held]}"
+
+            expected: NDArray[int64] = self._model.read_many(len(actual))
+            mismatches: NDArray[int64] = np.flatnonzero(np.asarray(actual) != expected)
+            if len(mismatches) > 0:
+                wrong: int = int(mismatches[0])
+                assert False, (
+                    f"Word {self._matched + wrong} read from DUT doesn't match word written\n"
+                    f"DUT: {actual[wrong]}\n"
+                    f"Expected: {expected[wrong]}"
+                )
+
+            self._matched += len(actual)
+
+
+async def _take_all(transactions: Queue) -> list[int]:
+    # Waits for a transaction and takes any others already queued with it, so that the model is
+    # updated in bulk.
+    words: Final = [(await transactions.get()).integer]
+    while not transactions.empty():
+        words.append(transactions.get_nowait().integer)
+
+    return words
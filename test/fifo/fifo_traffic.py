@@ -0,0 +1,58 @@
+import random
+from dataclasses import dataclass
+from typing import Final, Iterator
+
+
+@dataclass(frozen=True)
+class TrafficProfile:
+    # Words written back to back in each burst.
+    burst_length: tuple[int, int] = (1, 16)
+    # Write clock cycles left idle between bursts.
+    burst_gap: tuple[int, int] = (0, 32)
+    # Chance of the reader trying to read on a read clock cycle. A new duty cycle is picked every
+    # duty_cycles cycles so that the FIFO alternately fills up and drains.
+    read_duty: tuple[float, float] = (0.05, 1.0)
+    duty_cycles: int = 256
+    # Clock periods in ns.
+    write_period_ns: tuple[int, int] = (10, 100)
+    read_period_ns: tuple[int, int] = (10, 100)
+
+
+class FifoTrafficGenerator:
+    def __init__(self, seed: int, profile: TrafficProfile = TrafficProfile()) -> None:
+        self._profile: Final[TrafficProfile] = profile
+
+        # Each stream gets its own generator so that the words written don't depend on how the
+        # reader's choices interleave with the writer's.
+        seeds: Final = random.Random(seed)
+        self._clock_random: Final = random.Random(seeds.getrandbits(64))
+        self._write_random: Final = random.Random(seeds.getrandbits(64))
+        self._read_random: Final = random.Random(seeds.getrandbits(64))
+
+        # Periods are kept even so that the clocks have whole ns half periods.
+        self.write_period_ns: Final[int] = 2 * (
+            self._clock_random.randint(*profile.write_period_ns) // 2
+        )
+        self.read_period_ns: Final[int] = 2 * (
+            self._clock_random.randint(*profile.read_period_ns) // 2
+        )
+        self.phase_offset_ns: Final[int] = self._clock_random.randrange(self.read_period_ns)
+
+    def bursts(self, words: int, data_width: int = 8) -> Iterator[tuple[int, list[int]]]:
+        # Yields the idle cycles to wait before each burst and the words to write in it.
+        while words > 0:
+            length: int = min(words, self._write_random.randint(*self._profile.burst_length))
+            words -= length
+
+            yield (
+                self._write_random.randint(*self._profile.burst_gap),
+                [self._write_random.getrandbits(data_width) for _ in range(length)],
+            )
+
+    def reads(self) -> Iterator[bool]:
+        # Yields whether to read on each read clock cycle.
+        while True:
+            duty: float = self._read_random.uniform(*self._profile.read_duty)
+
+            for _ in range(self._profile.duty_cycles):
+                yield self._read_random.random() < duty
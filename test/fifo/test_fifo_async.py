@@ -1,16 +1,29 @@
+import os
+import random
+import time
+from itertools import groupby
 from typing import Final
 from pathlib import Path
 
 import cocotb
+from cocotb.triggers import ClockCycles, RisingEdge, Timer
+from cocotb.utils import get_sim_time
 
 from .fifo_driver import FifoReadDriver, FifoWriteDriver, FifoEmpty, FifoFull
 from .fifo_monitor import FifoDataMonitor
 from .fifo_model import FifoModel
+from .fifo_scoreboard import FifoScoreboard
+from .fifo_traffic import FifoTrafficGenerator
 
 from .. import config
 from ..clock_domain import ClockDomainDriver
 from ..signal_monitor import ExclusiveSignalMonitor
 
+# The soak test is kept short and seeded the same way every time for the regression. Set these
+# for a proper soak.
+SOAK_TRANSACTIONS: Final = int(os.environ.get("FIFO_SOAK_TRANSACTIONS", 2000))
+SOAK_SEED: Final = int(os.environ.get("FIFO_SOAK_SEED", 0))
+
 ##################################################
 
 
@@ -60,7 +73,7 @@ async def run_test(dut):
     )
 
     empty_read_monitor: Final[ExclusiveSignalMonitor] = ExclusiveSignalMonitor(
-        clock=dut.write_clk,
+        clock=dut.read_clk,
         signal1=dut.empty,
         signal2=dut.read_enable,
         name="EmptyReadMonitor",
@@ -68,8 +81,8 @@ async def run_test(dut):
 
     full_write_monitor: Final[ExclusiveSignalMonitor] = ExclusiveSignalMonitor(
         clock=dut.write_clk,
-        signal1=dut.empty,
-        signal2=dut.read_enable,
+        signal1=dut.full,
+        signal2=dut.write_enable,
         name="FullWriteMonitor",
     )
 
@@ -132,3 +145,181 @@ async def run_test(dut):
 
     read_clock_domain.stop()
     write_clock_domain.stop()
+
+
+@cocotb.test()  # type: ignore
+async def run_soak_test(dut):
+    traffic: Final = FifoTrafficGenerator(SOAK_SEED)
+    dut._log.info(
+        f"Soaking with {SOAK_TRANSACTIONS} words, seed {SOAK_SEED}, write clock "
+        f"{traffic.write_period_ns}ns, read clock {traffic.read_period_ns}ns "
+        f"offset by {traffic.phase_offset_ns}ns"
+    )
+
+    read_clock_domain: Final = ClockDomainDriver(dut.read_clk, dut.reset)
+    write_clock_domain: Final = ClockDomainDriver(dut.write_clk, dut.reset)
+
+    read_driver: Final = FifoReadDriver(clock=dut.read_clk, enable=dut.read_enable, empty=dut.empty)
+    write_driver: Final = FifoWriteDriver(
+        clock=dut.write_clk, enable=dut.write_enable, data=dut.write_data, full=dut.full
+    )
+
+    read_monitor: Final = FifoDataMonitor(
+        clock=dut.read_clk, enable=dut.read_enable, data=dut.read_data
+    )
+    write_monitor: Final = FifoDataMonitor(
+        clock=dut.write_clk, enable=dut.write_enable, data=dut.write_data
+    )
+    model: Final = FifoModel(dut.DEPTH.value)
+    scoreboard: Final = FifoScoreboard(write_monitor, read_monitor, model, name="Scoreboard")
+
+    empty_read_monitor: Final = ExclusiveSignalMonitor(
+        clock=dut.read_clk, signal1=dut.empty, signal2=dut.read_enable
+    )
+    full_write_monitor: Final = ExclusiveSignalMonitor(
+        clock=dut.write_clk, signal1=dut.full, signal2=dut.write_enable
+    )
+
+    write_clock_domain.start(frequency=1_000_000_000 / traffic.write_period_ns)
+    await Timer(traffic.phase_offset_ns + 1, "ns")
+    read_clock_domain.start(frequency=1_000_000_000 / traffic.read_period_ns)
+
+    await read_clock_domain.reset(2)
+    await write_clock_domain.reset(2)
+
+    read_monitor.start()
+    write_monitor.start()
+    scoreboard.start()
+    empty_read_monitor.start()
+    full_write_monitor.start()
+
+    ##################################################
+    full_stalls: int = 0
+    empty_stalls: int = 0
+
+    async def write_traffic() -> None:
+        nonlocal full_stalls
+
+        for gap, burst in traffic.bursts(SOAK_TRANSACTIONS):
+            if gap > 0:
+                await ClockCycles(dut.write_clk, gap)
+
+            # Back-pressure: whatever the burst couldn't write goes again in another burst.
+            while burst:
+                try:
+                    await write_driver.write_burst(burst, max_stall_cycles=0)
+                    break
+                except FifoFull as full:
+                    burst = burst[full.words :]
+                    full_stalls += 1
+
+    async def read_traffic() -> None:
+        nonlocal empty_stalls
+
+        words: int = 0
+        for read, run in groupby(traffic.reads()):
+            cycles: int = sum(1 for _ in run)
+            if not read:
+                await ClockCycles(dut.read_clk, cycles)
+                continue
+
+            # Each run of reads goes back to back, giving up a cycle whenever the FIFO is empty.
+            while cycles > 0 and words < SOAK_TRANSACTIONS:
+                count: int = min(cycles, SOAK_TRANSACTIONS - words)
+                try:
+                    await read_driver.read_burst(count, max_stall_cycles=0)
+                    words += count
+                    cycles -= count
+                except FifoEmpty as empty:
+                    words += empty.words
+                    cycles -= empty.words + 1
+                    empty_stalls += 1
+
+            if words == SOAK_TRANSACTIONS:
+                return
+
+    start: Final = time.perf_counter()
+
+    writer: Final = cocotb.start_soon(write_traffic())
+    await read_traffic()
+    await writer
+    await ClockCycles(dut.read_clk, 2)
+
+    wall_seconds: Final = time.perf_counter() - start
+
+    ##################################################
+
+    assert scoreboard.matched == SOAK_TRANSACTIONS, (
+        f"Only {scoreboard.matched}/{SOAK_TRANSACTIONS} words checked"
+    )
+    assert scoreboard.pending == 0, f"{scoreboard.pending} words left in the FIFO"
+
+    dut._log.info(
+        f"{scoreboard.matched} words in {wall_seconds:.1f}s "
+        f"({scoreboard.matched / wall_seconds:.0f} words/s), "
+        f"{full_stalls} writes stalled on full, {empty_stalls} reads stalled on empty"
+    )
+    dut._log.info(
+        f"FIFO filled to {model.high_water_mark}/{model.capacity} words and was full for "
+        f"{model.full_time_ns / get_sim_time('ns'):.0%} of the time"
+    )
+
+    scoreboard.stop()
+    read_monitor.stop()
+    write_monitor.stop()
+    empty_read_monitor.stop()
+    full_write_monitor.stop()
+
+    read_clock_domain.stop()
+    write_clock_domain.stop()
+
+
+@cocotb.test()  # type: ignore
+async def run_throughput_test(dut):
+    read_clock_domain: Final = ClockDomainDriver(dut.read_clk, dut.reset)
+    write_clock_domain: Final = ClockDomainDriver(dut.write_clk, dut.reset)
+
+    read_driver: Final = FifoReadDriver(clock=dut.read_clk, enable=dut.read_enable, empty=dut.empty)
+    write_driver: Final = FifoWriteDriver(
+        clock=dut.write_clk, enable=dut.write_enable, data=dut.write_data, full=dut.full
+    )
+    read_monitor: Final = FifoDataMonitor(
+        clock=dut.read_clk, enable=dut.read_enable, data=dut.read_data
+    )
+
+    read_clock_domain.start(frequency=10_000_000)
+    write_clock_domain.start(frequency=10_000_000)
+    await read_clock_domain.reset(2)
+    await write_clock_domain.reset(2)
+    read_monitor.start()
+
+    capacity: Final = dut.DEPTH.value - 1
+    rng: Final = random.Random(SOAK_SEED)
+    words: Final = [rng.getrandbits(8) for _ in range(capacity + 200)]
+
+    ##################################################
+    # Fill and drain the FIFO a word per cycle.
+    fill_rate: Final = await write_driver.write_burst(words[:capacity])
+    assert fill_rate == 1, f"Filled at {fill_rate:.2f} words/cycle"
+
+    # Let the write pointer cross into the read clock domain.
+    await ClockCycles(dut.read_clk, 4)
+
+    drain_rate: Final = await read_driver.read_burst(capacity)
+    assert drain_rate == 1, f"Drained at {drain_rate:.2f} words/cycle"
+
+    ##################################################
+    # Stream through with both sides running flat out. Only the latency of the pointer
+    # synchronisers should hold either side up.
+    writer: Final = cocotb.start_soon(write_driver.write_burst(words[capacity:]))
+    read_rate: Final = await read_driver.read_burst(len(words) - capacity)
+    write_rate: Final = await writer
+
+    dut._log.info(f"Streamed at {write_rate:.2f} words/cycle in, {read_rate:.2f} out")
+    assert write_rate > 0.95 and read_rate > 0.95, "FIFO didn't sustain a word per cycle"
+
+    read_monitor.stop()
+    assert [read_monitor.transactions.get_nowait().integer for _ in words] == words
+
+    read_clock_domain.stop()
+    write_clock_domain.stop()
@@ -0,0 +1,189 @@
+import random
+from typing import Final
+from pathlib import Path
+
+import cocotb
+from cocotb.triggers import ClockCycles, RisingEdge, Timer
+
+import pytest
+
+from .fifo_driver import FifoReadDriver, FifoWriteDriver, FifoFull, FifoEmpty
+from .fifo_monitor import FifoDataMonitor
+
+from .. import config
+from ..clock_domain import ClockDomainDriver
+
+CAPACITY: Final = 16
+
+##################################################
+
+
+def test_fifo_buffer():
+    config.run_test(
+        toplevel="fifo_buffer",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "fifo_buffer"),
+        test_module="test.fifo.test_fifo_buffer",
+        parameters={"CAPACITY": CAPACITY},
+    )
+
+
+##################################################
+
+
+@cocotb.test()  # type: ignore
+async def run_full_test(dut):
+    # Separate clocks, as full and empty mustn't depend on anything driven from both domains.
+    read_clock_domain: Final = ClockDomainDriver(dut.read_clk, dut.reset)
+    write_clock_domain: Final = ClockDomainDriver(dut.write_clk, dut.reset)
+
+    read_driver: Final = FifoReadDriver(clock=dut.read_clk, enable=dut.read_enable, empty=dut.empty)
+    write_driver: Final = FifoWriteDriver(
+        clock=dut.write_clk, enable=dut.write_enable, data=dut.write_data, full=dut.full
+    )
+    read_monitor: Final = FifoDataMonitor(
+        clock=dut.read_clk, enable=dut.read_enable, data=dut.read_data
+    )
+
+    read_clock_domain.start(frequency=1_000_000)
+    write_clock_domain.start(frequency=2_000_000)
+    await write_clock_domain.reset(2)
+    read_monitor.start()
+
+    capacity: Final = dut.CAPACITY.value
+
+    # The second round starts with both pointers wrapped.
+    for lap in range(2):
+        words: list[int] = [(lap * capacity + i) % 256 for i in range(capacity)]
+
+        for word in words:
+            assert dut.full.value == 0, f"Full with {words.index(word)}/{capacity} words"
+            await write_driver.write(word)
+
+        await ClockCycles(dut.write_clk, 1)
+        assert dut.full.value == 1, f"Buffer not full after {capacity} words"
+
+        with pytest.raises(FifoFull):
+            await write_driver.write(0)
+
+        for word in words:
+            await read_driver.read()
+            assert read_monitor.transactions.get_nowait().integer == word
+
+        await ClockCycles(dut.read_clk, 1)
+        assert dut.empty.value == 1, f"Buffer not empty after reading {capacity} words"
+        assert dut.full.value == 0, "Buffer still full after being emptied"
+
+        with pytest.raises(FifoEmpty):
+            await read_driver.read()
+
+    read_monitor.stop()
+
+    read_clock_domain.stop()
+    write_clock_domain.stop()
+
+
+@cocotb.test()  # type: ignore
+async def run_throughput_test(dut):
+    # Both sides of the buffer run from the same clock in main.
+    read_clock_domain: Final = ClockDomainDriver(dut.read_clk, dut.reset)
+    write_clock_domain: Final = ClockDomainDriver(dut.write_clk, dut.reset)
+
+    read_driver: Final = FifoReadDriver(clock=dut.read_clk, enable=dut.read_enable, empty=dut.empty)
+    write_driver: Final = FifoWriteDriver(
+        clock=dut.write_clk, enable=dut.write_enable, data=dut.write_data, full=dut.full
+    )
+    read_monitor: Final = FifoDataMonitor(
+        clock=dut.read_clk, enable=dut.read_enable, data=dut.read_data
+    )
+
+    read_clock_domain.start(frequency=100_000_000)
+    write_clock_domain.start(frequency=100_000_000)
+    await write_clock_domain.reset(2)
+    read_monitor.start()
+
+    capacity: Final = dut.CAPACITY.value
+    rng: Final = random.Random(0)
+    words: Final = [rng.getrandbits(8) for _ in range(capacity + 200)]
+
+    ##################################################
+    # Fill the buffer to capacity a word per cycle, after which writes have to stall.
+    fill_rate: Final = await write_driver.write_burst(words[:capacity])
+    assert fill_rate == 1, f"Filled at {fill_rate:.2f} words/cycle"
+
+    await ClockCycles(dut.write_clk, 1)
+    assert dut.full.value == 1, f"Buffer not full after {capacity} words"
+
+    with pytest.raises(FifoFull):
+        await write_driver.write_burst([0], max_stall_cycles=4)
+
+    drain_rate: Final = await read_driver.read_burst(capacity)
+    assert drain_rate == 1, f"Drained at {drain_rate:.2f} words/cycle"
+
+    await ClockCycles(dut.read_clk, 1)
+    assert dut.empty.value == 1, f"Buffer not empty after reading {capacity} words"
+
+    with pytest.raises(FifoEmpty):
+        await read_driver.read_burst(1, max_stall_cycles=4)
+
+    ##################################################
+    # Stream through with a read and a write every cycle.
+    writer: Final = cocotb.start_soon(write_driver.write_burst(words[capacity:]))
+    read_rate: Final = await read_driver.read_burst(len(words) - capacity)
+    write_rate: Final = await writer
+
+    dut._log.info(f"Streamed at {write_rate:.2f} words/cycle in, {read_rate:.2f} out")
+    assert write_rate == 1 and read_rate > 0.95, "Buffer didn't sustain a word per cycle"
+
+    read_monitor.stop()
+    assert [read_monitor.transactions.get_nowait().integer for _ in words] == words
+
+    read_clock_domain.stop()
+    write_clock_domain.stop()
+
+
+@cocotb.test()  # type: ignore
+async def run_monitor_sampling_test(dut):
+    # The monitor samples enable at each rising edge, even though it only wakes when enable changes.
+    # It's checked on partway through each clock period, once the monitor has had its turn.
+    write_clock_domain: Final = ClockDomainDriver(dut.write_clk, dut.reset)
+    write_monitor: Final = FifoDataMonitor(
+        clock=dut.write_clk, enable=dut.write_enable, data=dut.write_data
+    )
+
+    dut.write_enable.value = 0
+    dut.read_enable.value = 0
+    write_clock_domain.start(frequency=1_000_000)
+    await write_clock_domain.reset(2)
+    write_monitor.start()
+
+    # Asserted while the clock is still high after an edge, so it's first sampled on the next one.
+    await RisingEdge(dut.write_clk)
+    await Timer(100, "ns")
+    dut.write_data.value = 1
+    dut.write_enable.value = 1
+
+    await Timer(100, "ns")
+    assert write_monitor.transactions.empty(), "Sampled between rising edges"
+
+    await RisingEdge(dut.write_clk)
+    await Timer(100, "ns")
+    assert write_monitor.transactions.qsize() == 1, "Not sampled on the next rising edge"
+    dut.write_enable.value = 0
+
+    # Asserted in reaction to an edge, so it's sampled on that edge.
+    await RisingEdge(dut.write_clk)
+    dut.write_data.value = 2
+    dut.write_enable.value = 1
+
+    await Timer(100, "ns")
+    assert write_monitor.transactions.qsize() == 2, "Not sampled on the edge it was asserted on"
+
+    await RisingEdge(dut.write_clk)
+    dut.write_enable.value = 0
+
+    await ClockCycles(dut.write_clk, 2)
+    assert [write_monitor.transactions.get_nowait().integer for _ in range(2)] == [1, 2]
+    assert write_monitor.transactions.empty(), "Sampled while enable was low"
+
+    write_monitor.stop()
+    write_clock_domain.stop()
@@ -0,0 +1,44 @@
+import random
+from typing import Final
+
+from .fifo_model import FifoModel
+
+DEPTH: Final = 8
+
+##################################################
+
+
+def test_fifo_model_bulk():
+    # Bulk writes and reads must leave the model exactly as the same words one at a time would,
+    # including when they wrap around the ring or run into full and empty.
+    rng: Final = random.Random(0)
+    time_ns: float = 0
+
+    def now() -> float:
+        return time_ns
+
+    bulk: Final = FifoModel(DEPTH, time_ns=now)
+    single: Final = FifoModel(DEPTH, time_ns=now)
+
+    for _ in range(1000):
+        time_ns += rng.randint(1, 100)
+
+        if rng.random() < 0.5:
+            words: list[int] = [rng.getrandbits(8) for _ in range(rng.randint(0, DEPTH + 2))]
+            space: int = bulk.capacity - bulk.count()
+
+            assert bulk.write_many(words) == min(len(words), space)
+            for word in words:
+                single.write(word)
+
+        else:
+            count: int = rng.randint(0, DEPTH + 2)
+            expected: list[int] = [single.read() for _ in range(min(count, single.count()))]
+
+            assert bulk.read_many(count).tolist() == expected
+
+        assert bulk.count() == single.count()
+        assert bulk.high_water_mark == single.high_water_mark
+        assert bulk.full_time_ns == single.full_time_ns
+
+    assert bulk.read_many(DEPTH).tolist() == [single.read() for _ in range(single.count())]
@@ -0,0 +1,162 @@
+import json
+import os
+import resource
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from pathlib import Path
+from typing import Any, Final, Optional
+
+import cocotb
+
+# Set by the user to profile the scheduler in each simulation. It's off by default as it wraps
+# cocotb internals and slows every callback down.
+PROFILE_ENV: Final = "SIMULATION_PROFILE"
+
+# Set by config.run_test. Benchmarks record their throughput in this file, and the profiler is
+# only installed when the module is imported into a simulation with PROFILE_ENV set as well.
+INSTRUMENTATION_FILE_ENV: Final = "INSTRUMENTATION_FILE"
+INSTRUMENTATION_MODULE: Final = __name__
+
+# The cocotb releases whose scheduler internals the profiler wraps.
+PROFILED_COCOTB_VERSIONS: Final = ("1.8", "1.9")
+
+##################################################
+
+
+def sim_time_ns(results_file: Path) -> float:
+    return sum(
+        float(testcase.get("sim_time_ns", 0))
+        for testcase in ET.parse(results_file).getroot().iter("testcase")
+    )
+
+
+def read_report(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def write_report(path: Path, report: dict[str, Any]) -> None:
+    path.write_text(json.dumps(report, indent=4, sort_keys=True))
+
+
+##################################################
+
+
+class SimulationProfiler:
+    def __init__(self, path: Path) -> None:
+        self._path: Final[Path] = path
+        self._start: Final = time.perf_counter()
+
+        # GPI callbacks grouped by the coroutine that was waiting on them and by trigger type.
+        self._callbacks: Final[Counter[str]] = Counter()
+        self._triggers: Final[Counter[str]] = Counter()
+
+        self._clocks: Final[dict[str, float]] = {}
+
+    def install(self) -> None:
+        version: Final = ".".join(cocotb.__version__.split(".")[:2])
+        if version not in PROFILED_COCOTB_VERSIONS:
+            cocotb.log.getChild("SimulationProfiler").warning(
+                f"Profiling isn't supported with cocotb {cocotb.__version__}, only "
+                f"{', '.join(PROFILED_COCOTB_VERSIONS)}"
+            )
+            return
+
+        from cocotb.clock import Clock
+        from cocotb.regression import RegressionManager
+        from cocotb.scheduler import Scheduler
+        from cocotb.triggers import GPITrigger
+        from cocotb.utils import get_sim_steps, get_sim_time
+
+        profiler: Final = self
+
+        react: Final = Scheduler._react
+        start_soon: Final = Scheduler.start_soon
+        clock_start: Final = Clock.start
+        tear_down: Final = RegressionManager._tear_down
+
+        def _react(scheduler: Scheduler, trigger: Any) -> None:
+            if isinstance(trigger, GPITrigger):
+                profiler._triggers[type(trigger).__name__] += 1
+                for task in scheduler._trigger2coros.get(trigger, ()):
+                    profiler._callbacks[_owner(task)] += 1
+
+            react(scheduler, trigger)
+
+        def _start_soon(scheduler: Scheduler, coro: Any) -> Any:
+            task: Final = start_soon(scheduler, coro)
+
+            # First and Combine wait in helper tasks, count those against whoever started them.
+            if task._coro.__qualname__ == "_wait_callback" and scheduler._current_task is not None:
+                task._instrumentation_owner = _owner(scheduler._current_task)
+
+            return task
+
+        def _clock_start(clock: Clock, *args: Any, **kwargs: Any) -> Any:
+            profiler._clocks[clock.signal._path] = clock.period / get_sim_steps(1, "ns")
+            return clock_start(clock, *args, **kwargs)
+
+        def _tear_down(manager: RegressionManager) -> None:
+            tear_down(manager)
+            profiler.write(get_sim_time("ns"))
+
+        Scheduler._react = _react
+        Scheduler.start_soon = _start_soon
+        Clock.start = _clock_start
+        RegressionManager._tear_down = _tear_down
+
+    def write(self, sim_time_ns: float) -> None:
+        wall_seconds: Final = time.perf_counter() - self._start
+        rate: Final = sim_time_ns / wall_seconds if wall_seconds else 0
+
+        report: Final = read_report(self._path)
+        report["simulation"] = {
+            "sim_time_ns": sim_time_ns,
+            "wall_seconds": wall_seconds,
+            "sim_ns_per_wall_second": rate,
+            "clock_cycles_per_second": {
+                clock: rate / period_ns for clock, period_ns in self._clocks.items()
+            },
+            "gpi_callbacks": sum(self._triggers.values()),
+            "gpi_callbacks_per_task": dict(self._callbacks.most_common()),
+            "gpi_callbacks_per_trigger": dict(self._triggers.most_common()),
+            # Kilobytes on Linux.
+            "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        }
+        write_report(self._path, report)
+
+
+def _owner(task: Any) -> str:
+    return getattr(task, "_instrumentation_owner", None) or task._coro.__qualname__
+
+
+##################################################
+
+_INSTRUMENTATION_FILE: Final[Optional[str]] = os.environ.get(INSTRUMENTATION_FILE_ENV)
+
+PROFILER: Final[Optional[SimulationProfiler]] = (
+    SimulationProfiler(Path(_INSTRUMENTATION_FILE))
+    if _INSTRUMENTATION_FILE and os.environ.get(PROFILE_ENV)
+    else None
+)
+if PROFILER is not None:
+    PROFILER.install()
+
+
+def record_throughput(name: str, units: int, unit: str, wall_seconds: float) -> None:
+    # Written straight to the report so that benchmarks don't need the profiler.
+    if not _INSTRUMENTATION_FILE:
+        return
+
+    path: Final = Path(_INSTRUMENTATION_FILE)
+    report: Final = read_report(path)
+    report.setdefault("benchmarks", {})[name] = {
+        "units": units,
+        "unit": unit,
+        "wall_seconds": wall_seconds,
+        "throughput": units / wall_seconds if wall_seconds else 0,
+    }
+    write_report(path, report)
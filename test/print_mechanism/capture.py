@@ -0,0 +1,465 @@
+import argparse
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Final, Iterator, Optional, Sequence
+
+import numpy as np
+from numpy import float64, int64, uint32, uint8
+from numpy.typing import NDArray
+
+# Column order of the logic analyser exports. Each pin is packed into the state byte at the bit
+# given by its position in this list.
+PINS: Final[list[str]] = ["clock", "data", "latch", "dst", "motor_a", "motor_b"]
+
+CSV_DTYPE: Final = np.dtype([("timestamp", float64)] + [(pin, uint8) for pin in PINS])
+
+CHUNK_ROWS: Final = 1_000_000
+CHUNK_BYTES: Final = 64 * 1024 * 1024
+
+# Each CSV row ends with every pin as a single digit after a comma. When scanning, the fields are
+# read as a 64 bit word holding the first 4 pins and a 32 bit word holding the last 2, which must
+# match ",0" for each pin in all but the low bit of each digit.
+PIN_FIELD_BYTES: Final = 2 * len(PINS)
+PIN_WORDS: Final = np.dtype([("low", "<u8"), ("high", "<u4")])
+PIN_FIELDS: Final = (np.uint64(0x302C302C302C302C), np.uint32(0x302C302C))
+PIN_DIGITS: Final = (np.uint64(0x0100010001000100), np.uint32(0x01000100))
+
+POWERS_OF_TEN: Final = 10 ** np.arange(19, dtype=int64)
+
+# Rows longer than this are never expected, so only this much is searched for the first row's end.
+MAX_ROW_BYTES: Final = 4096
+
+# Binary captures are a short header followed by a flat list of pin change events.
+BINARY_SUFFIX: Final = ".pmcap"
+BINARY_MAGIC: Final = b"PMCAP001"
+BINARY_DTYPE: Final = np.dtype([("delta_ns", "<u4"), ("delta_rows", "<u4"), ("state", "u1")])
+BINARY_MAX_DELTA: Final = np.iinfo(uint32).max
+
+
+@dataclass(frozen=True)
+class CaptureEvents:
+    # Simulation time and capture rows elapsed since the previous event.
+    delta_ns: NDArray[np.integer]
+    delta_rows: NDArray[np.integer]
+    # Pin states packed one bit per pin, in the order of PINS.
+    state: NDArray[uint8]
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+
+def pack_pins(rows: NDArray) -> NDArray[uint8]:
+    state: NDArray[uint8] = np.zeros(len(rows), dtype=uint8)
+    for bit, pin in enumerate(PINS):
+        state |= (rows[pin].astype(uint8) & 1) << bit
+
+    return state
+
+
+def read_csv(path: Path, chunk_rows: int = CHUNK_ROWS) -> Iterator[NDArray]:
+    with open(path) as file:
+        next(file)  # Header
+
+        while True:
+            lines: list[str] = list(islice(file, chunk_rows))
+            if not lines:
+                return
+
+            yield np.loadtxt(lines, delimiter=",", dtype=CSV_DTYPE, ndmin=1)
+
+
+class CaptureCompressor:
+    def __init__(self, max_gap_ns: Optional[int] = None) -> None:
+        self._max_gap_ns: Final[Optional[int]] = max_gap_ns
+
+        self._first_timestamp: Optional[float] = None
+        self._last_state: int = -1
+
+        # Time and row index of the last emitted event, relative to the start of the capture.
+        self._event_time_ns: int = 0
+        self._row: int = 0
+        self._event_row: int = 0
+
+    def compress(self, rows: NDArray) -> CaptureEvents:
+        timestamps: Final = rows["timestamp"]
+        state: Final = pack_pins(rows)
+
+        # Rows are timed from the start of the capture, to the nearest ns, so that rounding doesn't
+        # build up over the capture.
+        if self._first_timestamp is None:
+            self._first_timestamp = float(timestamps[0])
+
+        time_ns: Final = np.rint((timestamps - self._first_timestamp) * 1_000_000_000).astype(int64)
+
+        changed: Final = np.empty(len(state), dtype=bool)
+        changed[0] = state[0] != self._last_state
+        np.not_equal(state[1:], state[:-1], out=changed[1:])
+        index: Final = np.flatnonzero(changed)
+
+        event_time_ns: Final = time_ns[index]
+        event_row: Final = self._row + index
+
+        # Gaps between events are optionally clamped so that long idle periods in the capture don't
+        # have to be simulated.
+        delta_ns: Final = np.diff(event_time_ns, prepend=self._event_time_ns)
+        if self._max_gap_ns is not None:
+            np.minimum(delta_ns, self._max_gap_ns, out=delta_ns)
+
+        events: Final = CaptureEvents(
+            delta_ns=delta_ns,
+            delta_rows=np.diff(event_row, prepend=self._event_row),
+            state=state[index],
+        )
+
+        self._last_state = int(state[-1])
+        self._row += len(rows)
+        if len(index) > 0:
+            self._event_time_ns = int(event_time_ns[-1])
+            self._event_row = int(event_row[-1])
+
+        return events
+
+
+def read_csv_capture(
+    path: Path, max_gap_ns: Optional[int] = None, chunk_rows: int = CHUNK_ROWS
+) -> Iterator[CaptureEvents]:
+    compressor: Final = CaptureCompressor(max_gap_ns)
+
+    for rows in read_csv(path, chunk_rows):
+        events: CaptureEvents = compressor.compress(rows)
+        if len(events) > 0:
+            yield events
+
+
+def read_csv_blocks(path: Path, chunk_bytes: int = CHUNK_BYTES) -> Iterator[NDArray[uint8]]:
+    # Raw bytes of whole rows at a time.
+    with open(path, "rb") as file:
+        file.readline()  # Header
+        remainder: bytes = b""
+
+        while data := file.read(chunk_bytes):
+            block: bytes = remainder + data
+            end: int = block.rfind(b"\n") + 1
+            remainder = block[end:]
+
+            if end > 0:
+                yield np.frombuffer(block, dtype=uint8, count=end)
+
+        if remainder.strip():
+            yield np.frombuffer(remainder + b"\n", dtype=uint8)
+
+
+def parse_timestamps_ps(
+    block: NDArray[uint8], starts: NDArray[int64], ends: NDArray[int64]
+) -> NDArray[int64]:
+    # Decimal seconds to whole picoseconds. Fields are read a character at a time, but across
+    # every field at once. Digits past the picoseconds are dropped.
+    lengths: Final = ends - starts
+    width: Final = int(lengths.max(initial=0))
+
+    # Each field is read as a window as wide as the widest, running on into the rest of its row.
+    source: Final = (
+        block
+        if len(starts) == 0 or int(starts[-1]) + width <= len(block)
+        else np.concatenate((block, np.zeros(width, dtype=uint8)))
+    )
+    windows: Final = np.lib.stride_tricks.sliding_window_view(source, width)[starts]
+
+    negative: Final = windows[:, 0] == ord("-") if width > 0 else np.zeros(0, dtype=bool)
+    digits: NDArray[int64] = np.zeros(len(starts), dtype=int64)
+    decimals: NDArray[int64] = np.zeros(len(starts), dtype=int64)
+    fraction: NDArray[np.bool_] = np.zeros(len(starts), dtype=bool)
+
+    for column in range(width):
+        chars: NDArray[uint8] = windows[:, column]
+        inside: NDArray[np.bool_] = column < lengths
+        digit: NDArray[uint8] = chars - ord("0")
+        is_digit: NDArray[np.bool_] = inside & (digit <= 9)
+        is_point: NDArray[np.bool_] = inside & (chars == ord("."))
+
+        invalid: NDArray[np.bool_] = inside & ~is_digit & ~is_point
+        if column == 0:
+            invalid &= ~negative
+        if np.any(invalid):
+            raise ValueError("Timestamps must be plain decimals")
+
+        digits = np.where(is_digit, digits * 10 + digit, digits)
+        decimals += is_digit & fraction
+        fraction |= is_point
+
+    value: Final = (
+        digits
+        * POWERS_OF_TEN[np.clip(12 - decimals, 0, None)]
+        // POWERS_OF_TEN[np.clip(decimals - 12, 0, None)]
+    )
+    return np.where(negative, -value, value)
+
+
+def split_rows(block: NDArray[uint8]) -> tuple[NDArray[int64], NDArray[int64], NDArray]:
+    # End and length of each row, not counting the line ending, and its pin fields read as
+    # PIN_WORDS. Blank lines are skipped.
+    newline: Final = bytes(block[:MAX_ROW_BYTES]).find(b"\n")
+
+    # Every row ends the same way, so the first says whether they end with a carriage return.
+    crlf: Final = int(newline > 0 and block[newline - 1] == ord("\r"))
+
+    # Exports usually have rows of a fixed width, which can be read in place without searching
+    # for the end of each one.
+    width: Final = newline + 1
+    if (
+        width > PIN_FIELD_BYTES + 1 + crlf
+        and len(block) % width == 0
+        and np.all(block[newline::width] == ord("\n"))
+    ):
+        count: int = len(block) // width
+        fields: NDArray = np.ndarray(
+            (count,),
+            dtype=PIN_WORDS,
+            buffer=block,
+            offset=newline - crlf - PIN_FIELD_BYTES,
+            strides=(width,),
+        )
+        ends: NDArray[int64] = np.arange(newline - crlf, len(block), width)
+        return ends, np.full(count, newline - crlf), fields
+
+    newlines: NDArray[int64] = np.flatnonzero(block == ord("\n"))
+    lengths: NDArray[int64] = np.diff(newlines, prepend=-1) - 1 - crlf
+
+    if np.any(lengths <= 0):
+        newlines = newlines[lengths > 0]
+        lengths = lengths[lengths > 0]
+
+    if np.any(lengths <= PIN_FIELD_BYTES):
+        raise ValueError("Rows must have a timestamp and every pin")
+
+    ends = newlines - crlf
+    every_byte: Final = np.ndarray(
+        (len(block) - PIN_FIELD_BYTES + 1,),
+        dtype=f"V{PIN_FIELD_BYTES}",
+        buffer=block,
+        strides=(1,),
+    )
+    return ends, lengths, every_byte[ends - PIN_FIELD_BYTES].view(PIN_WORDS)
+
+
+def pin_states(fields: NDArray) -> NDArray[uint8]:
+    # Reading each row's pin fields as two words, rather than a byte at a time, keeps this to a
+    # few passes over flat arrays. Once the fields for pins at 0 are cancelled out, only the low
+    # bit of each digit may be left.
+    low: Final = fields["low"] ^ PIN_FIELDS[0]
+    high: Final = fields["high"] ^ PIN_FIELDS[1]
+
+    if np.any(low & ~PIN_DIGITS[0]) or np.any(high & ~PIN_DIGITS[1]):
+        raise ValueError("Rows must end with every pin as a single 0 or 1")
+
+    # The digit bits are 16 bits apart. Multiplying by a sum of powers of 2 places a copy of each
+    # next to the others, and none of the copies overlap.
+    low >>= 8
+    low *= 0x0000200040008001
+    low >>= 45
+    high >>= 8
+    high *= 0x00008001
+    high >>= 15
+
+    return low.astype(uint8) | high.astype(uint8) << 4
+
+
+class CaptureScanner:
+    def __init__(self, max_gap_ns: Optional[int] = None) -> None:
+        # Compresses raw CSV rows straight to events, reading only the pin digits at the end of
+        # each row and the timestamps of the rows where they change. Far faster than parsing every
+        # field of every row, so captures of any size stream through at close to disk speed.
+        self._max_gap_ns: Final[Optional[int]] = max_gap_ns
+
+        self._last_state: int = -1
+        self._row: int = 0
+        self._event_row: int = 0
+
+        # Events are timed from the first row, to the nearest ns.
+        self._start_ps: Optional[int] = None
+        self._event_time_ns: int = 0
+
+    def scan(self, block: NDArray[uint8]) -> CaptureEvents:
+        ends, lengths, fields = split_rows(block)
+        state: Final = pin_states(fields)
+
+        changed: Final = np.empty(len(state), dtype=bool)
+        changed[:1] = state[:1] != self._last_state
+        np.not_equal(state[1:], state[:-1], out=changed[1:])
+        index: Final = np.flatnonzero(changed)
+
+        event_ps: Final = parse_timestamps_ps(
+            block, ends[index] - lengths[index], ends[index] - PIN_FIELD_BYTES
+        )
+        if self._start_ps is None and len(event_ps) > 0:
+            self._start_ps = int(event_ps[0])
+
+        event_time_ns: Final = (event_ps - (self._start_ps or 0) + 500) // 1000
+        event_row: Final = self._row + index
+
+        delta_ns: NDArray[int64] = np.diff(event_time_ns, prepend=self._event_time_ns)
+        if self._max_gap_ns is not None:
+            np.minimum(delta_ns, self._max_gap_ns, out=delta_ns)
+
+        events: Final = CaptureEvents(
+            delta_ns=delta_ns,
+            delta_rows=np.diff(event_row, prepend=self._event_row),
+            state=state[index],
+        )
+
+        self._row += len(state)
+        if len(state) > 0:
+            self._last_state = int(state[-1])
+        if len(index) > 0:
+            self._event_time_ns = int(event_time_ns[-1])
+            self._event_row = int(event_row[-1])
+
+        return events
+
+
+def scan_csv_capture(
+    path: Path, max_gap_ns: Optional[int] = None, chunk_bytes: int = CHUNK_BYTES
+) -> Iterator[CaptureEvents]:
+    scanner: Final = CaptureScanner(max_gap_ns)
+
+    for block in read_csv_blocks(path, chunk_bytes):
+        events: CaptureEvents = scanner.scan(block)
+        if len(events) > 0:
+            yield events
+
+
+def read_binary_capture(
+    path: Path, max_gap_ns: Optional[int] = None, chunk_rows: int = CHUNK_ROWS
+) -> Iterator[CaptureEvents]:
+    with open(path, "rb") as file:
+        if file.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a binary capture")
+
+    if path.stat().st_size == len(BINARY_MAGIC):
+        return
+
+    records: Final = np.memmap(path, dtype=BINARY_DTYPE, mode="r", offset=len(BINARY_MAGIC))
+
+    # Records that repeat the previous state only carry part of a long gap, so their time and rows
+    # are added to the event that follows them. This gives the same events as the CSV capture.
+    last_state: int = -1
+    time_ns: int = 0
+    row: int = 0
+    event_time_ns: int = 0
+    event_row: int = 0
+
+    for start in range(0, len(records), chunk_rows):
+        chunk: NDArray = records[start : start + chunk_rows]
+        state: NDArray[uint8] = chunk["state"]
+
+        changed: NDArray[np.bool_] = np.empty(len(state), dtype=bool)
+        changed[0] = state[0] != last_state
+        np.not_equal(state[1:], state[:-1], out=changed[1:])
+        index: NDArray[int64] = np.flatnonzero(changed)
+
+        times_ns: NDArray[int64] = time_ns + np.cumsum(chunk["delta_ns"], dtype=int64)
+        rows: NDArray[int64] = row + np.cumsum(chunk["delta_rows"], dtype=int64)
+
+        delta_ns: NDArray[int64] = np.diff(times_ns[index], prepend=event_time_ns)
+        if max_gap_ns is not None:
+            np.minimum(delta_ns, max_gap_ns, out=delta_ns)
+
+        events: CaptureEvents = CaptureEvents(
+            delta_ns=delta_ns,
+            delta_rows=np.diff(rows[index], prepend=event_row),
+            state=state[index],
+        )
+
+        last_state = int(state[-1])
+        time_ns = int(times_ns[-1])
+        row = int(rows[-1])
+        if len(index) > 0:
+            event_time_ns = int(times_ns[index[-1]])
+            event_row = int(rows[index[-1]])
+
+            yield events
+
+
+def read_capture(
+    path: Path, max_gap_ns: Optional[int] = None, chunk_rows: int = CHUNK_ROWS
+) -> Iterator[CaptureEvents]:
+    if path.suffix == BINARY_SUFFIX:
+        return read_binary_capture(path, max_gap_ns, chunk_rows)
+
+    return read_csv_capture(path, max_gap_ns, chunk_rows)
+
+
+def find_capture(stem: Path) -> Path:
+    binary: Final = stem.with_suffix(BINARY_SUFFIX)
+    return binary if binary.exists() else stem.with_suffix(".csv")
+
+
+##################################################
+
+
+def to_records(events: CaptureEvents, previous_state: int = 0) -> NDArray:
+    # Gaps that don't fit in the record fields are split across records that hold the previous
+    # state, with the event's own state on the last of them.
+    parts: Final = np.maximum(
+        1,
+        np.maximum(
+            -(-events.delta_ns // BINARY_MAX_DELTA),
+            -(-events.delta_rows // BINARY_MAX_DELTA),
+        ),
+    ).astype(int64)
+
+    records: Final = np.zeros(int(parts.sum()), dtype=BINARY_DTYPE)
+
+    # Index of each record within the event it was split from.
+    first: Final = np.repeat(np.cumsum(parts) - parts, parts)
+    part: Final = np.arange(len(records)) - first
+
+    previous: Final = np.concatenate(([previous_state], events.state[:-1])).astype(uint8)
+    records["state"] = np.where(
+        part == np.repeat(parts, parts) - 1,
+        np.repeat(events.state, parts),
+        np.repeat(previous, parts),
+    )
+
+    for field in ("delta_ns", "delta_rows"):
+        delta: NDArray[int64] = np.repeat(getattr(events, field), parts).astype(int64)
+        count: NDArray[int64] = np.repeat(parts, parts)
+        records[field] = delta // count + (part < delta % count)
+
+    return records
+
+
+def convert_csv(csv_path: Path, binary_path: Path, chunk_bytes: int = CHUNK_BYTES) -> int:
+    events_written: int = 0
+
+    with open(binary_path, "wb") as file:
+        file.write(BINARY_MAGIC)
+
+        state: int = 0
+        for events in scan_csv_capture(csv_path, chunk_bytes=chunk_bytes):
+            records: NDArray = to_records(events, state)
+            records.tofile(file)
+            events_written += len(records)
+            state = int(events.state[-1])
+
+    return events_written
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser: Final = argparse.ArgumentParser(
+        description="Convert a logic analyser CSV export to a binary capture."
+    )
+    parser.add_argument("csv", type=Path)
+    parser.add_argument("output", type=Path, nargs="?")
+    parser.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES)
+    args: Final = parser.parse_args(argv)
+
+    output: Final[Path] = args.output or args.csv.with_suffix(BINARY_SUFFIX)
+    events: Final = convert_csv(args.csv, output, args.chunk_bytes)
+
+    print(f"Wrote {events} events to {output}")
+
+
+if __name__ == "__main__":
+    main()
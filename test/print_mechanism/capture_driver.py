@@ -0,0 +1,75 @@
+from logging import Logger
+from typing import Final, Iterable, Optional, Sequence
+
+import cocotb
+from cocotb.triggers import Timer
+from cocotb.handle import SimHandleBase
+
+from .capture import CaptureEvents
+
+
+class CaptureDriver:
+    def __init__(
+        self,
+        pins: Sequence[SimHandleBase],
+        name: Optional[str] = None,
+    ) -> None:
+        # Handles in the same order as capture.PINS.
+        self._pins: Final[Sequence[SimHandleBase]] = pins
+
+        self._state: Optional[int] = None
+        self._events: int = 0
+        self._rows: int = 0
+
+        self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
+
+        for pin in self._pins:
+            pin.value = 0
+
+    @property
+    def events(self) -> int:
+        return self._events
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    async def replay(self, capture: Iterable[CaptureEvents]) -> None:
+        for events in capture:
+            self._log_progress(events)
+
+            for delta_ns, state in zip(events.delta_ns.tolist(), events.state.tolist()):
+                if delta_ns > 0:
+                    await Timer(delta_ns, "ns")
+
+                self._write(state)
+
+    async def replay_rows(self, capture: Iterable[CaptureEvents], row_time_ns: int) -> None:
+        for events in capture:
+            self._log_progress(events)
+
+            for delta_rows, state in zip(events.delta_rows.tolist(), events.state.tolist()):
+                if delta_rows > 0:
+                    await Timer(delta_rows * row_time_ns, "ns")
+
+                self._write(state)
+
+    def _write(self, state: int) -> None:
+        # Everything is written on the first event as the pins may have been driven elsewhere.
+        changed: int = (1 << len(self._pins)) - 1 if self._state is None else state ^ self._state
+        self._state = state
+
+        bit: int = 0
+        while changed:
+            if changed & 1:
+                self._pins[bit].value = (state >> bit) & 1
+
+            changed >>= 1
+            bit += 1
+
+    def _log_progress(self, events: CaptureEvents) -> None:
+        self._events += len(events)
+        self._rows += int(events.delta_rows.sum())
+
+        if self._log is not None:
+            self._log.info(f"Replaying {len(events)} events, {self._events} events / {self._rows} rows so far")
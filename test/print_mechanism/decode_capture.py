@@ -0,0 +1,107 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Final, Iterable, Iterator, Optional, Sequence
+
+from .capture import (
+    BINARY_SUFFIX,
+    CHUNK_BYTES,
+    CaptureEvents,
+    read_binary_capture,
+    scan_csv_capture,
+)
+from .image_compare import compare_images, load_bitmap, save_bitmap
+from .print_mech_model import PrintMechModel
+
+# main_tb replays a capture a row at a time, holding each row for 4 clocks, starting on a clk edge
+# with mech_clk and mech_latch left high.
+ROW_TIME_NS: Final = 40
+ROW_INITIAL_STATE: Final = 0b101
+
+##################################################
+
+
+def stream_capture(
+    path: Path, max_gap_ns: Optional[int] = None, chunk_bytes: int = CHUNK_BYTES
+) -> Iterator[CaptureEvents]:
+    if path.suffix == BINARY_SUFFIX:
+        return read_binary_capture(path, max_gap_ns)
+
+    return scan_csv_capture(path, max_gap_ns, chunk_bytes)
+
+
+def decode_capture(
+    capture: Iterable[CaptureEvents],
+    head_width: int = 384,
+    clock_period_ns: float = 10,
+    row_time_ns: Optional[int] = ROW_TIME_NS,
+) -> PrintMechModel:
+    # Without a row time, the capture is replayed by its timestamps like test_print_mechanism does.
+    model: Final = PrintMechModel(
+        head_width,
+        clock_period_ns,
+        initial_state=0 if row_time_ns is None else ROW_INITIAL_STATE,
+    )
+
+    for events in capture:
+        model.feed_events(events, row_time_ns)
+
+    model.flush()
+    return model
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser: Final = argparse.ArgumentParser(
+        description="Decode what print_mechanism prints from a capture, without simulating it."
+    )
+    parser.add_argument("capture", type=Path, help="CSV export or binary capture.")
+    parser.add_argument("output", type=Path, nargs="?", help="Image to write, dots in black.")
+    parser.add_argument("--head-width", type=int, default=384)
+    parser.add_argument("--clock-period-ns", type=float, default=10)
+    parser.add_argument(
+        "--row-time-ns",
+        type=int,
+        default=ROW_TIME_NS,
+        help="Time each capture row is held for, as main_tb replays them.",
+    )
+    parser.add_argument(
+        "--real-time", action="store_true", help="Time events by their timestamps instead."
+    )
+    parser.add_argument(
+        "--max-gap-ns", type=int, help="Longest gap between events when timed by timestamps."
+    )
+    parser.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES)
+    parser.add_argument("--golden", type=Path, help="Image to check the decoded image against.")
+    parser.add_argument("--shift-tolerance", type=int, default=1)
+    args: Final = parser.parse_args(argv)
+
+    start: Final = time.perf_counter()
+    model: Final = decode_capture(
+        stream_capture(args.capture, args.max_gap_ns, args.chunk_bytes),
+        args.head_width,
+        args.clock_period_ns,
+        None if args.real_time else args.row_time_ns,
+    )
+    elapsed: Final = time.perf_counter() - start
+
+    size_mb: Final = args.capture.stat().st_size / 1e6
+    print(f"Decoded {len(model.lines)} lines in {elapsed:.2f}s ({size_mb / elapsed:.0f}MB/s)")
+
+    if len(model.lines) > 0:
+        output: Path = args.output or args.capture.with_suffix(".png")
+        save_bitmap(output, model.lines.to_bitmap())
+        print(f"Wrote {output}")
+
+    if args.golden is None:
+        return 0
+
+    comparison: Final = compare_images(
+        model.to_bitmap(), load_bitmap(args.golden), args.shift_tolerance
+    )
+    print(comparison)
+    return 0 if comparison.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, Optional
+
+import numpy as np
+from numpy import int64, uint8
+from numpy.typing import NDArray
+
+import cv2 as cv
+
+# Number of set bits in each possible byte.
+POPCOUNT: Final = np.unpackbits(np.arange(256, dtype=uint8)[:, None], axis=1).sum(axis=1)
+
+
+def load_bitmap(path: Path, threshold: int = 128) -> NDArray[uint8]:
+    image: Final = cv.imread(str(path), cv.IMREAD_GRAYSCALE)
+    if image is None:
+        raise FileNotFoundError(path)
+
+    # Dark pixels are burnt dots.
+    return (image < threshold).astype(uint8)
+
+
+def save_bitmap(path: Path, bitmap: NDArray[uint8]) -> None:
+    cv.imwrite(str(path), np.where(bitmap != 0, 0, 255).astype(uint8))
+
+
+# Steps through the alignment of an image against its golden image.
+MATCH: Final = 0
+SKIP_ROW: Final = 1
+SKIP_GOLDEN_ROW: Final = 2
+
+UNREACHABLE: Final = np.iinfo(int64).max // 4
+
+
+@dataclass(frozen=True)
+class ImageComparison:
+    rows: int
+    golden_rows: int
+    dot_errors: int
+    row_errors: int
+    # Row and column of the first wrong dot. A golden row missing from the image is reported at its
+    # own row in the golden image.
+    first_mismatch: Optional[tuple[int, int]]
+    # Offset into the golden image that each row was aligned at.
+    row_shifts: NDArray[int64]
+
+    @property
+    def passed(self) -> bool:
+        return self.dot_errors == 0 and self.rows == self.golden_rows
+
+    def __str__(self) -> str:
+        if self.passed:
+            return f"{self.rows} rows match"
+
+        return (
+            f"{self.rows}/{self.golden_rows} rows, {self.row_errors} rows with "
+            f"{self.dot_errors} wrong dots, first mismatch at (row, column): {self.first_mismatch}"
+        )
+
+
+def first_dot(packed_row: NDArray[uint8]) -> int:
+    return int(np.argmax(np.unpackbits(packed_row)))
+
+
+def compare_images(
+    image: NDArray, golden: NDArray, shift_tolerance: int = 0
+) -> ImageComparison:
+    if image.shape[1:] != golden.shape[1:]:
+        raise ValueError(f"Image width {image.shape[1:]} doesn't match golden {golden.shape[1:]}")
+
+    rows: Final = len(image)
+    golden_rows: Final = len(golden)
+
+    # Rows are packed 8 dots per byte so each comparison is an XOR and a popcount per byte.
+    packed: Final = np.packbits(image != 0, axis=1)
+    packed_golden: Final = np.packbits(golden != 0, axis=1)
+    dots: Final = POPCOUNT[packed].sum(axis=1, dtype=int64)
+    golden_dots: Final = POPCOUNT[packed_golden].sum(axis=1, dtype=int64)
+
+    # errors[k, i] is the number of wrong dots in row i against golden row i + shifts[k].
+    shifts: Final = np.arange(-shift_tolerance, shift_tolerance + 1)
+    errors: Final = np.full((len(shifts), rows), UNREACHABLE, dtype=int64)
+
+    for k, shift in enumerate(shifts):
+        start: int = max(0, -shift)
+        end: int = min(rows, golden_rows - shift)
+        if start >= end:
+            continue
+
+        difference: NDArray[uint8] = packed[start:end] ^ packed_golden[start + shift : end + shift]
+        errors[k, start:end] = POPCOUNT[difference].sum(axis=1)
+
+    # Rows that match the golden row beside them need no aligning. Only the windows around rows
+    # that don't, and the end of the image if the row counts differ, are aligned. Each window
+    # leaves enough rows either side for the alignment to shift away and come back.
+    wrong_rows: NDArray[int64] = np.flatnonzero(errors[shift_tolerance])
+    if rows < golden_rows:
+        wrong_rows = np.append(wrong_rows, max(rows - 1, 0))
+
+    margin: Final = 2 * shift_tolerance
+    lows: Final = np.maximum(wrong_rows - margin, 0)
+    highs: Final = np.minimum(wrong_rows + margin + 1, rows)
+    # Windows that overlap are merged.
+    first_in_window: Final = np.ones(len(lows), dtype=bool)
+    first_in_window[1:] = lows[1:] > highs[:-1]
+    last_in_window: Final = np.roll(first_in_window, -1)
+
+    dot_errors: int = 0
+    mismatches: list[tuple[int, int]] = []
+    row_shifts: Final = np.zeros(rows, dtype=int64)
+
+    for low, high in zip(lows[first_in_window].tolist(), highs[last_in_window].tolist()):
+        golden_high: int = golden_rows if high == rows else high
+
+        window_errors, window_mismatches, window_shifts = align(
+            packed[low:high],
+            packed_golden[low:golden_high],
+            errors[:, low:high],
+            shift_tolerance,
+            open_end=high == rows,
+        )
+
+        dot_errors += window_errors
+        row_shifts[low:high] = window_shifts
+        mismatches += [(low + row, column) for row, column in window_mismatches]
+
+    return ImageComparison(
+        rows=rows,
+        golden_rows=golden_rows,
+        dot_errors=dot_errors,
+        row_errors=len(mismatches),
+        first_mismatch=min(mismatches, default=None),
+        row_shifts=row_shifts,
+    )
+
+
+def align(
+    packed: NDArray[uint8],
+    packed_golden: NDArray[uint8],
+    errors: NDArray[int64],
+    shift_tolerance: int,
+    open_end: bool,
+) -> tuple[int, list[tuple[int, int]], NDArray[int64]]:
+    rows: Final = len(packed)
+    golden_rows: Final = len(packed_golden)
+    dots: Final = POPCOUNT[packed].sum(axis=1, dtype=int64)
+    golden_dots: Final = POPCOUNT[packed_golden].sum(axis=1, dtype=int64)
+
+    # Rows are aligned in order against golden rows at most shift_tolerance lines either side, to
+    # allow for jitter in the paper feed. Rows may be skipped on either side to change the shift,
+    # at the cost of their dots, so blank lines come and go freely but a printed line that's lost
+    # or repeated is an error.
+    shifts: Final = np.arange(-shift_tolerance, shift_tolerance + 1)
+
+    # cost[i, k] is the fewest wrong dots aligning the first i rows with the first i + shifts[k]
+    # golden rows.
+    cost: Final = np.full((rows + 1, len(shifts)), UNREACHABLE, dtype=int64)
+    steps: Final = np.full((rows + 1, len(shifts)), SKIP_GOLDEN_ROW, dtype=uint8)
+
+    for i in range(rows + 1):
+        if i == 0:
+            cost[0, shift_tolerance] = 0
+        else:
+            matched: NDArray[int64] = cost[i - 1] + errors[:, i - 1]
+            skipped: NDArray[int64] = np.append(cost[i - 1, 1:], UNREACHABLE) + dots[i - 1]
+            cost[i] = np.minimum(matched, skipped)
+            steps[i] = np.where(matched <= skipped, MATCH, SKIP_ROW)
+
+        golden_row: NDArray[int64] = i + shifts
+        cost[i, (golden_row < 0) | (golden_row > golden_rows)] = UNREACHABLE
+
+        for k in range(1, len(shifts)):
+            if not 0 < golden_row[k] <= golden_rows:
+                continue
+
+            skipped_golden: int = cost[i, k - 1] + golden_dots[golden_row[k] - 1]
+            if skipped_golden < cost[i, k]:
+                cost[i, k] = skipped_golden
+                steps[i, k] = SKIP_GOLDEN_ROW
+
+    # A window inside the image has to end back in line with the golden image. At the end of the
+    # image, whatever's left of either image after the alignment ends is wrong.
+    total: Final = np.full_like(cost, UNREACHABLE)
+    if open_end:
+        remaining: Final = np.append(np.cumsum(dots[::-1])[::-1], 0)
+        remaining_golden: Final = np.append(np.cumsum(golden_dots[::-1])[::-1], 0)
+        golden_end: Final = np.arange(rows + 1)[:, None] + shifts
+        valid: Final = (golden_end >= 0) & (golden_end <= golden_rows)
+        total[valid] = (cost + remaining[:, None])[valid] + remaining_golden[golden_end[valid]]
+    else:
+        total[rows, shift_tolerance] = cost[rows, shift_tolerance]
+
+    i, k = (int(index) for index in np.unravel_index(np.argmin(total), total.shape))
+    dot_errors: Final = int(total[i, k])
+
+    # Walk the alignment back, noting the position and column of each wrong row.
+    row_shifts: Final = np.full(rows, shifts[k], dtype=int64)
+    mismatches: list[tuple[int, int]] = [
+        (row, first_dot(packed[row])) for row in range(i, rows) if dots[row] > 0
+    ]
+    mismatches += [
+        (row, first_dot(packed_golden[row]))
+        for row in range(i + int(shifts[k]), golden_rows)
+        if golden_dots[row] > 0
+    ]
+
+    while i > 0 or shifts[k] > 0:
+        step: int = steps[i, k]
+        golden_index: int = i + int(shifts[k])
+
+        if step == MATCH:
+            row_shifts[i - 1] = shifts[k]
+            if errors[k, i - 1] > 0:
+                difference = packed[i - 1] ^ packed_golden[golden_index - 1]
+                mismatches.append((i - 1, first_dot(difference)))
+            i -= 1
+        elif step == SKIP_ROW:
+            row_shifts[i - 1] = shifts[k]
+            if dots[i - 1] > 0:
+                mismatches.append((i - 1, first_dot(packed[i - 1])))
+            i, k = i - 1, k + 1
+        else:
+            if golden_dots[golden_index - 1] > 0:
+                mismatches.append((golden_index - 1, first_dot(packed_golden[golden_index - 1])))
+            k -= 1
+
+    return dot_errors, mismatches, row_shifts
@@ -0,0 +1,62 @@
+from typing import Final
+
+import numpy as np
+from numpy import uint8
+from numpy.typing import NDArray
+
+
+class LineBuffer:
+    def __init__(self, width: int, capacity: int = 256) -> None:
+        self._width: Final[int] = width
+
+        # Lines are stored packed, 8 dots per byte, and the storage doubles whenever it fills up.
+        self._rows: NDArray[uint8] = np.zeros((max(1, capacity), (width + 7) // 8), dtype=uint8)
+        self._length: int = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def rows(self) -> NDArray[uint8]:
+        return self._rows[: self._length]
+
+    def append(self, row: bytes | bytearray | memoryview | NDArray[uint8]) -> None:
+        if self._length == len(self._rows):
+            self._grow()
+
+        self._rows[self._length] = np.frombuffer(row, dtype=uint8)
+        self._length += 1
+
+    def append_int(self, value: int) -> None:
+        # The first dot is the most significant bit, aligned to the top of the first byte.
+        row_bytes: Final = self._rows.shape[1]
+        self.append((value << (8 * row_bytes - self._width)).to_bytes(row_bytes, "big"))
+
+    def append_bits(self, bits: NDArray[uint8]) -> None:
+        self.append(np.packbits(bits, bitorder="big"))
+
+    def extend_bits(self, bits: NDArray) -> None:
+        # Any number of lines at once, one row of dots per line.
+        rows: Final = np.packbits(np.asarray(bits, dtype=uint8).reshape(-1, self._width), axis=1)
+
+        while self._length + len(rows) > len(self._rows):
+            self._grow()
+
+        self._rows[self._length : self._length + len(rows)] = rows
+        self._length += len(rows)
+
+    def clear(self) -> None:
+        self._length = 0
+
+    def to_bitmap(self) -> NDArray[uint8]:
+        # A set bit is a burnt dot.
+        return np.unpackbits(self.rows, axis=1, count=self._width)
+
+    def _grow(self) -> None:
+        rows: Final = np.zeros((2 * len(self._rows), self._rows.shape[1]), dtype=uint8)
+        rows[: self._length] = self._rows[: self._length]
+        self._rows = rows
@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+from numpy import float64, int8, int64
+from numpy.typing import NDArray
+
+
+@dataclass(frozen=True)
+class MotionProfile:
+    # Time of each half step in ns from the start of the profile, and the direction it steps in.
+    times_ns: NDArray[float64]
+    steps: NDArray[int8]
+
+    def __post_init__(self) -> None:
+        if len(self.times_ns) != len(self.steps):
+            raise ValueError("Every step needs a time")
+
+        if len(self.times_ns) and (self.times_ns[0] < 0 or np.any(np.diff(self.times_ns) <= 0)):
+            raise ValueError("Step times must be positive and increasing")
+
+        if np.any(np.abs(self.steps) != 1):
+            raise ValueError("Steps must be single half steps")
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    @property
+    def half_steps(self) -> int:
+        return int(self.steps.sum(dtype=int64))
+
+    @property
+    def duration_ns(self) -> float:
+        return float(self.times_ns[-1]) if len(self) else 0
+
+    @classmethod
+    def trapezoidal(
+        cls, half_steps: int, max_rate: float, acceleration: float, start_rate: float = 0
+    ) -> "MotionProfile":
+        # Accelerates from the start rate to the max rate, cruises, then decelerates back down to
+        # the start rate. Rates are in half steps per second and acceleration in half steps per
+        # second squared. Negative half steps move backwards.
+        if max_rate <= 0 or acceleration <= 0 or not 0 <= start_rate <= max_rate:
+            raise ValueError("Rates and acceleration must be positive with start_rate <= max_rate")
+
+        distance: Final = abs(half_steps)
+
+        # Profiles too short to reach the max rate become triangular.
+        ramp_distance: Final = min((max_rate**2 - start_rate**2) / (2 * acceleration), distance / 2)
+        peak_rate: Final = np.sqrt(start_rate**2 + 2 * acceleration * ramp_distance)
+        ramp_s: Final = (peak_rate - start_rate) / acceleration
+        total_s: Final = 2 * ramp_s + (distance - 2 * ramp_distance) / peak_rate
+
+        def ramp_time_s(position: NDArray[float64]) -> NDArray[float64]:
+            return (np.sqrt(start_rate**2 + 2 * acceleration * position) - start_rate) / acceleration
+
+        # Each step happens as the position passes halfway to the next half step.
+        positions: Final = np.arange(distance, dtype=float64) + 0.5
+        times_s: Final = np.select(
+            [positions <= ramp_distance, positions <= distance - ramp_distance],
+            [
+                ramp_time_s(positions),
+                ramp_s + (positions - ramp_distance) / peak_rate,
+            ],
+            total_s - ramp_time_s(distance - positions),
+        )
+
+        return cls(
+            times_ns=times_s * 1_000_000_000,
+            steps=np.full(distance, 1 if half_steps >= 0 else -1, dtype=int8),
+        )
+
+    @classmethod
+    def from_velocity(cls, times_ns: NDArray[float64], rates: NDArray[float64]) -> "MotionProfile":
+        # Any velocity profile, given as rates in half steps per second at each sample time and
+        # linear in between. Steps happen wherever the position passes halfway between half steps,
+        # in whichever direction it's moving.
+        times_ns = np.asarray(times_ns, dtype=float64)
+        rates = np.asarray(rates, dtype=float64)
+
+        if len(times_ns) != len(rates) or len(times_ns) < 2:
+            raise ValueError("Need at least two samples, each with a time and a rate")
+
+        intervals_ns: Final = np.diff(times_ns)
+        positions: Final = np.concatenate(
+            ([0], np.cumsum((rates[1:] + rates[:-1]) / 2 * intervals_ns / 1_000_000_000))
+        )
+
+        # The nearest half step to each sample. Positions are rounded first so that floating point
+        # error doesn't decide which side of halfway a position lands on.
+        whole_steps: Final = np.floor(np.round(positions, 9) + 0.5).astype(int64)
+        crossings: Final = np.diff(whole_steps)
+
+        # Every crossing in every interval, found at once rather than interval by interval.
+        counts: Final = np.abs(crossings)
+        interval: Final = np.repeat(np.arange(len(crossings)), counts)
+        nth: Final = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        directions: Final = np.sign(crossings)[interval]
+
+        # Points halfway between half steps that each crossing passes.
+        levels: Final = np.where(
+            directions > 0, whole_steps[interval] + nth + 0.5, whole_steps[interval] - nth - 0.5
+        )
+        fractions: Final = (levels - positions[interval]) / (
+            positions[interval + 1] - positions[interval]
+        )
+
+        return cls(
+            times_ns=times_ns[interval] + fractions * intervals_ns[interval] - times_ns[0],
+            steps=directions.astype(int8),
+        )
@@ -0,0 +1,68 @@
+from typing import Final
+
+import numpy as np
+from numpy import float64, int8, int64
+from numpy.typing import NDArray
+
+
+class MotorActivity:
+    def __init__(self, capacity: int = 1024) -> None:
+        # Ticks are recorded into preallocated arrays which double in size when full, so recording
+        # costs an array write rather than a Python object per tick.
+        self._times_ns: NDArray[float64] = np.zeros(capacity, dtype=float64)
+        self._directions: NDArray[int8] = np.zeros(capacity, dtype=int8)
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def times_ns(self) -> NDArray[float64]:
+        return self._times_ns[: self._count]
+
+    @property
+    def directions(self) -> NDArray[int8]:
+        # 1 for a line advanced, -1 for a line reversed.
+        return self._directions[: self._count]
+
+    @property
+    def lines_moved(self) -> int:
+        return int(self.directions.sum(dtype=int64))
+
+    def record(self, time_ns: float, direction: int) -> None:
+        if self._count == len(self._times_ns):
+            self._times_ns = np.resize(self._times_ns, 2 * len(self._times_ns))
+            self._directions = np.resize(self._directions, 2 * len(self._directions))
+
+        self._times_ns[self._count] = time_ns
+        self._directions[self._count] = direction
+        self._count += 1
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def intervals_ns(self) -> NDArray[float64]:
+        return np.diff(self.times_ns)
+
+    def interval_histogram(
+        self, bins: int | NDArray = 10
+    ) -> tuple[NDArray[int64], NDArray[float64]]:
+        # Counts of the intervals between ticks and the edges of the bins they fall in.
+        return np.histogram(self.intervals_ns(), bins=bins)
+
+    def lines_per_second(self) -> float:
+        # Net lines moved over the time between the first and last tick.
+        if self._count < 2:
+            return 0
+
+        span_ns: Final = self.times_ns[-1] - self.times_ns[0]
+        return float(self.directions[1:].sum(dtype=int64) / span_ns * 1_000_000_000)
+
+    def speeds(self) -> NDArray[float64]:
+        # Lines per second over each interval between ticks.
+        return self.directions[1:] / self.intervals_ns() * 1_000_000_000
+
+    def accelerations(self) -> NDArray[float64]:
+        # Lines per second squared between the midpoints of each pair of intervals.
+        midpoints_ns: Final = (self.times_ns[1:] + self.times_ns[:-1]) / 2
+        return np.diff(self.speeds()) / np.diff(midpoints_ns) * 1_000_000_000
@@ -0,0 +1,254 @@
+from typing import Final, Optional
+
+import numpy as np
+from numpy import bool_, float64, int64, uint8
+from numpy.typing import NDArray
+
+from .capture import PINS, CaptureEvents
+from .line_buffer import LineBuffer
+from .stepper_reference import DECODE, MOVES, LineCounter
+
+# Pins the model is fed, packed one bit per pin. They start with capture.PINS so that captures can
+# be fed as they are. Captures don't have the motor's inverted phases, which are left low when
+# they're replayed.
+MODEL_PINS: Final[list[str]] = [*PINS, "motor_na", "motor_nb"]
+
+_CLOCK, _DATA, _LATCH, _DST, _MOTOR = 0, 1, 2, 3, 4
+
+# Edges out of reach of any pin change, used to bound the first and last lines.
+_NO_EDGE: Final = np.iinfo(int64).max // 2
+
+##################################################
+
+
+class PrintMechModel:
+    def __init__(
+        self,
+        head_width: int = 384,
+        clock_period_ns: float = 10,
+        clock_phase_ns: float = 0,
+        initial_state: int = 0,
+    ) -> None:
+        # Pin changes are fed as events, each holding its state until the next. Rather than
+        # stepping through clocks, the model works out which clk edges fall within each event and
+        # what thermal_head was showing at the time, a chunk of events at once.
+        self._width: Final[int] = head_width
+        self._period_ps: Final[int] = round(clock_period_ns * 1000)
+        self._phase_ps: Final[int] = round(clock_phase_ns * 1000)
+
+        self._lines: Final = LineBuffer(head_width)
+
+        # The burn line and thermal_head's registers, dots in the order they were shifted in.
+        self._burn: NDArray[bool_] = np.zeros(head_width, dtype=bool_)
+        self._head: NDArray[bool_] = np.zeros(head_width, dtype=bool_)
+        self._latch: NDArray[bool_] = np.zeros(head_width, dtype=bool_)
+        self._data: NDArray[bool_] = np.zeros(head_width, dtype=bool_)
+
+        # stepper_motor's decoded step and half step count, and the edges of line ticks that are
+        # yet to be reached.
+        self._step: int = 0
+        self._counter: Final = LineCounter()
+        self._ticks: NDArray[int64] = np.zeros(0, dtype=int64)
+
+        # The last event has no end until the next is fed, so it's held back until then.
+        self._state: int = initial_state
+        self._pending: Optional[tuple[int, int]] = None
+        self._capture_time_ns: int = 0
+
+    @property
+    def lines(self) -> LineBuffer:
+        return self._lines
+
+    def to_bitmap(self) -> NDArray[uint8]:
+        return self._lines.to_bitmap()
+
+    def feed(self, times_ns: NDArray, states: NDArray) -> int:
+        # Events at absolute times, in order, with pin states packed as MODEL_PINS. Returns the
+        # number of lines completed.
+        times_ps: NDArray[int64] = np.round(np.asarray(times_ns, dtype=float64) * 1000)
+        times_ps = times_ps.astype(int64)
+        states_in: NDArray[int64] = np.asarray(states, dtype=int64)
+
+        if len(times_ps) != len(states_in):
+            raise ValueError("Every event needs a time")
+
+        if len(states_in) == 0:
+            return 0
+
+        if self._pending is not None:
+            times_ps = np.concatenate(([self._pending[0]], times_ps))
+            states_in = np.concatenate(([self._pending[1]], states_in))
+
+        if np.any(np.diff(times_ps) < 0):
+            raise ValueError("Events must be in order")
+
+        # Pins that change at the same time are seen together, so only the last state at each
+        # time counts.
+        last: Final = np.concatenate((times_ps[1:] != times_ps[:-1], [True]))
+        times_ps = times_ps[last]
+        states_in = states_in[last]
+
+        self._pending = (int(times_ps[-1]), int(states_in[-1]))
+        return self._process(times_ps, states_in)
+
+    def feed_events(self, events: CaptureEvents, row_time_ns: Optional[int] = None) -> int:
+        # Capture events, timed from the start of the capture. With a row time, they're timed by
+        # their rows instead, as CaptureDriver.replay_rows replays them.
+        deltas_ns: Final = (
+            events.delta_ns
+            if row_time_ns is None
+            else np.asarray(events.delta_rows, dtype=int64) * row_time_ns
+        )
+        times_ns: Final = self._capture_time_ns + np.cumsum(deltas_ns, dtype=int64)
+        if len(times_ns) > 0:
+            self._capture_time_ns = int(times_ns[-1])
+
+        return self.feed(times_ns, events.state)
+
+    def advance(self, time_ns: float) -> int:
+        # The pins hold their state until the given time.
+        if self._pending is None:
+            return 0
+
+        return self.feed(np.array([time_ns]), np.array([self._pending[1]]))
+
+    def flush(self) -> int:
+        # The pins hold their state until the motor has finished ticking any lines.
+        if self._pending is None:
+            return 0
+
+        # A step sampled on the first edge of the last event ticks a line 2 edges later.
+        last_edge: Final = self._first_edge(np.array([self._pending[0]]))[0] + 2
+        return self.advance((self._phase_ps + (int(last_edge) + 1) * self._period_ps) / 1000)
+
+    def _first_edge(self, times_ps: NDArray[int64]) -> NDArray[int64]:
+        # Index of the first clk edge at or after each time, as a pin changing on an edge is seen
+        # by it.
+        return -((self._phase_ps - times_ps) // self._period_ps)
+
+    def _window(self, stream: NDArray[bool_], offset: int) -> NDArray[bool_]:
+        return stream[offset : offset + self._width].copy()
+
+    def _process(self, times_ps: NDArray[int64], states_in: NDArray[int64]) -> int:
+        # Every event but the last, which ends the one before it.
+        states: Final = states_in[:-1]
+        count: Final = len(states)
+        width: Final = self._width
+
+        if count == 0:
+            return 0
+
+        previous: Final = np.concatenate(([self._state], states[:-1]))
+        clock: Final = (states >> _CLOCK) & 1
+        dst: Final = ((states >> _DST) & 1).astype(bool_)
+        latch_open: Final = ((states >> _LATCH) & 1) == 0
+
+        # thermal_head's registers are each a window onto one stream of dots: the carried burn
+        # line and registers followed by every bit shifted in since. The data register is the
+        # last head width of bits shifted in, and the latched and head dots are copies of it from
+        # whenever the latch was last open or dst last high.
+        shifts: Final = (clock == 1) & (((previous >> _CLOCK) & 1) == 0)
+        stream: Final = np.concatenate(
+            (
+                self._burn,
+                self._head,
+                self._latch,
+                self._data,
+                ((states[shifts] >> _DATA) & 1).astype(bool_),
+            )
+        )
+
+        index: Final = np.arange(count)
+        data_offset: Final = 3 * width + np.cumsum(shifts)
+
+        latched: Final = np.maximum.accumulate(np.where(latch_open, index, -1))
+        latch_offset: Final = np.where(latched >= 0, data_offset[latched], 2 * width)
+
+        struck: Final = np.maximum.accumulate(np.where(dst, index, -1))
+        head_offset: Final = np.where(struck >= 0, latch_offset[struck], width)
+
+        # Clk edges within each event, from the first up to but not including the next event's.
+        edges: Final = self._first_edge(times_ps)
+        first: Final = edges[:-1]
+        end: Final = edges[1:]
+        horizon: Final = int(edges[-1])
+        clocked: Final = end > first
+
+        # stepper_motor only samples the phases on edges, and an event's phases are the same on
+        # all of them, so only its first edge can move the motor. The decoder holds its last step
+        # through invalid codes.
+        decoded: Final = DECODE[(states[clocked] >> _MOTOR) & 0xF].astype(int64)
+        valid: Final = np.maximum.accumulate(np.where(decoded >= 0, np.arange(len(decoded)), -1))
+        steps: Final = np.where(valid >= 0, decoded[valid], self._step)
+        moves: Final = MOVES[(steps - np.concatenate(([self._step], steps[:-1]))) % 8]
+        if len(steps) > 0:
+            self._step = int(steps[-1])
+
+        # A tick from a step sampled on edge k reaches print_mechanism on edge k + 2, which moves
+        # the burn line into print_line and throws away that edge's dots.
+        advance, _ = self._counter.feed(moves)
+        ticks: Final = np.concatenate((self._ticks, first[clocked][advance] + 2))
+        completed: Final = int(np.searchsorted(ticks, horizon))
+        self._ticks = ticks[completed:]
+
+        # Each event with dst high burns its head dots into every line it has an edge in, other
+        # than a tick's. Line n ends at tick n, and line 0 carries on from the burn line.
+        burning: Final = clocked & dst
+
+        # An edge at the same time as a pin change sees the new pin levels, but not a bit shifted
+        # in by it, as data_reg is a register like any other. Where that changes what the head
+        # shows, the edge is burnt on its own.
+        early_latch: Final = np.where(
+            latch_open,
+            data_offset - shifts,
+            np.concatenate(([2 * width], latch_offset[:-1])),
+        )
+        on_edge: Final = times_ps[:-1] == self._phase_ps + first * self._period_ps
+        early: Final = burning & on_edge & (early_latch != head_offset)
+        later: Final = burning & (~early | (end - first > 1))
+
+        burn_first_unsorted: Final = np.concatenate((first[early], first[later] + early[later]))
+        order: Final = np.argsort(burn_first_unsorted, kind="stable")
+
+        burn_first: Final = burn_first_unsorted[order]
+        burn_last: Final = np.concatenate((first[early], end[later] - 1))[order]
+        burn_offset: Final = np.concatenate((early_latch[early], head_offset[later]))[order]
+
+        low: Final = np.searchsorted(ticks, burn_first, "left")
+        spans: Final = np.searchsorted(ticks, burn_last, "right") - low + 1
+        line: Final = np.repeat(low, spans) + (
+            np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+        )
+
+        bounds: Final = np.concatenate(([-_NO_EDGE], ticks, [_NO_EDGE]))
+        burns: Final = np.maximum(np.repeat(burn_first, spans), bounds[line] + 1) <= np.minimum(
+            np.repeat(burn_last, spans), bounds[line + 1] - 1
+        )
+
+        lines: NDArray[int64] = np.concatenate(([0], line[burns]))
+        offsets: NDArray[int64] = np.concatenate(([0], np.repeat(burn_offset, spans)[burns]))
+
+        # The head dots rarely change while dst is high, so repeats are dropped before the dots
+        # are gathered.
+        distinct: Final = np.concatenate(
+            ([True], (lines[1:] != lines[:-1]) | (offsets[1:] != offsets[:-1]))
+        )
+        lines = lines[distinct]
+        offsets = offsets[distinct]
+
+        dots: Final = stream[offsets[:, None] + np.arange(width)]
+        starts: Final = np.flatnonzero(np.concatenate(([True], lines[1:] != lines[:-1])))
+
+        burnt: Final = np.zeros((completed + 1, width), dtype=bool_)
+        burnt[lines[starts]] = np.logical_or.reduceat(dots, starts, axis=0)
+
+        self._lines.extend_bits(burnt[:completed])
+
+        self._burn = burnt[completed]
+        self._head = self._window(stream, int(head_offset[-1]))
+        self._latch = self._window(stream, int(latch_offset[-1]))
+        self._data = self._window(stream, int(data_offset[-1]))
+        self._state = int(states[-1])
+
+        return completed
+
@@ -2,11 +2,15 @@ from logging import Logger
 from typing import Final, Optional
 
 import cocotb
-from cocotb.queue import Queue
 from cocotb.triggers import RisingEdge, ReadOnly
 from cocotb.task import Task
 from cocotb.handle import SimHandleBase
 
+from numpy import uint8
+from numpy.typing import NDArray
+
+from .line_buffer import LineBuffer
+
 
 class PrintMechMonitor:
     def __init__(
@@ -20,7 +24,7 @@ class PrintMechMonitor:
 
         self._coroutine: Optional[Task] = None
 
-        self.lines: Queue = Queue()
+        self._lines: Final = LineBuffer(len(print_line))
 
         self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
 
@@ -38,11 +42,18 @@ class PrintMechMonitor:
         if self._coroutine is not None:
             self._coroutine.kill()
 
+    @property
+    def lines(self) -> LineBuffer:
+        return self._lines
+
+    def to_bitmap(self) -> NDArray[uint8]:
+        return self._lines.to_bitmap()
+
     async def _monitor(self) -> None:
         while True:
             await RisingEdge(self._print_line_ready)
             await ReadOnly()
-            self.lines.put_nowait(self._print_line.value.binstr)
+            self._lines.append_int(self._print_line.value.integer)
 
             if self._log is not None:
                 self._log.info("Got line")
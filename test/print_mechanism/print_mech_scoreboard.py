@@ -0,0 +1,166 @@
+from logging import Logger
+from typing import Final, Optional, Sequence
+
+import cocotb
+from cocotb.triggers import Edge, RisingEdge
+from cocotb.task import Task
+from cocotb.handle import SimHandleBase
+from cocotb.utils import get_sim_time
+
+import numpy as np
+
+from .print_mech_model import PrintMechModel
+from .print_mech_monitor import PrintMechMonitor
+
+# Pin changes fed to the model at once. Lines are checked as each chunk is fed, so a mismatch is
+# caught soon after it's printed rather than at the end of the test.
+FEED_EVENTS: Final = 1024
+
+
+class PrintMechScoreboard:
+    def __init__(
+        self,
+        clock: SimHandleBase,
+        pins: Sequence[SimHandleBase],
+        monitor: PrintMechMonitor,
+        clock_period_ns: float,
+        name: Optional[str] = None,
+    ) -> None:
+        self._clock: Final[SimHandleBase] = clock
+        # Handles in the same order as print_mech_model.MODEL_PINS.
+        self._pins: Final[Sequence[SimHandleBase]] = pins
+        self._monitor: Final[PrintMechMonitor] = monitor
+        self._clock_period_ns: Final[float] = clock_period_ns
+
+        self._coroutines: Final[list[Task]] = []
+
+        # Pin changes are recorded as they happen and fed to the model a chunk at a time.
+        self._state: int = 0
+        self._times_ns: list[float] = []
+        self._states: list[int] = []
+
+        self._model: Optional[PrintMechModel] = None
+        self._initial_state: int = 0
+        self._checked: int = 0
+        self._mismatches: list[int] = []
+        self._first_mismatch_ns: Optional[float] = None
+
+        self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
+
+    def start(self) -> None:
+        if self._log is not None:
+            self._log.info("Start")
+
+        if self._coroutines:
+            return
+
+        # The model starts from the pins as they are, with the DUT fresh out of reset.
+        self._state = 0
+        for bit, pin in enumerate(self._pins):
+            self._state |= (int(pin.value) & 1) << bit
+
+        self._initial_state = self._state
+        self._times_ns = [get_sim_time("ns")]
+        self._states = [self._state]
+
+        self._coroutines.append(cocotb.start_soon(self._find_phase()))
+        for bit, pin in enumerate(self._pins):
+            self._coroutines.append(cocotb.start_soon(self._record(bit, pin)))
+
+    def stop(self) -> None:
+        if self._log is not None:
+            self._log.info("Stop")
+
+        for coroutine in self._coroutines:
+            coroutine.kill()
+        self._coroutines.clear()
+
+    @property
+    def model(self) -> Optional[PrintMechModel]:
+        return self._model
+
+    @property
+    def mismatches(self) -> list[int]:
+        # Lines the DUT printed differently to the model.
+        return self._mismatches
+
+    @property
+    def first_mismatch_ns(self) -> Optional[float]:
+        # Sim time the first mismatch was found at.
+        return self._first_mismatch_ns
+
+    def check(self) -> bool:
+        # Compares every line both the DUT and the model have finished so far.
+        if self._model is None:
+            return not self._mismatches
+
+        if self._times_ns:
+            self._model.feed(np.array(self._times_ns), np.array(self._states))
+            self._times_ns.clear()
+            self._states.clear()
+
+        expected: Final = self._model.lines.rows
+        printed: Final = self._monitor.lines.rows
+        checked: Final = min(len(expected), len(printed))
+
+        differs: Final = np.any(
+            expected[self._checked : checked] != printed[self._checked : checked], axis=1
+        )
+        mismatches: Final = (self._checked + np.flatnonzero(differs)).tolist()
+        self._checked = checked
+
+        if mismatches and self._first_mismatch_ns is None:
+            self._first_mismatch_ns = get_sim_time("ns")
+            if self._log is not None:
+                self._log.error(
+                    f"Line {mismatches[0]} doesn't match the model, found at "
+                    f"{self._first_mismatch_ns}ns"
+                )
+
+        if mismatches and self._log is not None:
+            self._log.error(f"Lines {mismatches} don't match the model")
+
+        self._mismatches.extend(mismatches)
+        return not self._mismatches
+
+    def finish(self) -> bool:
+        # Once the pins have settled, the DUT should have printed exactly the model's lines.
+        self.check()
+
+        if self._model is None:
+            return not self._mismatches
+
+        self._model.flush()
+        self.check()
+
+        if len(self._model.lines) != len(self._monitor.lines):
+            if self._log is not None:
+                self._log.error(
+                    f"Printed {len(self._monitor.lines)} lines, "
+                    f"the model printed {len(self._model.lines)}"
+                )
+            return False
+
+        return not self._mismatches
+
+    async def _find_phase(self) -> None:
+        await RisingEdge(self._clock)
+
+        self._model = PrintMechModel(
+            head_width=self._monitor.lines.width,
+            clock_period_ns=self._clock_period_ns,
+            clock_phase_ns=get_sim_time("ns"),
+            initial_state=self._initial_state,
+        )
+
+    async def _record(self, bit: int, pin: SimHandleBase) -> None:
+        edge: Final = Edge(pin)
+        while True:
+            await edge
+
+            self._state = (self._state & ~(1 << bit)) | ((int(pin.value) & 1) << bit)
+            self._times_ns.append(get_sim_time("ns"))
+            self._states.append(self._state)
+
+            if len(self._times_ns) >= FEED_EVENTS:
+                self.check()
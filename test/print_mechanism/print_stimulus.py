@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from logging import Logger
+from typing import Final, Optional, Sequence
+
+import cocotb
+from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
+
+from numpy import uint8
+from numpy.typing import NDArray
+
+from .stepper_motor_driver import StepperMotorDriver
+from .thermal_head_driver import ThermalHeadDriver
+
+# The stepper motor advances the paper by one dot line every 4 half steps.
+STEPS_PER_LINE: Final = 4
+
+
+@dataclass(frozen=True)
+class PrintSettings:
+    # Time the strobe is held for each line, in seconds.
+    burn_time: float = 0.000001
+    # Half steps taken after each line. Negative steps reverse and 2 is a double step.
+    step_pattern: Sequence[int] = (1, 1, 1, 1)
+    # Time between steps, in seconds.
+    step_interval: float = 0
+
+
+class PrintStimulus:
+    def __init__(
+        self,
+        head_driver: ThermalHeadDriver,
+        motor_driver: StepperMotorDriver,
+        settings: PrintSettings = PrintSettings(),
+        name: Optional[str] = None,
+    ) -> None:
+        self._head_driver: Final[ThermalHeadDriver] = head_driver
+        self._motor_driver: Final[StepperMotorDriver] = motor_driver
+        self._settings: Final[PrintSettings] = settings
+
+        self._synced: bool = False
+        self._lines: int = 0
+        self._start_ns: Optional[float] = None
+
+        self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
+
+    @property
+    def lines(self) -> int:
+        return self._lines
+
+    @property
+    def lines_per_second(self) -> float:
+        if self._start_ns is None or self._lines == 0:
+            return 0
+
+        return self._lines / ((get_sim_time("ns") - self._start_ns) / 1_000_000_000)
+
+    async def print_image(
+        self, image: NDArray[uint8], settings: Optional[PrintSettings] = None
+    ) -> None:
+        settings = settings or self._settings
+
+        if sum(settings.step_pattern) != STEPS_PER_LINE:
+            raise ValueError(f"Step pattern must advance {STEPS_PER_LINE} half steps per line")
+
+        if any(step == 0 or abs(step) > 2 for step in settings.step_pattern):
+            raise ValueError("Steps must be single or double steps")
+
+        step_timer: Final[Optional[Timer]] = (
+            Timer(Decimal(settings.step_interval * 1_000_000_000), "ns")
+            if settings.step_interval > 0
+            else None
+        )
+
+        if self._log is not None:
+            self._log.info(f"Printing {len(image)} lines")
+
+        if not self._synced:
+            # The motor phases start out in an invalid state, so the first step only gives the
+            # motor a position to count from.
+            await self._motor_driver.step_forward(1)
+            self._synced = True
+
+        if self._start_ns is None:
+            self._start_ns = get_sim_time("ns")
+
+        for line in image:
+            await self._head_driver.write_bits(line)
+            await self._head_driver.latch_data()
+            await self._head_driver.burn(settings.burn_time)
+            await self._advance(settings.step_pattern, step_timer)
+
+            self._lines += 1
+
+        if self._log is not None:
+            self._log.info(f"Printed {self._lines} lines at {self.lines_per_second:.0f} lines/s")
+
+    async def _advance(self, step_pattern: Sequence[int], step_timer: Optional[Timer]) -> None:
+        for step in step_pattern:
+            if step > 0:
+                await self._motor_driver.step_forward(1, double_step=step == 2)
+            else:
+                await self._motor_driver.step_backward(1, double_step=step == -2)
+
+            if step_timer is not None:
+                await step_timer
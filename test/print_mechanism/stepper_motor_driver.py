@@ -2,9 +2,15 @@ from logging import Logger
 from typing import Final, Optional
 
 import cocotb
-from cocotb.triggers import FallingEdge, ReadWrite
+from cocotb.triggers import FallingEdge, ReadWrite, Timer
 from cocotb.handle import SimHandleBase
 
+import numpy as np
+from numpy import float64, int64
+from numpy.typing import NDArray
+
+from .motion_profile import MotionProfile
+
 SEQUENCE: Final = [
     0b1001,
     0b0001,
@@ -34,6 +40,9 @@ class StepperMotorDriver:
         self._phase_nb: Final[SimHandleBase] = phase_nb
 
         self._step: int = 0
+        # Last value written to the phases, packed like those in SEQUENCE. Writes aren't visible on
+        # the handles until the scheduler applies them, so this is tracked rather than read back.
+        self._value: int = 0
 
         self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
 
@@ -43,33 +52,82 @@ class StepperMotorDriver:
         self._phase_na.value = 0
         self._phase_nb.value = 0
 
-    async def step_forward(self, steps: int, double_step: bool = False) -> None:
+    async def step_forward(
+        self, steps: int, double_step: bool = False, period_ns: Optional[float] = None
+    ) -> None:
         for _ in range(steps):
-            await FallingEdge(self._clock)
-            await ReadWrite()
+            await self._wait_for_step(period_ns)
 
             self._step += 2 if double_step else 1
             self._step %= len(SEQUENCE)
 
-            step_value: Final = SEQUENCE[self._step]
-
-            self._phase_a.value = (step_value >> 0) & 0b1
-            self._phase_b.value = (step_value >> 1) & 0b1
-            self._phase_na.value = (step_value >> 2) & 0b1
-            self._phase_nb.value = (step_value >> 3) & 0b1
+            self._set_phases(SEQUENCE[self._step])
 
-    async def step_backward(self, steps: int, double_step: bool = False) -> None:
+    async def step_backward(
+        self, steps: int, double_step: bool = False, period_ns: Optional[float] = None
+    ) -> None:
         for _ in range(steps):
-            await FallingEdge(self._clock)
-            await ReadWrite()
+            await self._wait_for_step(period_ns)
 
             self._step -= 2 if double_step else 1
             if self._step < 0:
                 self._step = len(SEQUENCE) + self._step
 
-            step_value: Final = SEQUENCE[self._step]
+            self._set_phases(SEQUENCE[self._step])
+
+    async def play(self, profile: MotionProfile) -> None:
+        if self._log is not None:
+            self._log.info(f"Playing {len(profile)} half steps over {profile.duration_ns:.0f}ns")
+
+        if len(profile) == 0:
+            return
+
+        positions: Final = (self._step + np.cumsum(profile.steps, dtype=int64)) % len(SEQUENCE)
+        await self.play_phases(profile.times_ns, np.asarray(SEQUENCE)[positions])
+
+        self._step = int(positions[-1])
+
+    async def play_phases(self, times_ns: NDArray[float64], values: NDArray) -> None:
+        # Drives each phase value, packed like those in SEQUENCE, at its time in ns from now. Any
+        # value can be driven, valid or not, and the motor's position is left for the caller to
+        # track. The delay before each value and the phases it changes are worked out up front, so
+        # playback costs a single timer per value and only writes the phases that change.
+        phases: Final = (self._phase_a, self._phase_b, self._phase_na, self._phase_nb)
+
+        bits: Final = (np.asarray(values)[:, None] >> np.arange(len(phases))) & 0b1
+        previous: Final = np.vstack(((self._value >> np.arange(len(phases))) & 0b1, bits[:-1]))
+
+        # Delays are taken between rounded times so that rounding doesn't accumulate.
+        delays_ps: Final = np.diff(np.round(np.asarray(times_ns) * 1000).astype(int64), prepend=0)
+
+        timers: Final[dict[int, Timer]] = {}
+        for delay_ps, value_bits, changed in zip(
+            delays_ps.tolist(), bits.tolist(), (bits != previous).tolist()
+        ):
+            if delay_ps > 0:
+                if delay_ps not in timers:
+                    timers[delay_ps] = Timer(delay_ps, "ps")
+                await timers[delay_ps]
+
+            for phase, value, change in zip(phases, value_bits, changed):
+                if change:
+                    phase.value = value
+
+        if len(values):
+            self._value = int(values[-1])
+
+    async def _wait_for_step(self, period_ns: Optional[float]) -> None:
+        # Without a period the motor steps once per clock. With one it steps at that rate regardless
+        # of the clock, like a real motor driven from its own timer.
+        if period_ns is None:
+            await FallingEdge(self._clock)
+            await ReadWrite()
+        else:
+            await Timer(period_ns, "ns", round_mode="round")
 
-            self._phase_a.value = (step_value >> 0) & 0b1
-            self._phase_b.value = (step_value >> 1) & 0b1
-            self._phase_na.value = (step_value >> 2) & 0b1
-            self._phase_nb.value = (step_value >> 3) & 0b1
+    def _set_phases(self, step_value: int) -> None:
+        self._value = step_value
+        self._phase_a.value = (step_value >> 0) & 0b1
+        self._phase_b.value = (step_value >> 1) & 0b1
+        self._phase_na.value = (step_value >> 2) & 0b1
+        self._phase_nb.value = (step_value >> 3) & 0b1
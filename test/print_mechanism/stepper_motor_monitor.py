@@ -5,6 +5,9 @@ import cocotb
 from cocotb.triggers import RisingEdge, ReadOnly, First
 from cocotb.task import Task
 from cocotb.handle import SimHandleBase
+from cocotb.utils import get_sim_time
+
+from .motor_activity import MotorActivity
 
 
 class StepperMotorMonitor:
@@ -12,14 +15,21 @@ class StepperMotorMonitor:
         self,
         line_advance_tick: SimHandleBase,
         line_reverse_tick: SimHandleBase,
+        invalid_step: Optional[SimHandleBase] = None,
+        invalid_state: Optional[SimHandleBase] = None,
         name: Optional[str] = None,
     ) -> None:
         self._adv_tick: Final[SimHandleBase] = line_advance_tick
         self._rev_tick: Final[SimHandleBase] = line_reverse_tick
+        self._invalid_step: Final[Optional[SimHandleBase]] = invalid_step
+        self._invalid_state: Final[Optional[SimHandleBase]] = invalid_state
 
-        self._coro: Optional[Task] = None
+        self._coroutines: Final[list[Task]] = []
 
         self._lines_moved: int = 0
+        self._invalid_steps: int = 0
+        self._invalid_states: int = 0
+        self._activity: Final[MotorActivity] = MotorActivity()
 
         self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
 
@@ -27,29 +37,77 @@ class StepperMotorMonitor:
         if self._log is not None:
             self._log.info("Start")
 
-        if self._coro is None:
-            self._coro = cocotb.start_soon(self._monitor())
+        if not self._coroutines:
+            self._coroutines.append(cocotb.start_soon(self._monitor()))
+
+            # Each flag gets its own task so that every rising edge is counted, even one that
+            # lands while another signal is high.
+            if self._invalid_step is not None:
+                self._coroutines.append(cocotb.start_soon(self._count_invalid_steps()))
+            if self._invalid_state is not None:
+                self._coroutines.append(cocotb.start_soon(self._count_invalid_states()))
 
     def stop(self) -> None:
         if self._log is not None:
             self._log.info("Stop")
 
-        if self._coro is not None:
-            self._coro.kill()
+        for coroutine in self._coroutines:
+            coroutine.kill()
+        self._coroutines.clear()
 
     @property
     def lines_moved(self) -> int:
         return self._lines_moved
 
+    @property
+    def invalid_steps(self) -> int:
+        return self._invalid_steps
+
+    @property
+    def invalid_states(self) -> int:
+        return self._invalid_states
+
+    @property
+    def activity(self) -> MotorActivity:
+        return self._activity
+
     def reset(self) -> None:
         self._lines_moved = 0
+        self._invalid_steps = 0
+        self._invalid_states = 0
+        self._activity.clear()
 
     async def _monitor(self) -> None:
+        # The triggers are built once rather than per tick.
+        any_tick: Final = First(RisingEdge(self._adv_tick), RisingEdge(self._rev_tick))
+        read_only: Final = ReadOnly()
+
         while True:
-            await First(RisingEdge(self._adv_tick), RisingEdge(self._rev_tick))
-            await ReadOnly()
+            await any_tick
+            await read_only
+
+            time_ns: float = get_sim_time("ns")
+
             if self._adv_tick.value == 1:
                 self._lines_moved += 1
+                self._activity.record(time_ns, 1)
 
             if self._rev_tick.value == 1:
                 self._lines_moved -= 1
+                self._activity.record(time_ns, -1)
+
+    async def _count_invalid_steps(self) -> None:
+        assert self._invalid_step is not None
+
+        edge: Final = RisingEdge(self._invalid_step)
+        while True:
+            await edge
+            self._invalid_steps += 1
+
+    async def _count_invalid_states(self) -> None:
+        assert self._invalid_state is not None
+
+        edge: Final = RisingEdge(self._invalid_state)
+        while True:
+            await edge
+            self._invalid_states += 1
@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+from numpy import bool_, int8, int64
+from numpy.typing import NDArray
+
+# Phase codes stepper_decoder recognises, packed {a, b, na, nb} with a as the MSB. The inter step
+# codes are also accepted for the odd steps.
+STEP_CODES: Final = [0b1000, 0b1100, 0b0100, 0b0110, 0b0010, 0b0011, 0b0001, 0b1001]
+INTER_STEP_CODES: Final = {1: 0b1110, 3: 0b0111, 5: 0b1011, 7: 0b1101}
+
+# The decoded step for each phase value as packed by StepperMotorDriver, with a as the LSB, or -1
+# for codes the decoder flags as invalid.
+DECODE: Final = np.full(16, -1, dtype=int8)
+for _step, _code in [*enumerate(STEP_CODES), *INTER_STEP_CODES.items()]:
+    DECODE[int(f"{_code:04b}"[::-1], 2)] = _step
+
+# Half steps moved for each change of step between clocks. Changes of 3 to 5 half steps are
+# ambiguous and flagged as invalid steps.
+MOVES: Final = np.array([0, 1, 2, 0, 0, 0, -2, -1], dtype=int8)
+
+##################################################
+
+
+@dataclass(frozen=True)
+class StepperReference:
+    # Each of stepper_motor's outputs after every clock.
+    line_advance_tick: NDArray[bool_]
+    line_reverse_tick: NDArray[bool_]
+    invalid_step: NDArray[bool_]
+    invalid_state: NDArray[bool_]
+
+    @property
+    def lines_moved(self) -> int:
+        return int(self.line_advance_tick.sum(dtype=int64) - self.line_reverse_tick.sum(dtype=int64))
+
+    @property
+    def invalid_steps(self) -> int:
+        return rising_edges(self.invalid_step)
+
+    @property
+    def invalid_states(self) -> int:
+        return rising_edges(self.invalid_state)
+
+    @classmethod
+    def decode(cls, values: NDArray) -> "StepperReference":
+        # Models stepper_motor from reset, given the phase values it samples on each clock.
+        decoded: Final = DECODE[np.asarray(values)]
+        invalid: Final = decoded < 0
+
+        # The decoder holds its last step, 0 out of reset, through invalid codes.
+        last_valid: Final = np.maximum.accumulate(np.where(invalid, -1, np.arange(len(decoded))))
+        steps: Final = np.where(last_valid >= 0, decoded[last_valid], 0)
+
+        # The motor compares the decoder's step with its own copy, which lags a clock behind, so its
+        # outputs are a further clock behind the decoder's.
+        decoder_steps: Final = np.concatenate(([0], steps[:-1]))
+        motor_steps: Final = np.concatenate(([0, 0], steps[:-2]))[: len(steps)]
+        changes: Final = (decoder_steps - motor_steps) % 8
+
+        line_advance_tick, line_reverse_tick = count_lines(MOVES[changes])
+
+        return cls(
+            line_advance_tick=line_advance_tick,
+            line_reverse_tick=line_reverse_tick,
+            invalid_step=(changes >= 3) & (changes <= 5),
+            invalid_state=np.concatenate(([False], invalid[:-1])),
+        )
+
+
+class LineCounter:
+    # stepper_motor's half step count, carried between calls so that moves can be counted a chunk
+    # at a time.
+    def __init__(self) -> None:
+        self.count: int = 0
+
+    def feed(self, moves: NDArray) -> tuple[NDArray[bool_], NDArray[bool_]]:
+        # Where stepper_motor ticks a line advanced or reversed, given the half steps moved on each
+        # clock. The motor counts half steps in whichever direction it's moving, cancelling any it
+        # had counted the other way, and ticks when its count wraps past 4.
+        moves = np.asarray(moves)
+
+        advance: Final = np.zeros(len(moves), dtype=bool_)
+        reverse: Final = np.zeros(len(moves), dtype=bool_)
+
+        # Only clocks that move need visiting, so this loops over steps rather than clocks.
+        count: int = self.count
+        for index in np.flatnonzero(moves).tolist():
+            count += int(moves[index])
+
+            if count >= 4:
+                advance[index] = True
+                count -= 4
+
+            elif count <= -4:
+                reverse[index] = True
+                count += 4
+
+        self.count = count
+        return advance, reverse
+
+
+def count_lines(moves: NDArray) -> tuple[NDArray[bool_], NDArray[bool_]]:
+    # Line ticks from reset.
+    return LineCounter().feed(moves)
+
+
+def rising_edges(signal: NDArray[bool_]) -> int:
+    # Signals are low out of reset.
+    return int(np.count_nonzero(signal & ~np.concatenate(([False], signal[:-1]))))
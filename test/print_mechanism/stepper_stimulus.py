@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+from numpy import float64, int8, int64
+from numpy.typing import NDArray
+
+from .stepper_motor_driver import SEQUENCE
+
+
+@dataclass(frozen=True)
+class StepperFaultProfile:
+    # Chance of each step turning the motor around.
+    reverse: float = 0.2
+    # Chances of each step being a double step, or skipping a phase and jumping 3 half steps.
+    double_step: float = 0
+    skipped_phase: float = 0
+    # Chance of a glitch to some other phase value part way through each step. It starts a quarter
+    # of the way through the step and lasts for this fraction of it.
+    glitch: float = 0
+    glitch_length: tuple[float, float] = (0.05, 0.5)
+
+
+@dataclass(frozen=True)
+class PhaseSchedule:
+    # Phase values, packed like SEQUENCE, and their times in ns from the start of the schedule.
+    times_ns: NDArray[float64]
+    values: NDArray[int64]
+    # Half steps moved by each step, not counting glitches.
+    moves: NDArray[int8]
+    # Position in SEQUENCE the motor is left at.
+    position: int
+
+
+class StepperStimulusGenerator:
+    def __init__(self, seed: int) -> None:
+        self._random: Final = np.random.default_rng(seed)
+
+    def schedule(
+        self, steps: int, period_ns: float, position: int, faults: StepperFaultProfile
+    ) -> PhaseSchedule:
+        # A step every period, starting a period from now at the given position in SEQUENCE.
+        sizes: Final = self._random.choice(
+            [1, 2, 3],
+            size=steps,
+            p=[1 - faults.double_step - faults.skipped_phase, faults.double_step, faults.skipped_phase],
+        )
+        directions: Final = np.where(np.cumsum(self._random.random(steps) < faults.reverse) % 2, -1, 1)
+        moves: Final = (sizes * directions).astype(int8)
+
+        positions: Final = (position + np.cumsum(moves, dtype=int64)) % len(SEQUENCE)
+        times_ns: Final = np.arange(1, steps + 1) * period_ns
+        values: Final = np.asarray(SEQUENCE, dtype=int64)[positions]
+
+        # Glitches go to any other value and then back to the step's own.
+        glitched: Final = np.flatnonzero(self._random.random(steps) < faults.glitch)
+        glitch_start_ns: Final = times_ns[glitched] + period_ns / 4
+        glitch_end_ns: Final = glitch_start_ns + period_ns * self._random.uniform(
+            *faults.glitch_length, size=len(glitched)
+        )
+        glitch_values: Final = (values[glitched] + self._random.integers(1, 16, len(glitched))) % 16
+
+        all_times_ns: Final = np.concatenate((times_ns, glitch_start_ns, glitch_end_ns))
+        order: Final = np.argsort(all_times_ns, kind="stable")
+
+        return PhaseSchedule(
+            times_ns=all_times_ns[order],
+            values=np.concatenate((values, glitch_values, values[glitched]))[order],
+            moves=moves,
+            position=int(positions[-1]) if steps else position,
+        )
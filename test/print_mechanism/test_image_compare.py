@@ -0,0 +1,59 @@
+import time
+from typing import Final
+
+import numpy as np
+from numpy import uint8
+from numpy.typing import NDArray
+
+from .image_compare import compare_images
+
+HEAD_WIDTH: Final = 384
+
+##################################################
+
+
+def make_print(rows: int, seed: int = 0) -> NDArray[uint8]:
+    # Random dots with every fourth line left blank, starting with a blank line.
+    rng: Final = np.random.default_rng(seed)
+    bitmap: Final = (rng.random((rows, HEAD_WIDTH)) < 0.2).astype(uint8)
+    bitmap[::4] = 0
+    return bitmap
+
+
+def test_compare_jitter():
+    golden: Final = make_print(16)
+
+    # The paper feed may jitter by a blank line, but a repeated or lost line is still an error.
+    jittered: Final = np.vstack([golden[1:], golden[:1]])
+    repeated: Final = np.vstack([golden[:3], golden[2:3], golden[4:]])
+    lost: Final = np.vstack([golden[:3], golden[4:], golden[:1]])
+
+    assert compare_images(golden, golden).passed
+    assert not compare_images(jittered, golden).passed, "Jitter tolerated without a tolerance"
+    assert compare_images(jittered, golden, shift_tolerance=1).passed, "Jitter wasn't tolerated"
+    assert not compare_images(repeated, golden, shift_tolerance=1).passed, "Repeat not caught"
+    assert not compare_images(lost, golden, shift_tolerance=1).passed, "Lost line not caught"
+
+
+def test_compare_missing_rows():
+    golden: Final = make_print(16)
+    comparison: Final = compare_images(golden[:14], golden, shift_tolerance=1)
+
+    # Missing rows at the end are reported where they are in the golden image.
+    assert not comparison.passed
+    assert comparison.first_mismatch == (14, int(np.argmax(golden[14])))
+
+
+def test_compare_speed():
+    golden: Final = make_print(50_000)
+    image: Final = golden.copy()
+    image[1234, 5] ^= 1
+
+    start: Final = time.perf_counter()
+    matched: Final = compare_images(golden, golden, shift_tolerance=2)
+    mismatched: Final = compare_images(image, golden, shift_tolerance=2)
+    elapsed: Final = time.perf_counter() - start
+
+    assert matched.passed, str(matched)
+    assert mismatched.first_mismatch == (1234, 5), str(mismatched)
+    assert elapsed < 1, f"Comparing 50k rows took {elapsed:.2f}s"
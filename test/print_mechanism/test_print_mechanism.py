@@ -1,42 +1,122 @@
-import asyncio
 import os
-from typing import Final, Optional
+from typing import Final
 from pathlib import Path
-from decimal import Decimal
 
 import cocotb
-from cocotb.triggers import Timer
+from cocotb.triggers import ClockCycles
 
 import numpy as np
-from numpy import uint8, float32
+from numpy import int64, uint8
 from numpy.typing import NDArray
 
-import cv2 as cv
-
 from .. import config
 from ..clock_domain import ClockDomainDriver
 
-from .thermal_head_driver import ThermalHeadDriver
+from .capture import CaptureEvents, find_capture, read_capture
+from .capture_driver import CaptureDriver
+from .image_compare import compare_images, load_bitmap, save_bitmap
 from .print_mech_monitor import PrintMechMonitor
+from .print_mech_scoreboard import PrintMechScoreboard
+from .print_stimulus import PrintSettings, PrintStimulus
+from .stepper_motor_driver import SEQUENCE, StepperMotorDriver
+from .thermal_head_driver import ThermalHeadDriver
+
+CAPTURE: Final = find_capture(Path(os.path.dirname(__file__), "Arial16"))
+GOLDEN: Final = Path(os.path.dirname(__file__), "Arial16.png")
+
+CLOCK_FREQUENCY: Final = 100_000_000
+CLOCK_PERIOD_NS: Final = 1_000_000_000 / CLOCK_FREQUENCY
+
+# The random pin changes are seeded the same way every time so that a failure can be reproduced.
+RANDOM_EVENTS: Final = int(os.environ.get("PRINT_MECH_RANDOM_EVENTS", 20_000))
+RANDOM_SEED: Final = int(os.environ.get("PRINT_MECH_RANDOM_SEED", 0))
 
 ##################################################
 
 
-# def test_print_mechanism():
-#     config.run_test(
-#         toplevel="print_mechanism",
-#         output_directory=Path(config.OUTPUT_DIRECTORY, "print_mechanism"),
-#         test_module="test.print_mechanism.test_print_mechanism",
-#     )
+def test_print_mechanism():
+    config.run_test(
+        toplevel="print_mechanism",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "print_mechanism"),
+        test_module="test.print_mechanism.test_print_mechanism",
+    )
 
 
 ##################################################
 
 
-@cocotb.test()  # type: ignore
+# Captures from the real printer aren't kept in the repository.
+@cocotb.test(skip=not CAPTURE.exists())  # type: ignore
 async def run_test(dut):
     clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
 
+    capture_driver: Final = CaptureDriver(
+        name="CaptureDriver",
+        pins=[
+            dut.mech_clk,
+            dut.mech_data,
+            dut.mech_latch,
+            dut.mech_dst,
+            dut.motor_phase_a,
+            dut.motor_phase_b,
+        ],
+    )
+
+    print_monitor: Final = PrintMechMonitor(
+        name="PrintMechMonitor",
+        print_line_ready=dut.print_line_ready,
+        print_line=dut.print_line,
+    )
+
+    scoreboard: Final = PrintMechScoreboard(
+        name="PrintMechScoreboard",
+        clock=dut.clk,
+        pins=[
+            dut.mech_clk,
+            dut.mech_data,
+            dut.mech_latch,
+            dut.mech_dst,
+            dut.motor_phase_a,
+            dut.motor_phase_b,
+            dut.motor_phase_na,
+            dut.motor_phase_nb,
+        ],
+        monitor=print_monitor,
+        clock_period_ns=CLOCK_PERIOD_NS,
+    )
+
+    clock_domain.start(CLOCK_FREQUENCY)
+    await clock_domain.reset(2)
+
+    print_monitor.start()
+    scoreboard.start()
+
+    await capture_driver.replay(read_capture(CAPTURE, max_gap_ns=1000))
+
+    await ClockCycles(dut.clk, 4)
+    assert scoreboard.finish(), f"Lines {scoreboard.mismatches} don't match the model"
+
+    img: Final = print_monitor.to_bitmap()
+    save_bitmap(Path("test.png"), img)
+
+    if GOLDEN.exists():
+        comparison: Final = compare_images(img, load_bitmap(GOLDEN), shift_tolerance=1)
+        assert comparison.passed, str(comparison)
+
+
+def striped_image(lines: int, width: int) -> NDArray[uint8]:
+    # Diagonal stripes with a border so that every dot and every line is distinguishable.
+    rows, columns = np.indices((lines, width))
+    image: Final = ((rows + columns) // 3 % 2).astype(uint8)
+    image[[0, -1], :] = 1
+    image[:, [0, -1]] = 1
+    return image
+
+
+@cocotb.test()  # type: ignore
+async def run_test_image(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
     head_driver: Final = ThermalHeadDriver(
         name="HeadDriver",
         clock=dut.mech_clk,
@@ -45,59 +125,121 @@ async def run_test(dut):
         dst=dut.mech_dst,
     )
 
+    motor_driver: Final = StepperMotorDriver(
+        clock=dut.clk,
+        phase_a=dut.motor_phase_a,
+        phase_b=dut.motor_phase_b,
+        phase_na=dut.motor_phase_na,
+        phase_nb=dut.motor_phase_nb,
+    )
+
     print_monitor: Final = PrintMechMonitor(
         name="PrintMechMonitor",
         print_line_ready=dut.print_line_ready,
         print_line=dut.print_line,
     )
 
-    clock_domain.start(100_000_000)
+    # The model is fed every pin the DUT sees, so it should print exactly the same lines.
+    scoreboard: Final = PrintMechScoreboard(
+        name="PrintMechScoreboard",
+        clock=dut.clk,
+        pins=[
+            dut.mech_clk,
+            dut.mech_data,
+            dut.mech_latch,
+            dut.mech_dst,
+            dut.motor_phase_a,
+            dut.motor_phase_b,
+            dut.motor_phase_na,
+            dut.motor_phase_nb,
+        ],
+        monitor=print_monitor,
+        clock_period_ns=CLOCK_PERIOD_NS,
+    )
+
+    clock_domain.start(CLOCK_FREQUENCY)
     await clock_domain.reset(2)
 
     print_monitor.start()
+    scoreboard.start()
+
+    image: Final = striped_image(32, dut.HEAD_WIDTH.value)
+
+    stimulus: Final = PrintStimulus(head_driver, motor_driver, name="PrintStimulus")
+    await stimulus.print_image(image[:16])
+
+    # Double steps and steps backwards still advance one line at a time.
+    await stimulus.print_image(image[16:], PrintSettings(step_pattern=(2, -1, 1, 2)))
+    await ClockCycles(dut.clk, 4)
+    assert scoreboard.finish(), f"Lines {scoreboard.mismatches} don't match the model"
+
+    comparison: Final = compare_images(print_monitor.to_bitmap(), image)
+    assert comparison.passed, str(comparison)
+
+
+def random_pin_events(seed: int, count: int) -> CaptureEvents:
+    # Every pin wandering at once, on a 1ns grid so that plenty of changes land on clk edges. The
+    # motor mostly steps forwards through SEQUENCE with the odd step back or invalid code.
+    random: Final = np.random.default_rng(seed)
+
+    toggles: Final = random.random((count, 4)) < [0.5, 0.3, 0.05, 0.05]
+    pins: Final = np.bitwise_xor.accumulate(toggles, axis=0).astype(int64)
+    pins[:, 1] = random.integers(0, 2, count)
+
+    moves: Final = random.choice([0, 1, -1], size=count, p=[0.85, 0.13, 0.02])
+    phases: Final = np.asarray(SEQUENCE, dtype=int64)[np.cumsum(moves) % len(SEQUENCE)]
+    invalid: Final = random.random(count) < 0.005
+    phases[invalid] = random.integers(0, 16, np.count_nonzero(invalid))
+
+    return CaptureEvents(
+        delta_ns=random.integers(1, 25, count),
+        delta_rows=np.ones(count, dtype=int64),
+        state=((pins << np.arange(4)).sum(axis=1) | (phases << 4)).astype(uint8),
+    )
+
+
+@cocotb.test()  # type: ignore
+async def run_test_random_pins(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
+    pins: Final = [
+        dut.mech_clk,
+        dut.mech_data,
+        dut.mech_latch,
+        dut.mech_dst,
+        dut.motor_phase_a,
+        dut.motor_phase_b,
+        dut.motor_phase_na,
+        dut.motor_phase_nb,
+    ]
+
+    # Replayed like a capture, but with the inverted motor phases too.
+    driver: Final = CaptureDriver(name="PinDriver", pins=pins)
+
+    print_monitor: Final = PrintMechMonitor(
+        name="PrintMechMonitor",
+        print_line_ready=dut.print_line_ready,
+        print_line=dut.print_line,
+    )
+
+    scoreboard: Final = PrintMechScoreboard(
+        name="PrintMechScoreboard",
+        clock=dut.clk,
+        pins=pins,
+        monitor=print_monitor,
+        clock_period_ns=CLOCK_PERIOD_NS,
+    )
+
+    clock_domain.start(CLOCK_FREQUENCY)
+    await clock_domain.reset(2)
+
+    print_monitor.start()
+    scoreboard.start()
+
+    dut._log.info(f"Replaying {RANDOM_EVENTS} random pin changes, seed {RANDOM_SEED}")
+    await driver.replay([random_pin_events(RANDOM_SEED, RANDOM_EVENTS)])
+    await ClockCycles(dut.clk, 4)
+
+    assert scoreboard.finish(), f"Lines {scoreboard.mismatches} don't match the model"
+    assert len(print_monitor.lines) > 0
 
-    log = cocotb.log.getChild("Test")
-
-    with open(Path(os.path.dirname(__file__), "./Arial16.csv")) as file:
-        csv_data = np.genfromtxt(
-            file,
-            delimiter=",",
-            skip_header=1,
-            max_rows=50_000,
-            dtype=[float32, uint8, uint8, uint8, uint8, uint8, uint8],
-        )
-
-        last_timestamp: Optional[float] = None
-        i = 0
-        for timestamp, clock, data, latch, dst, motora, motorb in csv_data:
-            if (i % 1000) == 0:
-                log.info(f"{i}/{len(csv_data)}")
-
-            i += 1
-
-            if last_timestamp is None:
-                last_timestamp = timestamp
-
-            time_delta_ns = (timestamp - last_timestamp) * 1_000_000_000
-            time_delta_ns = int(time_delta_ns)
-            if time_delta_ns > 1000:
-                time_delta_ns = 1000
-
-            if time_delta_ns > 0:
-                await Timer(Decimal(time_delta_ns), "ns")
-
-            last_timestamp = timestamp
-            head_driver.write(int(clock), int(data), int(latch), int(dst))
-            dut.motor_phase_a.value = int(motora)
-            dut.motor_phase_b.value = int(motorb)
-
-    lines: list[NDArray[uint8]] = []
-    try:
-        while True:
-            line = print_monitor.lines.get_nowait()
-            lines.append(np.array([uint8(b) for b in line]))
-    except asyncio.QueueEmpty:
-        pass
-
-    img = np.multiply(np.vstack(lines), 255, dtype=uint8)
-    cv.imwrite("test.png", img)
@@ -1,14 +1,39 @@
+import os
 from typing import Final
 from pathlib import Path
 
 import cocotb
-from cocotb.triggers import ClockCycles
+from cocotb.triggers import ClockCycles, FallingEdge, Timer
+from cocotb.utils import get_sim_time
+
+import numpy as np
 
 from .. import config
 from ..clock_domain import ClockDomainDriver
 
-from .stepper_motor_driver import StepperMotorDriver
+from .motion_profile import MotionProfile
+from .stepper_motor_driver import SEQUENCE, StepperMotorDriver
 from .stepper_motor_monitor import StepperMotorMonitor
+from .stepper_reference import StepperReference, count_lines
+from .stepper_stimulus import PhaseSchedule, StepperFaultProfile, StepperStimulusGenerator
+
+CLOCK_PERIOD_NS: Final = 10
+
+# Step periods to try, slowest first. The decoder samples the phases once per clock and tolerates
+# a double step between samples, so it should track anything slower than 2 steps per clock.
+STEP_PERIODS_NS: Final = [40, 20, 10, 7.5, 6, 5.5, 4.5, 4, 3]
+STEPS_PER_RATE: Final = 64
+
+# A feed of 100 lines that ramps up to 20M half steps/s over the first and last 100 half steps.
+FEED_HALF_STEPS: Final = 400
+FEED_RATE: Final = 20_000_000
+FEED_ACCELERATION: Final = FEED_RATE**2 / (2 * 100)
+
+# The stress test uses a fixed seed so that a failure in the regression can be reproduced. Set
+# STEPPER_STRESS_SEED to stress with other traffic.
+STRESS_STEPS: Final = int(os.environ.get("STEPPER_STRESS_STEPS", 256))
+STRESS_SEED: Final = int(os.environ.get("STEPPER_STRESS_SEED", 0))
+STRESS_FAULTS: Final = StepperFaultProfile(double_step=0.1, skipped_phase=0.05, glitch=0.1)
 
 ##################################################
 
@@ -92,3 +117,238 @@ async def run_test(dut):
     await ClockCycles(dut.clk, 8)
     assert monitor.lines_moved == 1
     monitor.reset()
+
+
+@cocotb.test()  # type: ignore
+async def run_step_rate_test(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
+    motor_driver: Final = StepperMotorDriver(
+        clock=dut.clk,
+        phase_a=dut.motor_phase_a,
+        phase_b=dut.motor_phase_b,
+        phase_na=dut.motor_phase_na,
+        phase_nb=dut.motor_phase_nb,
+    )
+
+    monitor: Final = StepperMotorMonitor(
+        line_advance_tick=dut.line_advance_tick,
+        line_reverse_tick=dut.line_reverse_tick,
+        invalid_step=dut.invalid_step,
+    )
+
+    clock_domain.start(1_000_000_000 // CLOCK_PERIOD_NS)
+    await clock_domain.reset(2)
+    await motor_driver.step_forward(1)
+    await ClockCycles(dut.clk, 4)
+
+    monitor.start()
+
+    max_step_rate: float = 0
+    for period_ns in STEP_PERIODS_NS:
+        monitor.reset()
+
+        # Steps are offset from the clock edges so that none change the phases as they're sampled.
+        await FallingEdge(dut.clk)
+        await Timer(1, "ns")
+        await motor_driver.step_forward(STEPS_PER_RATE, period_ns=period_ns)
+        await ClockCycles(dut.clk, 8)
+
+        activity = monitor.activity
+        step_rate: float = 1_000_000_000 / period_ns
+
+        dut._log.info(
+            f"{step_rate / 1_000_000:.0f}M steps/s: {monitor.invalid_steps} invalid steps, "
+            f"{activity.lines_moved} lines at {activity.lines_per_second() / 1_000_000:.1f}M lines/s"
+        )
+
+        if monitor.invalid_steps != 0:
+            break
+
+        # 4 steps per line.
+        assert monitor.lines_moved == STEPS_PER_RATE // 4
+        assert activity.lines_moved == monitor.lines_moved
+
+        # Ticks land on clock edges, so their spacing varies by up to a clock either side of the
+        # step rate but averages out to it.
+        intervals_ns = activity.intervals_ns()
+        assert np.all(np.abs(intervals_ns - 4 * period_ns) < CLOCK_PERIOD_NS)
+        assert abs(intervals_ns.mean() - 4 * period_ns) < CLOCK_PERIOD_NS / 2
+
+        counts, _ = activity.interval_histogram(bins=np.arange(0, 4 * period_ns + 20, 10))
+        assert counts.sum() == len(intervals_ns)
+
+        max_step_rate = step_rate
+
+    dut._log.info(f"Decoder tracks up to {max_step_rate / 1_000_000:.0f}M steps/s")
+
+    assert monitor.invalid_steps != 0, "Decoder tracked every step rate tried"
+    assert max_step_rate * CLOCK_PERIOD_NS / 1_000_000_000 >= 1.5
+
+
+@cocotb.test()  # type: ignore
+async def run_motion_profile_test(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
+    motor_driver: Final = StepperMotorDriver(
+        clock=dut.clk,
+        phase_a=dut.motor_phase_a,
+        phase_b=dut.motor_phase_b,
+        phase_na=dut.motor_phase_na,
+        phase_nb=dut.motor_phase_nb,
+    )
+
+    monitor: Final = StepperMotorMonitor(
+        line_advance_tick=dut.line_advance_tick,
+        line_reverse_tick=dut.line_reverse_tick,
+        invalid_step=dut.invalid_step,
+    )
+
+    clock_domain.start(1_000_000_000 // CLOCK_PERIOD_NS)
+    await clock_domain.reset(2)
+    await motor_driver.step_forward(1)
+    await ClockCycles(dut.clk, 4)
+
+    monitor.start()
+
+    # Test trapezoidal feed
+    feed: Final = MotionProfile.trapezoidal(FEED_HALF_STEPS, FEED_RATE, FEED_ACCELERATION)
+    await FallingEdge(dut.clk)
+    await Timer(1, "ns")
+    await motor_driver.play(feed)
+    await ClockCycles(dut.clk, 8)
+
+    assert monitor.invalid_steps == 0
+    assert monitor.lines_moved == FEED_HALF_STEPS // 4
+
+    # The motor speeds up through the first quarter of the feed, cruises, then slows down.
+    speeds: Final = monitor.activity.speeds()
+    quarter: Final = len(speeds) // 4
+    assert np.all(speeds[quarter:-quarter] > speeds[0])
+    assert np.all(speeds[quarter:-quarter] > speeds[-1])
+    assert abs(np.median(speeds) - FEED_RATE / 4) < FEED_RATE / 40
+
+    accelerations: Final = monitor.activity.accelerations()
+    assert accelerations[:quarter].mean() > 0
+    assert accelerations[-quarter:].mean() < 0
+    monitor.reset()
+
+    # Test arbitrary profile, reversing at up to 10M half steps/s and back to rest over 8us
+    times_ns: Final = np.linspace(0, 8000, 81)
+    rates: Final = -10_000_000 * (1 - np.abs(times_ns - 4000) / 4000)
+    reverse: Final = MotionProfile.from_velocity(times_ns, rates)
+    assert reverse.half_steps == -40
+
+    await motor_driver.play(reverse)
+    await ClockCycles(dut.clk, 8)
+
+    assert monitor.invalid_steps == 0
+    assert monitor.lines_moved == -10
+
+
+async def run_stress_point(
+    dut,
+    clock_domain: ClockDomainDriver,
+    motor_driver: StepperMotorDriver,
+    monitor: StepperMotorMonitor,
+    schedule: PhaseSchedule,
+) -> StepperReference:
+    # Park on the phases for step 0 so the motor agrees with the decoder coming out of reset.
+    await motor_driver.play_phases(np.zeros(1), np.array([SEQUENCE[1]]))
+    await clock_domain.reset(2)
+    monitor.reset()
+
+    # Reset is released just after this clock edge.
+    reset_ps: Final = round(get_sim_time("ps"))
+    period_ps: Final = CLOCK_PERIOD_NS * 1000
+
+    # Phases changing on a clock edge would race the clock, so they're nudged just past it.
+    times_ps: Final = np.round(schedule.times_ns * 1000).astype(np.int64)
+    times_ps[times_ps % period_ps == 0] += 1
+
+    await motor_driver.play_phases(times_ps / 1000, schedule.values)
+    await ClockCycles(dut.clk, 8)
+
+    # The phases the DUT sampled on each clock since reset.
+    edges_ps: Final = np.arange(period_ps, round(get_sim_time("ps")) - reset_ps + 1, period_ps)
+    latest: Final = np.searchsorted(times_ps, edges_ps, side="left") - 1
+    sampled: Final = np.where(latest >= 0, schedule.values[latest], SEQUENCE[1])
+
+    reference: Final = StepperReference.decode(sampled)
+
+    directions: Final = monitor.activity.directions
+    assert int(np.count_nonzero(directions == 1)) == int(reference.line_advance_tick.sum())
+    assert int(np.count_nonzero(directions == -1)) == int(reference.line_reverse_tick.sum())
+    assert monitor.lines_moved == reference.lines_moved
+    assert monitor.invalid_steps == reference.invalid_steps
+    assert monitor.invalid_states == reference.invalid_states
+
+    return reference
+
+
+@cocotb.test()  # type: ignore
+async def run_stress_test(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
+    motor_driver: Final = StepperMotorDriver(
+        clock=dut.clk,
+        phase_a=dut.motor_phase_a,
+        phase_b=dut.motor_phase_b,
+        phase_na=dut.motor_phase_na,
+        phase_nb=dut.motor_phase_nb,
+    )
+
+    monitor: Final = StepperMotorMonitor(
+        line_advance_tick=dut.line_advance_tick,
+        line_reverse_tick=dut.line_reverse_tick,
+        invalid_step=dut.invalid_step,
+        invalid_state=dut.invalid_state,
+    )
+
+    stimulus: Final = StepperStimulusGenerator(STRESS_SEED)
+    dut._log.info(f"Stressing with {STRESS_STEPS} steps per rate, seed {STRESS_SEED}")
+
+    clock_domain.start(1_000_000_000 // CLOCK_PERIOD_NS)
+    monitor.start()
+
+    max_step_rate: float = 0
+    tracking: bool = True
+    faults_flagged: int = 0
+    for period_ns in STEP_PERIODS_NS:
+        step_rate: float = 1_000_000_000 / period_ns
+
+        # Clean steps, which the motor should follow exactly while the decoder keeps up.
+        clean: PhaseSchedule = stimulus.schedule(STRESS_STEPS, period_ns, 1, StepperFaultProfile())
+        await run_stress_point(dut, clock_domain, motor_driver, monitor, clean)
+
+        advance, reverse = count_lines(clean.moves)
+        expected_lines: int = int(advance.sum()) - int(reverse.sum())
+        tracking = tracking and (
+            monitor.lines_moved == expected_lines
+            and monitor.invalid_steps == 0
+            and monitor.invalid_states == 0
+        )
+
+        if tracking:
+            max_step_rate = step_rate
+
+        dut._log.info(
+            f"{step_rate / 1_000_000:.0f}M steps/s: {monitor.lines_moved}/{expected_lines} lines, "
+            f"{monitor.invalid_steps} invalid steps"
+        )
+
+        # Steps with faults injected, which the DUT must flag exactly as the reference does.
+        faulty: PhaseSchedule = stimulus.schedule(STRESS_STEPS, period_ns, 1, STRESS_FAULTS)
+        reference: StepperReference = await run_stress_point(
+            dut, clock_domain, motor_driver, monitor, faulty
+        )
+        faults_flagged += reference.invalid_steps + reference.invalid_states
+
+    dut._log.info(
+        f"Counts stay exact up to {max_step_rate / 1_000_000:.0f}M steps/s, "
+        f"{max_step_rate / 4 / 1_000_000:.1f}M lines/s"
+    )
+
+    assert faults_flagged > 0, "No injected faults were flagged"
+    assert not tracking, "Motor tracked every step rate tried"
+    assert max_step_rate * CLOCK_PERIOD_NS / 1_000_000_000 >= 1.5
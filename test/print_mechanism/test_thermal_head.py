@@ -4,8 +4,13 @@ from pathlib import Path
 import cocotb
 from cocotb.binary import BinaryValue
 
+import numpy as np
+from numpy import uint8
+from numpy.typing import NDArray
+
 from .. import config
 
+from .image_compare import compare_images
 from .thermal_head_driver import ThermalHeadDriver
 from .thermal_head_monitor import ThermalHeadMonitor
 
@@ -43,6 +48,12 @@ TEST_DATA: Final[list[str]] = [
 ]
 
 
+def to_bitmap(lines: list[str], width: int) -> NDArray[uint8]:
+    # The test pattern is repeated across the full width of the head.
+    pattern: Final = np.array([[int(dot) for dot in line] for line in lines], dtype=uint8)
+    return np.tile(pattern, (1, -(-width // pattern.shape[1])))[:, :width]
+
+
 @cocotb.test()  # type: ignore
 async def run_test(dut):
     head_driver: Final = ThermalHeadDriver(
@@ -62,10 +73,43 @@ async def run_test(dut):
     dut.reset.value = 1
     head_monitor.start()
 
-    for line in TEST_DATA:
-        await head_driver.write_bit_stream(BinaryValue(line))
+    bitmap: Final = to_bitmap(TEST_DATA, dut.HEAD_WIDTH.value)
+
+    for line in bitmap:
+        await head_driver.write_bit_stream(BinaryValue("".join(str(dot) for dot in line)))
         await head_driver.latch_data()
         await head_driver.burn(0.000001)
 
-    for line in TEST_DATA:
-        assert head_monitor.burns.get_nowait() == line
+    comparison: Final = compare_images(head_monitor.to_bitmap(), bitmap)
+    assert comparison.passed, str(comparison)
+
+
+@cocotb.test()  # type: ignore
+async def run_test_bit_array(dut):
+    head_driver: Final = ThermalHeadDriver(
+        name="HeadDriver",
+        clock=dut.clk,
+        data=dut.data,
+        latch=dut.latch,
+        dst=dut.dst,
+    )
+
+    head_monitor: Final = ThermalHeadMonitor(
+        name="HeadMonitor",
+        head_active=dut.head_active,
+        head_active_dots=dut.head_active_dots,
+    )
+
+    dut.reset.value = 1
+    head_monitor.start()
+
+    lines: Final = to_bitmap(TEST_DATA, dut.HEAD_WIDTH.value)
+    await head_driver.write_lines(lines, 0.000001)
+
+    # Packed lines go through the same path.
+    await head_driver.write_bits(np.packbits(lines[1]).tobytes())
+    await head_driver.latch_data()
+    await head_driver.burn(0.000001)
+
+    comparison: Final = compare_images(head_monitor.to_bitmap(), np.vstack([lines, lines[1:2]]))
+    assert comparison.passed, str(comparison)
@@ -2,6 +2,10 @@ from logging import Logger
 from typing import Final, Optional
 from decimal import Decimal
 
+import numpy as np
+from numpy import uint8
+from numpy.typing import NDArray
+
 import cocotb
 from cocotb.triggers import Timer, FallingEdge, RisingEdge
 from cocotb.task import Task
@@ -9,6 +13,8 @@ from cocotb.handle import SimHandleBase
 from cocotb.clock import Clock
 from cocotb.binary import BinaryValue
 
+CLOCK_PERIOD_NS: Final = int((1 / 24_000_000) * 1_000_000_000)
+
 
 class ThermalHeadDriver:
     def __init__(
@@ -24,9 +30,8 @@ class ThermalHeadDriver:
         self._latch: Final[SimHandleBase] = latch
         self._dst: Final[SimHandleBase] = dst
 
-        self._mech_clock: Final = Clock(
-            self._clock, int((1 / 24_000_000) * 1_000_000_000), "ns"
-        )
+        self._mech_clock: Final = Clock(self._clock, CLOCK_PERIOD_NS, "ns")
+        self._half_period: Final = Timer(Decimal(CLOCK_PERIOD_NS) / 2, "ns")
 
         self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
 
@@ -54,6 +59,36 @@ class ThermalHeadDriver:
         await RisingEdge(self._clock)
         clock_task.kill()
 
+    async def write_bits(self, data: NDArray[uint8] | bytes) -> None:
+        # Arrays hold one dot per element, bytes are packed 8 dots per byte, first dot in the MSB.
+        bits: Final = (
+            np.unpackbits(np.frombuffer(data, dtype=uint8))
+            if isinstance(data, (bytes, bytearray))
+            else np.ravel(data)
+        )
+
+        if self._log is not None:
+            self._log.info(f"Write {len(bits)} bits")
+
+        # Clock the data in directly rather than following a separate clock coroutine, only
+        # touching the data line when it changes.
+        level: Optional[int] = None
+        for bit in bits.tolist():
+            self._clock.value = 0
+            if bit != level:
+                self._data.value = bit
+                level = bit
+
+            await self._half_period
+            self._clock.value = 1
+            await self._half_period
+
+    async def write_lines(self, lines: NDArray[uint8], burn_time: float) -> None:
+        for line in lines:
+            await self.write_bits(line)
+            await self.latch_data()
+            await self.burn(burn_time)
+
     async def latch_data(self) -> None:
         if self._log is not None:
             self._log.info("Latch data")
@@ -2,11 +2,15 @@ from logging import Logger
 from typing import Final, Optional
 
 import cocotb
-from cocotb.queue import Queue
 from cocotb.triggers import RisingEdge, ReadOnly
 from cocotb.task import Task
 from cocotb.handle import SimHandleBase
 
+from numpy import uint8
+from numpy.typing import NDArray
+
+from .line_buffer import LineBuffer
+
 
 class ThermalHeadMonitor:
     def __init__(
@@ -20,7 +24,7 @@ class ThermalHeadMonitor:
 
         self._coroutine: Optional[Task] = None
 
-        self.burns: Queue = Queue()
+        self._burns: Final = LineBuffer(len(head_active_dots))
 
         self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
 
@@ -38,14 +42,19 @@ class ThermalHeadMonitor:
         if self._coroutine is not None:
             self._coroutine.kill()
 
+    @property
+    def burns(self) -> LineBuffer:
+        return self._burns
+
+    def to_bitmap(self) -> NDArray[uint8]:
+        return self._burns.to_bitmap()
+
     async def _monitor(self) -> None:
         while True:
             await RisingEdge(self._head_active)
             await ReadOnly()
 
-            burn_line: Final[str] = self._head_active_dots.value.binstr
+            self._burns.append_int(self._head_active_dots.value.integer)
 
             if self._log is not None:
-                self._log.info(f"Burn line: {burn_line}")
-
-            self.burns.put_nowait(burn_line)
+                self._log.info(f"Burn line: {len(self._burns)}")
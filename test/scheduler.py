@@ -0,0 +1,280 @@
+import argparse
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final, Optional, Sequence
+
+from cocotb.runner import get_results
+
+from . import config
+from .instrumentation import sim_time_ns
+from .tracing import TraceConfig
+
+##################################################
+
+
+@dataclass(frozen=True)
+class Job:
+    toplevel: str
+    test_module: str
+    output_directory: Path
+    parameters: dict[str, int] = field(default_factory=dict)
+    trace: Optional[TraceConfig] = None
+    # Why the job is expected to fail. It's reported if it starts passing.
+    expected_failure: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.output_directory.relative_to(config.OUTPUT_DIRECTORY).as_posix()
+
+
+@dataclass(frozen=True)
+class JobResult:
+    job: Job
+    wall_seconds: float
+    results_file: Optional[Path] = None
+    tests: int = 0
+    failures: int = 0
+    sim_time_ns: float = 0
+    error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return "ERROR"
+
+        if self.job.expected_failure is not None:
+            return "XFAIL" if self.failures > 0 else "XPASS"
+
+        return "FAIL" if self.failures > 0 else "PASS"
+
+    @property
+    def passed(self) -> bool:
+        return self.status in ("PASS", "XFAIL")
+
+
+##################################################
+
+REGRESSION: Final[list[Job]] = [
+    Job(
+        toplevel="fifo_async",
+        test_module="test.fifo.test_fifo_async",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "fifo_async"),
+    ),
+    Job(
+        toplevel="fifo_buffer",
+        test_module="test.fifo.test_fifo_buffer",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "fifo_buffer"),
+        parameters={"CAPACITY": 16},
+    ),
+    Job(
+        toplevel="stepper_motor",
+        test_module="test.print_mechanism.test_stepper_motor",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "stepper_motor"),
+    ),
+    Job(
+        toplevel="thermal_head",
+        test_module="test.print_mechanism.test_thermal_head",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "thermal_head"),
+        parameters={"HEAD_WIDTH": 16},
+    ),
+    Job(
+        toplevel="print_mechanism",
+        test_module="test.print_mechanism.test_print_mechanism",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "print_mechanism"),
+    ),
+    *[
+        Job(
+            toplevel="counter_binary",
+            test_module="test.utilities.test_counter_binary",
+            output_directory=Path(
+                config.OUTPUT_DIRECTORY,
+                f"counter_binary/max_value={max_value}-increment={increment}",
+            ),
+            parameters={"MAX_VALUE": max_value, "INCREMENT": increment},
+        )
+        for max_value, increment in [(255, 1), (1, 1), (1, 2), (8, 2), (256, 13)]
+    ],
+    Job(
+        toplevel="counter_gray",
+        test_module="test.utilities.test_counter_gray",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "counter_gray"),
+    ),
+    Job(
+        toplevel="shift_register",
+        test_module="test.utilities.test_shift_register",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "shift_register"),
+    ),
+    Job(
+        toplevel="uart_transmitter",
+        test_module="test.uart.test_uart_transmitter",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "uart_transmitter"),
+    ),
+    Job(
+        toplevel="main",
+        test_module="test.main.test_main",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "main"),
+    ),
+]
+
+##################################################
+
+
+def run_job(job: Job, build_jobs: int) -> JobResult:
+    # The runner calls make without a job count so pass it through the environment.
+    os.environ["MAKEFLAGS"] = f"-j{build_jobs}"
+
+    start: Final = time.perf_counter()
+
+    try:
+        results_file: Final = config.run_test(
+            toplevel=job.toplevel,
+            output_directory=job.output_directory,
+            test_module=job.test_module,
+            parameters=job.parameters,
+            build_jobs=build_jobs,
+            log_to_file=True,
+            trace=job.trace,
+        )
+        if results_file is None:
+            raise FileNotFoundError("The simulator didn't write any results")
+
+        tests, failures = get_results(results_file)
+        job_sim_time_ns: Final = sim_time_ns(results_file)
+
+    # Anything going wrong in one job, including the runner exiting, only fails that job.
+    except (Exception, SystemExit) as error:
+        return JobResult(
+            job, time.perf_counter() - start, error=f"{type(error).__name__}: {error}"
+        )
+
+    return JobResult(
+        job,
+        time.perf_counter() - start,
+        results_file,
+        tests,
+        failures,
+        job_sim_time_ns,
+    )
+
+
+def run_jobs(jobs: Sequence[Job], cores: int) -> list[JobResult]:
+    workers: Final = max(1, min(len(jobs), cores))
+    build_jobs: Final = max(1, cores // workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: Final = [executor.submit(run_job, job, build_jobs) for job in jobs]
+
+        for future in as_completed(futures):
+            result: JobResult = future.result()
+
+            print(f"{result.status} {result.job.name} ({result.wall_seconds:.1f}s)", flush=True)
+
+    return [future.result() for future in futures]
+
+
+##################################################
+
+
+def write_junit(results: Sequence[JobResult], path: Path) -> None:
+    testsuites: Final = ET.Element("testsuites", name="regression")
+
+    for result in results:
+        if result.results_file is not None:
+            for testsuite in ET.parse(result.results_file).getroot().iter("testsuite"):
+                testsuite.set("name", result.job.name)
+                testsuites.append(testsuite)
+
+                # Expected failures are reported as skipped, the same as pytest's xfail.
+                if result.status == "XFAIL":
+                    for testcase in testsuite.iter("testcase"):
+                        for failure in testcase.findall("failure"):
+                            testcase.remove(failure)
+                            ET.SubElement(
+                                testcase,
+                                "skipped",
+                                message=f"Expected failure: {result.job.expected_failure}",
+                            )
+
+        else:
+            testsuite = ET.SubElement(testsuites, "testsuite", name=result.job.name)
+            testcase = ET.SubElement(
+                testsuite,
+                "testcase",
+                name=result.job.test_module,
+                classname=result.job.toplevel,
+                time=f"{result.wall_seconds:.3f}",
+            )
+            ET.SubElement(testcase, "error", message=result.error or "")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(testsuites).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def summarise(results: Sequence[JobResult], wall_seconds: float, kind: str = "job") -> str:
+    width: Final = max([len(kind), *(len(result.job.name) for result in results)])
+
+    lines: list[str] = [
+        f"{kind.upper():<{width}}  {'TESTS':>5}  {'FAIL':>4}  {'SIM (ns)':>12}  {'WALL (s)':>8}  "
+        f"{'NS/S':>10}  STATUS"
+    ]
+    for result in results:
+        rate: float = result.sim_time_ns / result.wall_seconds if result.wall_seconds else 0
+        lines.append(
+            f"{result.job.name:<{width}}  {result.tests:>5}  {result.failures:>4}  "
+            f"{result.sim_time_ns:>12.0f}  {result.wall_seconds:>8.1f}  {rate:>10.0f}  {result.status}"
+        )
+
+    passed: Final = sum(result.passed for result in results)
+    expected: Final = sum(result.status == "XFAIL" for result in results)
+    failing: Final = f" ({expected} failed as expected)" if expected else ""
+    lines.append(f"{passed}/{len(results)} {kind}s passed{failing} in {wall_seconds:.1f}s")
+
+    return "\n".join(lines)
+
+
+##################################################
+
+
+def add_cores_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-j", "--cores", type=int, default=os.cpu_count() or 1, help="Core budget to schedule within."
+    )
+
+
+def add_run_arguments(parser: argparse.ArgumentParser, junit: Path, kind: str = "job") -> None:
+    add_cores_argument(parser)
+    parser.add_argument(
+        "-k", "--filter", default="", help=f"Only run {kind}s whose name contains this string."
+    )
+    parser.add_argument("--junit", type=Path, default=junit, help="Combined JUnit report.")
+
+
+def run_and_report(jobs: Sequence[Job], args: argparse.Namespace, kind: str = "job") -> int:
+    # Runs the jobs picked out by add_run_arguments' options and reports on them.
+    selected: Final = [job for job in jobs if args.filter in job.name]
+
+    start: Final = time.perf_counter()
+    results: Final = run_jobs(selected, args.cores)
+    wall_seconds: Final = time.perf_counter() - start
+
+    write_junit(results, args.junit)
+    print(summarise(results, wall_seconds, kind))
+
+    return 0 if all(result.passed for result in results) else 1
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser: Final = argparse.ArgumentParser(description="Run the regression in parallel.")
+    add_run_arguments(parser, junit=Path(config.OUTPUT_DIRECTORY, "results.xml"))
+    args: Final = parser.parse_args(argv)
+
+    return run_and_report(REGRESSION, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,35 @@ from typing import Final, Optional
 import cocotb
 from cocotb.task import Task
 from cocotb.handle import SimHandleBase
-from cocotb.triggers import RisingEdge, ReadOnly
+from cocotb.triggers import Edge, First, RisingEdge, ReadOnly
+from cocotb.utils import get_sim_time
+
+
+class RisingEdgeTracker:
+    def __init__(self, clock: SimHandleBase) -> None:
+        self._clock: Final[SimHandleBase] = clock
+        self._time: Optional[int] = None
+
+        self._coroutine: Optional[Task] = None
+
+    def start(self) -> None:
+        if self._coroutine is None:
+            self._coroutine = cocotb.start_soon(self._track())
+
+    def stop(self) -> None:
+        if self._coroutine is not None:
+            self._coroutine.kill()
+            self._coroutine = None
+
+    def at_edge(self) -> bool:
+        # Whether the clock rose in the current time step.
+        return self._time == get_sim_time()
+
+    async def _track(self) -> None:
+        clock_edge: Final = RisingEdge(self._clock)
+        while True:
+            await clock_edge
+            self._time = get_sim_time()
 
 
 class ExclusiveSignalMonitor:
@@ -20,6 +48,7 @@ class ExclusiveSignalMonitor:
         self._signal2: Final[SimHandleBase] = signal2
 
         self._coroutine: Optional[Task] = None
+        self._edges: Final = RisingEdgeTracker(clock)
 
         self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
 
@@ -28,6 +57,7 @@ class ExclusiveSignalMonitor:
             self._log.info("Start")
 
         if self._coroutine is None:
+            self._edges.start()
             self._coroutine = cocotb.start_soon(self._monitor())
 
     def stop(self) -> None:
@@ -36,15 +66,24 @@ class ExclusiveSignalMonitor:
 
         if self._coroutine is not None:
             self._coroutine.kill()
+            self._edges.stop()
 
     async def _monitor(self) -> None:
-        while True:
-            await RisingEdge(self._clock)
-            await ReadOnly()
+        clock_edge: Final = RisingEdge(self._clock)
+        read_only: Final = ReadOnly()
+
+        await clock_edge
+        await read_only
+
+        # The signals can only clash while both are active, so rather than waking on every clock
+        # wait for one of them to change. A change made on a rising edge is sampled on that edge,
+        # like it would have been when polling, and any other change on the next one.
+        while not (self._signal1.value == 1 and self._signal2.value == 1):
+            await First(Edge(self._signal1), Edge(self._signal2))
+            await read_only
 
-            signal1_active: Final[bool] = self._signal1.value == 1
-            signal2_active: Final[bool] = self._signal2.value == 1
+            if not self._edges.at_edge():
+                await clock_edge
+                await read_only
 
-            assert not (
-                signal1_active and signal2_active
-            ), "Exclusive signals both active"
+        assert False, "Exclusive signals both active"
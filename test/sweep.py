@@ -0,0 +1,107 @@
+import argparse
+import itertools
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final, Optional, Sequence
+
+from . import config
+from .scheduler import Job, add_run_arguments, run_and_report
+
+SWEEP_DIRECTORY: Final = Path(config.OUTPUT_DIRECTORY, "sweep")
+
+##################################################
+
+
+@dataclass(frozen=True)
+class Sweep:
+    toplevel: str
+    test_module: str
+    grid: dict[str, list[int]]
+    # Points known to fail, with the reason, so that the grid doesn't have to skip them.
+    expected_failures: dict[str, str] = field(default_factory=dict)
+    directory: Path = SWEEP_DIRECTORY
+
+    def jobs(self) -> list[Job]:
+        jobs: Final[list[Job]] = []
+
+        for values in itertools.product(*self.grid.values()):
+            parameters: dict[str, int] = dict(zip(self.grid, values))
+            point: str = "-".join(f"{name.lower()}={value}" for name, value in parameters.items())
+
+            jobs.append(
+                Job(
+                    toplevel=self.toplevel,
+                    test_module=self.test_module,
+                    output_directory=Path(self.directory, self.toplevel, point),
+                    parameters=parameters,
+                    expected_failure=self.expected_failures.get(point),
+                )
+            )
+
+        return jobs
+
+
+SWEEPS: Final[list[Sweep]] = [
+    Sweep(
+        toplevel="thermal_head",
+        test_module="test.print_mechanism.test_thermal_head",
+        grid={"HEAD_WIDTH": [16, 384, 576, 832]},
+    ),
+    Sweep(
+        toplevel="print_mechanism",
+        test_module="test.print_mechanism.test_print_mechanism",
+        grid={"HEAD_WIDTH": [384, 576, 832]},
+    ),
+    Sweep(
+        toplevel="fifo_async",
+        test_module="test.fifo.test_fifo_async",
+        grid={"DEPTH": [4, 8, 16, 32]},
+        expected_failures={
+            "depth=4": "3 words don't cover the pointer synchronisers' round trip, so "
+            "run_throughput_test streams at half a word per cycle",
+        },
+    ),
+    Sweep(
+        toplevel="counter_binary",
+        test_module="test.utilities.test_counter_binary",
+        grid={"MAX_VALUE": [1, 15, 255, 256], "INCREMENT": [1, 2, 13]},
+    ),
+    Sweep(
+        toplevel="counter_gray",
+        test_module="test.utilities.test_counter_gray",
+        grid={"MAX_VALUE": [1, 15, 255, 1023], "INCREMENT": [1, 3]},
+    ),
+    Sweep(
+        toplevel="uart_transmitter",
+        test_module="test.uart.test_uart_transmitter",
+        grid={"CLKS_PER_BIT": [2, 16, 104, 390]},
+    ),
+]
+
+##################################################
+
+
+def sweep_jobs(sweeps: Sequence[Sweep]) -> list[Job]:
+    # Points that appear in more than one sweep are only built and run once.
+    jobs: Final[dict[Path, Job]] = {}
+    for sweep in sweeps:
+        for job in sweep.jobs():
+            jobs.setdefault(job.output_directory, job)
+
+    return list(jobs.values())
+
+
+##################################################
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser: Final = argparse.ArgumentParser(description="Run the parameter sweeps in parallel.")
+    add_run_arguments(parser, junit=Path(SWEEP_DIRECTORY, "results.xml"), kind="point")
+    args: Final = parser.parse_args(argv)
+
+    return run_and_report(sweep_jobs(SWEEPS), args, kind="point")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
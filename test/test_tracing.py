@@ -0,0 +1,51 @@
+import re
+from typing import Final
+from pathlib import Path
+
+from cocotb.runner import get_results
+
+from . import config
+from .tracing import TraceConfig
+
+# The counter is enabled a few clock cycles after reset and then counts every 1ns cycle.
+TOPLEVEL: Final = "counter_binary"
+TEST_MODULE: Final = "test.utilities.test_counter_binary"
+
+##################################################
+
+
+def run_traced(name: str, trace: TraceConfig) -> Path:
+    output_directory: Final = Path(config.OUTPUT_DIRECTORY, "tracing", name)
+    trace_file: Final = Path(output_directory, "run_test.vcd")
+    trace_file.unlink(missing_ok=True)
+
+    results_file: Final = config.run_test(
+        toplevel=TOPLEVEL,
+        output_directory=output_directory,
+        test_module=TEST_MODULE,
+        trace=trace,
+    )
+    assert results_file is not None
+    assert get_results(results_file)[1] == 0, "Tracing broke the test"
+
+    return trace_file
+
+
+def test_trace_toplevel():
+    trace_file: Final = run_traced("toplevel", TraceConfig(stop_ns=100))
+
+    # Without a scope only the toplevel's own signals are traced.
+    trace: Final = trace_file.read_text()
+    assert re.findall(r"\$scope module (\S+)", trace) == [TOPLEVEL]
+    assert "count" in re.findall(r"\$var wire \d+ \S+ (\S+)", trace)
+    assert max(int(time) for time in re.findall(r"^#(\d+)$", trace, re.MULTILINE)) <= 100_000
+
+
+def test_trace_trigger():
+    trace_file: Final = run_traced("trigger", TraceConfig(trigger="enable", stop_ns=100))
+    assert trace_file.exists()
+
+
+def test_trace_trigger_after_window():
+    trace_file: Final = run_traced("trigger_after_window", TraceConfig(trigger="enable", stop_ns=2))
+    assert not trace_file.exists(), "Traced after the window closed"
@@ -0,0 +1,338 @@
+import functools
+import os
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+from typing import Any, Callable, Final, Optional, Sequence, TextIO
+
+import cocotb
+from cocotb.handle import HierarchyArrayObject, HierarchyObject, ModifiableObject, SimHandleBase
+from cocotb.task import Task
+from cocotb.triggers import Edge, First, RisingEdge, Timer
+from cocotb.utils import get_sim_time
+
+# Set by the user to choose what each simulation traces, see TraceConfig.parse.
+TRACE_ENV: Final = "TRACE"
+
+# Set by config.run_test. The simulator side of the tracing is only installed when the module is
+# imported into a simulation with this set.
+SIGNAL_TRACE_ENV: Final = "SIGNAL_TRACE"
+TRACING_MODULE: Final = __name__
+
+##################################################
+
+
+@dataclass(frozen=True)
+class TraceConfig:
+    # Verilator's own FST trace of the whole design. This needs a traced build of the simulator.
+    full: bool = False
+    # Window to trace, in ns of simulation time.
+    start_ns: Optional[int] = None
+    stop_ns: Optional[int] = None
+    # Path of a signal below the toplevel. Tracing starts on its first rising edge.
+    trigger: Optional[str] = None
+    # Path of a scope below the toplevel. Only signals within it are traced. Every traced signal
+    # costs a Python callback per change, so without a scope only the toplevel's own signals are.
+    scope: Optional[str] = None
+    # Levels of hierarchy below the scope to trace.
+    depth: Optional[int] = None
+
+    @property
+    def scope_depth(self) -> Optional[int]:
+        return 0 if self.scope is None and self.depth is None else self.depth
+
+    def __post_init__(self) -> None:
+        filtered: Final = (self.start_ns, self.stop_ns, self.trigger, self.scope, self.depth)
+        if self.full and any(option is not None for option in filtered):
+            raise ValueError("A full trace can't be windowed, triggered or filtered")
+
+        if self.start_ns is not None and self.stop_ns is not None and self.stop_ns <= self.start_ns:
+            raise ValueError("Trace window must end after it starts")
+
+    @classmethod
+    def parse(cls, spec: str) -> Optional["TraceConfig"]:
+        # Either off, full or comma separated options. For example:
+        # scope=print_mech.stepper_motor,trigger=print_mech.stepper_motor.invalid_step,stop=5000
+        spec = spec.strip()
+        if spec in ("", "off"):
+            return None
+
+        if spec == "full":
+            return cls(full=True)
+
+        options: Final[dict[str, Any]] = {}
+        for option in spec.split(","):
+            name, _, value = option.partition("=")
+
+            match name.strip():
+                case "start":
+                    options["start_ns"] = int(value)
+                case "stop":
+                    options["stop_ns"] = int(value)
+                case "trigger":
+                    options["trigger"] = value.strip()
+                case "scope":
+                    options["scope"] = value.strip()
+                case "depth":
+                    options["depth"] = int(value)
+                case _:
+                    raise ValueError(f"Unknown trace option: {option}")
+
+        return cls(**options)
+
+    @classmethod
+    def from_env(cls) -> Optional["TraceConfig"]:
+        return cls.parse(os.environ.get(TRACE_ENV, ""))
+
+    def __str__(self) -> str:
+        if self.full:
+            return "full"
+
+        options: Final = {
+            "start": self.start_ns,
+            "stop": self.stop_ns,
+            "trigger": self.trigger,
+            "scope": self.scope,
+            "depth": self.depth,
+        }
+        return ",".join(f"{name}={value}" for name, value in options.items() if value is not None)
+
+
+##################################################
+
+
+class VcdWriter:
+    def __init__(self, path: Path, signals: Sequence[tuple[Sequence[str], Any]]) -> None:
+        self._file: Final[TextIO] = open(path, "w")
+        self._time_ps: Optional[int] = None
+
+        self._file.write("$timescale 1ps $end\n")
+
+        # Signals are sorted by path so that each scope only needs to be opened once.
+        scope: list[str] = []
+        for index, (path_parts, value) in sorted(
+            enumerate(signals), key=lambda signal: signal[1][0]
+        ):
+            common: int = 0
+            while common < min(len(scope), len(path_parts) - 1) and (
+                scope[common] == path_parts[common]
+            ):
+                common += 1
+
+            self._file.write("$upscope $end\n" * (len(scope) - common))
+            for part in path_parts[common:-1]:
+                self._file.write(f"$scope module {part} $end\n")
+
+            scope = list(path_parts[:-1])
+            self._file.write(
+                f"$var wire {_width(value)} {_identifier(index)} {path_parts[-1]} $end\n"
+            )
+
+        self._file.write("$upscope $end\n" * len(scope))
+        self._file.write("$enddefinitions $end\n")
+
+    def dump(self, time_ps: int, values: Sequence[Any]) -> None:
+        self._write_time(time_ps)
+
+        self._file.write("$dumpvars\n")
+        for index, value in enumerate(values):
+            self._file.write(_format(value, _identifier(index)))
+        self._file.write("$end\n")
+
+    def change(self, time_ps: int, index: int, value: Any) -> None:
+        self._write_time(time_ps)
+        self._file.write(_format(value, _identifier(index)))
+
+    def close(self, time_ps: Optional[int] = None) -> None:
+        if time_ps is not None:
+            self._write_time(time_ps)
+
+        self._file.close()
+
+    def _write_time(self, time_ps: int) -> None:
+        if time_ps != self._time_ps:
+            self._file.write(f"#{time_ps}\n")
+            self._time_ps = time_ps
+
+
+def _identifier(index: int) -> str:
+    # Identifiers are base 94 numbers written with the printable ASCII characters.
+    identifier: str = ""
+    while True:
+        index, digit = divmod(index, 94)
+        identifier += chr(33 + digit)
+
+        if index == 0:
+            return identifier
+
+
+def _bits(value: Any) -> str:
+    return value.binstr.lower() if hasattr(value, "binstr") else format(int(value), "b")
+
+
+def _width(value: Any) -> int:
+    return len(_bits(value))
+
+
+def _format(value: Any, identifier: str) -> str:
+    bits: Final = _bits(value)
+    return f"{bits}{identifier}\n" if len(bits) == 1 else f"b{bits} {identifier}\n"
+
+
+##################################################
+
+
+class SignalTracer:
+    def __init__(
+        self,
+        top: SimHandleBase,
+        config: TraceConfig,
+        path: Path,
+        name: Optional[str] = None,
+    ) -> None:
+        self._top: Final = top
+        self._config: Final[TraceConfig] = config
+        self._path: Final[Path] = path
+
+        self._writer: Optional[VcdWriter] = None
+        self._coroutine: Optional[Task] = None
+        self._watchers: Final[list[Task]] = []
+
+        self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
+
+    def start(self) -> None:
+        if self._coroutine is None:
+            self._coroutine = cocotb.start_soon(self._trace())
+
+    def stop(self) -> None:
+        if self._coroutine is not None:
+            self._coroutine.kill()
+
+        self._close()
+
+    def _close(self) -> None:
+        for watcher in self._watchers:
+            watcher.kill()
+        self._watchers.clear()
+
+        if self._writer is not None:
+            self._writer.close(round(get_sim_time("ps")))
+            self._writer = None
+
+            if self._log is not None:
+                self._log.info(f"Trace written to {self._path}")
+
+    async def _trace(self) -> None:
+        if self._config.start_ns is not None and self._config.start_ns > get_sim_time("ns"):
+            await Timer(self._config.start_ns - get_sim_time("ns"), "ns", round_mode="round")
+
+        if self._config.trigger is not None:
+            trigger: Final = RisingEdge(find_handle(self._top, self._config.trigger))
+
+            # A trigger that only fires once the window has closed doesn't start a trace.
+            if self._config.stop_ns is None:
+                await trigger
+            elif (
+                self._config.stop_ns <= get_sim_time("ns")
+                or await First(trigger, self._stop_timer()) is not trigger
+            ):
+                if self._log is not None:
+                    self._log.info("Trigger didn't fire before the end of the trace window")
+                return
+
+        scope: Final = (
+            find_handle(self._top, self._config.scope) if self._config.scope else self._top
+        )
+        signals: Final = find_signals(scope, [scope._name], self._config.scope_depth)
+
+        if self._log is not None:
+            self._log.info(f"Tracing {len(signals)} signals")
+
+        self._writer = VcdWriter(self._path, [(path, signal.value) for path, signal in signals])
+        self._writer.dump(round(get_sim_time("ps")), [signal.value for _, signal in signals])
+
+        # Tracing only pays for a callback per change of a traced signal.
+        for index, (_, signal) in enumerate(signals):
+            self._watchers.append(cocotb.start_soon(self._watch(index, signal)))
+
+        if self._config.stop_ns is not None and self._config.stop_ns > get_sim_time("ns"):
+            await self._stop_timer()
+            self._close()
+
+    def _stop_timer(self) -> Timer:
+        return Timer((self._config.stop_ns or 0) - get_sim_time("ns"), "ns", round_mode="round")
+
+    async def _watch(self, index: int, signal: SimHandleBase) -> None:
+        edge: Final = Edge(signal)
+        while True:
+            await edge
+
+            if self._writer is not None:
+                self._writer.change(round(get_sim_time("ps")), index, signal.value)
+
+
+def find_handle(top: SimHandleBase, path: str) -> SimHandleBase:
+    handle: SimHandleBase = top
+    for name in path.split("."):
+        handle = getattr(handle, name)
+
+    return handle
+
+
+def find_signals(
+    scope: SimHandleBase, path: Sequence[str], depth: Optional[int] = None
+) -> list[tuple[tuple[str, ...], SimHandleBase]]:
+    signals: Final[list[tuple[tuple[str, ...], SimHandleBase]]] = []
+    for child in scope:
+        if isinstance(child, ModifiableObject):
+            signals.append(((*path, child._name), child))
+
+        elif isinstance(child, (HierarchyObject, HierarchyArrayObject)) and depth != 0:
+            signals.extend(
+                find_signals(child, (*path, child._name), None if depth is None else depth - 1)
+            )
+
+    return signals
+
+
+##################################################
+
+
+def _install(config: TraceConfig) -> None:
+    test: Final = cocotb.test
+
+    # Each test gets its own trace, since the scheduler kills every task between tests. Tests are
+    # wrapped as they're declared, so this module has to be imported before the test modules.
+    def traced_test(*args: Any, **kwargs: Any) -> Any:
+        if len(args) == 1 and not kwargs and callable(args[0]):
+            return test(_traced(config, args[0]))
+
+        def decorate(function: Callable[..., Any]) -> Any:
+            return test(*args, **kwargs)(_traced(config, function))
+
+        return decorate
+
+    cocotb.test = traced_test
+
+
+def _traced(config: TraceConfig, function: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(function)
+    async def traced(dut: SimHandleBase, *args: Any, **kwargs: Any) -> Any:
+        tracer: Final = SignalTracer(
+            dut, config, Path(f"{function.__qualname__}.vcd").absolute(), name="SignalTracer"
+        )
+        tracer.start()
+
+        try:
+            return await function(dut, *args, **kwargs)
+        finally:
+            tracer.stop()
+
+    return traced
+
+
+_SIGNAL_TRACE: Final[Optional[TraceConfig]] = TraceConfig.parse(
+    os.environ.get(SIGNAL_TRACE_ENV, "")
+)
+if _SIGNAL_TRACE is not None:
+    _install(_SIGNAL_TRACE)
@@ -0,0 +1,66 @@
+import argparse
+import random
+import time
+from typing import Final, Optional, Sequence
+
+from .uart_frame import Parity, UartDecoder, UartFrame
+
+CLKS_PER_BIT: Final = 180_000_000 // 460_800
+CLOCK_PERIOD_NS: Final = 10
+
+##################################################
+
+
+def frame_edges(frame: UartFrame, word: int, bit_time_ns: float) -> list[tuple[float, int]]:
+    edges: Final[list[tuple[float, int]]] = []
+
+    time_ns: float = 0
+    for level, bits in frame.runs(word):
+        edges.append((time_ns, level))
+        time_ns += bits * bit_time_ns
+
+    return edges
+
+
+def frames_per_second(decoder: UartDecoder, frames: int, seed: int) -> float:
+    rng: Final = random.Random(seed)
+    words: Final = [rng.getrandbits(decoder.frame.data_bits) for _ in range(frames)]
+    edges: Final = [frame_edges(decoder.frame, word, decoder.bit_time_ns) for word in words]
+
+    start: Final = time.perf_counter()
+    decoded: Final = [decoder.decode(frame) for frame in edges]
+    elapsed: Final = time.perf_counter() - start
+
+    assert decoded == words
+    return frames / elapsed
+
+
+##################################################
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser: Final = argparse.ArgumentParser(description="Benchmark the UART frame decoder.")
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args: Final = parser.parse_args(argv)
+
+    bit_time_ns: Final = CLKS_PER_BIT * CLOCK_PERIOD_NS
+
+    configurations: Final = {
+        "8N1": UartDecoder(UartFrame(), bit_time_ns),
+        "8N1 oversampling=3": UartDecoder(UartFrame(), bit_time_ns, oversampling=3),
+        "8N1 oversampling=16": UartDecoder(UartFrame(), bit_time_ns, oversampling=16),
+        "8N1 glitch check": UartDecoder(
+            UartFrame(), bit_time_ns, glitch_tolerance_ns=CLOCK_PERIOD_NS
+        ),
+        "8E2": UartDecoder(UartFrame(parity=Parity.EVEN, stop_bits=2), bit_time_ns),
+    }
+
+    width: Final = max(len(name) for name in configurations)
+    print(f"{'FORMAT':<{width}}  FRAMES/S")
+    for name, decoder in configurations.items():
+        print(f"{name:<{width}}  {frames_per_second(decoder, args.frames, args.seed):>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from logging import Logger
+from typing import Final, Iterable, Optional
+
+import cocotb
+
+from ..print_mechanism.line_buffer import LineBuffer
+
+LINE_HEADER: Final = b"LINE:"
+LINE_FOOTER: Final = b":"
+
+
+class LineFrameParser:
+    def __init__(self, lines: LineBuffer, name: Optional[str] = None) -> None:
+        self._lines: Final[LineBuffer] = lines
+
+        # Frames are LINE:<line>: with the line sent last byte first.
+        self._payload_length: Final[int] = (lines.width + 7) // 8
+        self._frame_length: Final[int] = (
+            len(LINE_HEADER) + self._payload_length + len(LINE_FOOTER)
+        )
+
+        self._frame: Final = bytearray(self._frame_length)
+        self._length: int = 0
+
+        self._discarded: int = 0
+
+        self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
+
+    @property
+    def lines(self) -> LineBuffer:
+        return self._lines
+
+    @property
+    def discarded(self) -> int:
+        return self._discarded
+
+    def feed(self, data: Iterable[int]) -> None:
+        for byte in data:
+            self.feed_byte(byte)
+
+    def feed_byte(self, byte: int) -> None:
+        self._frame[self._length] = byte
+        self._length += 1
+
+        if self._length <= len(LINE_HEADER):
+            if byte != LINE_HEADER[self._length - 1]:
+                self._resync()
+            return
+
+        if self._length < self._frame_length:
+            return
+
+        if self._frame.endswith(LINE_FOOTER):
+            self._lines.append(self._frame[len(LINE_HEADER) : -len(LINE_FOOTER)][::-1])
+            self._length = 0
+
+            if self._log is not None:
+                self._log.info(f"Line {len(self._lines)}")
+
+        else:
+            self._resync()
+
+    def _resync(self) -> None:
+        # Drop bytes from the front of the frame until what's left could be the start of a frame.
+        for start in range(1, self._length + 1):
+            remaining: int = self._length - start
+            header: int = min(remaining, len(LINE_HEADER))
+            if self._frame[start : start + header] == LINE_HEADER[:header]:
+                break
+
+        self._discarded += start
+        self._frame[:remaining] = self._frame[start : self._length]
+        self._length = remaining
+
+        if self._log is not None:
+            self._log.warning(f"Corrupted line frame, discarded {start} bytes")
@@ -0,0 +1,77 @@
+import random
+from itertools import product
+from typing import Final
+from pathlib import Path
+
+import cocotb
+from cocotb.triggers import ClockCycles, with_timeout
+
+from .. import config
+from ..clock_domain import ClockDomainDriver
+
+from .uart_driver import UartDriver
+from .uart_frame import Parity, UartFrame
+from .uart_monitor import UartMonitor
+
+CLOCK_PERIOD_NS: Final = 10
+CLKS_PER_BIT: Final = 16
+WORDS: Final = 32
+
+##################################################
+
+
+def test_uart_loopback():
+    config.run_test(
+        toplevel="synchroniser",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "uart_loopback"),
+        test_module="test.uart.test_uart_loopback",
+    )
+
+
+##################################################
+
+
+@cocotb.test()  # type: ignore
+async def run_test(dut):
+    # The driver's line is passed through a synchroniser to the monitor, as a receiver would see it.
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+    rng: Final = random.Random(0)
+
+    dut.d_in.value = 1
+    clock_domain.start(1_000_000_000 // CLOCK_PERIOD_NS)
+    await clock_domain.reset(2)
+
+    for parity, stop_bits, oversampling in product(Parity, (1, 2), (1, 3, 5)):
+        frame = UartFrame(parity=parity, stop_bits=stop_bits)
+        dut._log.info(f"Loopback with {frame} sampled {oversampling} times per bit")
+
+        driver = UartDriver(
+            line=dut.d_in,
+            clks_per_bit=CLKS_PER_BIT,
+            clock_period_ns=CLOCK_PERIOD_NS,
+            frame=frame,
+        )
+
+        monitor = UartMonitor(
+            line=dut.d_out,
+            clks_per_bit=CLKS_PER_BIT,
+            clock_period_ns=CLOCK_PERIOD_NS,
+            frame=frame,
+            oversampling=oversampling,
+            glitch_tolerance_ns=CLOCK_PERIOD_NS,
+        )
+
+        # Let the idle line through the synchroniser before listening.
+        await ClockCycles(dut.clk, 4)
+        monitor.start()
+
+        words = bytes(rng.getrandbits(8) for _ in range(WORDS))
+        await driver.write(words)
+
+        for word in words:
+            frame_time_ns = frame.bits * CLKS_PER_BIT * CLOCK_PERIOD_NS
+            assert await with_timeout(monitor.transactions.get(), frame_time_ns, "ns") == word
+
+        monitor.stop()
+        assert monitor.data == words
+        assert monitor.frames == WORDS
@@ -0,0 +1,78 @@
+import random
+import time
+from typing import Final
+from pathlib import Path
+
+import cocotb
+from cocotb.triggers import RisingEdge, ReadOnly, FallingEdge, with_timeout
+
+from .. import config
+from ..clock_domain import ClockDomainDriver
+
+from .uart_monitor import UartMonitor
+
+CLOCK_PERIOD_NS: Final = 10
+
+##################################################
+
+
+def test_uart_transmitter():
+    config.run_test(
+        toplevel="uart_transmitter",
+        output_directory=Path(config.OUTPUT_DIRECTORY, "uart_transmitter"),
+        test_module="test.uart.test_uart_transmitter",
+    )
+
+
+##################################################
+
+
+async def transmit(dut, word: int) -> None:
+    await RisingEdge(dut.clk)
+    dut.data.value = word
+    dut.enable.value = 1
+
+    await RisingEdge(dut.clk)
+    dut.data.value = 0
+    dut.enable.value = 0
+
+
+@cocotb.test()  # type: ignore
+async def run_test(dut):
+    clock_domain: Final = ClockDomainDriver(dut.clk, dut.reset)
+
+    clks_per_bit: Final[int] = dut.CLKS_PER_BIT.value
+
+    monitor: Final = UartMonitor(
+        line=dut.port,
+        clks_per_bit=clks_per_bit,
+        clock_period_ns=CLOCK_PERIOD_NS,
+        glitch_tolerance_ns=CLOCK_PERIOD_NS,
+        name="UartMonitor",
+    )
+
+    dut.enable.value = 0
+    dut.data.value = 0
+
+    clock_domain.start(1_000_000_000 // CLOCK_PERIOD_NS)
+    await clock_domain.reset(2)
+
+    monitor.start()
+
+    words: Final = [random.randint(0, 255) for _ in range(20)]
+    start: Final = time.perf_counter()
+
+    for word in words:
+        await transmit(dut, word)
+        await ReadOnly()
+        assert dut.active.value == 1, "Expected active signal to be active"
+
+        assert await monitor.transactions.get() == word
+
+        # The transmitter goes inactive at the end of the stop bit.
+        await with_timeout(FallingEdge(dut.active), clks_per_bit * CLOCK_PERIOD_NS, "ns")
+        await RisingEdge(dut.ready)
+
+    assert monitor.data == bytes(words)
+
+    dut._log.info(f"Decoded {monitor.frames / (time.perf_counter() - start):.0f} frames/s")
@@ -0,0 +1,36 @@
+from logging import Logger
+from typing import Final, Optional
+
+import cocotb
+from cocotb.handle import SimHandleBase
+from cocotb.triggers import Timer
+
+from .uart_frame import UartFrame
+
+
+class UartDriver:
+    def __init__(
+        self,
+        line: SimHandleBase,
+        clks_per_bit: int,
+        clock_period_ns: float,
+        frame: UartFrame = UartFrame(),
+        name: Optional[str] = None,
+    ) -> None:
+        self._line: Final[SimHandleBase] = line
+        self._bit_time_ns: Final[float] = clks_per_bit * clock_period_ns
+        self._frame: Final[UartFrame] = frame
+
+        self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
+
+        self._line.value = 1
+
+    async def write(self, data: bytes) -> None:
+        for word in data:
+            if self._log is not None:
+                self._log.info(f"Transmit: {word:#04x}")
+
+            # Only wait on changes of level rather than on every bit.
+            for level, bits in self._frame.runs(word):
+                self._line.value = level
+                await Timer(bits * self._bit_time_ns, "ns", round_mode="round")
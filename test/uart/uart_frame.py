@@ -0,0 +1,132 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Final, Optional, Sequence
+
+
+class UartError(Exception):
+    pass
+
+
+class UartFramingError(UartError):
+    pass
+
+
+class UartParityError(UartError):
+    pass
+
+
+class UartGlitchError(UartError):
+    pass
+
+
+class Parity(Enum):
+    NONE = auto()
+    EVEN = auto()
+    ODD = auto()
+
+
+@dataclass(frozen=True)
+class UartFrame:
+    data_bits: int = 8
+    parity: Parity = Parity.NONE
+    stop_bits: int = 1
+
+    @property
+    def bits(self) -> int:
+        return 1 + self.data_bits + (self.parity != Parity.NONE) + self.stop_bits
+
+    def parity_bit(self, word: int) -> int:
+        ones: Final = bin(word & ((1 << self.data_bits) - 1)).count("1")
+        return (ones & 1) ^ (self.parity == Parity.ODD)
+
+    def encode(self, word: int) -> list[int]:
+        bits: Final = [0] + [(word >> i) & 1 for i in range(self.data_bits)]
+
+        if self.parity != Parity.NONE:
+            bits.append(self.parity_bit(word))
+
+        return bits + [1] * self.stop_bits
+
+    def runs(self, word: int) -> list[tuple[int, int]]:
+        # Line levels paired with the number of bits each level is held for.
+        runs: Final[list[tuple[int, int]]] = []
+
+        for bit in self.encode(word):
+            if runs and runs[-1][0] == bit:
+                runs[-1] = (bit, runs[-1][1] + 1)
+            else:
+                runs.append((bit, 1))
+
+        return runs
+
+
+class UartDecoder:
+    def __init__(
+        self,
+        frame: UartFrame,
+        bit_time_ns: float,
+        oversampling: int = 1,
+        glitch_tolerance_ns: Optional[float] = None,
+    ) -> None:
+        self._frame: Final[UartFrame] = frame
+        self._bit_time_ns: Final[float] = bit_time_ns
+        self._glitch_tolerance_ns: Final[Optional[float]] = glitch_tolerance_ns
+
+        # Each bit is sampled evenly across its width and decided by a majority vote.
+        self._samples: Final[list[list[float]]] = [
+            [bit_time_ns * (bit + (i + 1) / (oversampling + 1)) for i in range(oversampling)]
+            for bit in range(frame.bits)
+        ]
+
+    @property
+    def frame(self) -> UartFrame:
+        return self._frame
+
+    @property
+    def bit_time_ns(self) -> float:
+        return self._bit_time_ns
+
+    @property
+    def frame_time_ns(self) -> float:
+        # Time from the start bit's falling edge to the last sample of the frame.
+        return self._samples[-1][-1]
+
+    def decode(self, edges: Sequence[tuple[float, int]]) -> int:
+        # Edges are (time, level) pairs starting with the falling edge of the start bit.
+        start: Final = edges[0][0]
+        times: Final = [time - start for time, _ in edges]
+        levels: Final = [level for _, level in edges]
+
+        if self._glitch_tolerance_ns is not None:
+            self._check_glitches(times)
+
+        bits: Final = [
+            2 * sum(levels[bisect_right(times, sample) - 1] for sample in samples) > len(samples)
+            for samples in self._samples
+        ]
+
+        if bits[0]:
+            raise UartFramingError("Start bit not held low")
+
+        word: int = 0
+        for i, bit in enumerate(bits[1 : 1 + self._frame.data_bits]):
+            word |= bit << i
+
+        if self._frame.parity != Parity.NONE:
+            if bits[1 + self._frame.data_bits] != self._frame.parity_bit(word):
+                raise UartParityError(f"Parity error in word: {word:#x}")
+
+        if not all(bits[-self._frame.stop_bits :]):
+            raise UartFramingError(f"Missing stop bit after word: {word:#x}")
+
+        return word
+
+    def _check_glitches(self, times: Sequence[float]) -> None:
+        assert self._glitch_tolerance_ns is not None
+
+        # Every transition within a frame has to line up with a bit boundary.
+        for time in times[1:]:
+            offset: float = time % self._bit_time_ns
+            if min(offset, self._bit_time_ns - offset) > self._glitch_tolerance_ns:
+                raise UartGlitchError(f"Transition {time}ns into frame is not on a bit boundary")
@@ -0,0 +1,100 @@
+from logging import Logger
+from typing import Callable, Final, Optional
+
+import cocotb
+from cocotb.queue import Queue
+from cocotb.task import Task
+from cocotb.handle import SimHandleBase
+from cocotb.triggers import Edge, FallingEdge, First, Timer
+from cocotb.utils import get_sim_time
+
+from .uart_frame import UartDecoder, UartFrame
+
+
+class UartMonitor:
+    def __init__(
+        self,
+        line: SimHandleBase,
+        clks_per_bit: int,
+        clock_period_ns: float,
+        frame: UartFrame = UartFrame(),
+        oversampling: int = 1,
+        glitch_tolerance_ns: Optional[float] = None,
+        callback: Optional[Callable[[int], None]] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        self._line: Final[SimHandleBase] = line
+
+        self._decoder: Final = UartDecoder(
+            frame,
+            bit_time_ns=clks_per_bit * clock_period_ns,
+            oversampling=oversampling,
+            glitch_tolerance_ns=glitch_tolerance_ns,
+        )
+
+        # Words are passed to the callback if one is given, otherwise they're kept for the test.
+        self._callback: Final[Optional[Callable[[int], None]]] = callback
+        self.transactions: Queue = Queue()
+
+        self._data: Final = bytearray()
+        self._frames: int = 0
+        self._coroutine: Optional[Task] = None
+
+        self._log: Final[Optional[Logger]] = cocotb.log.getChild(name) if name else None
+
+    def start(self) -> None:
+        if self._log is not None:
+            self._log.info("Start")
+
+        if self._coroutine is None:
+            self._coroutine = cocotb.start_soon(self._monitor())
+
+    def stop(self) -> None:
+        if self._log is not None:
+            self._log.info("Stop")
+
+        if self._coroutine is not None:
+            self._coroutine.kill()
+            self._coroutine = None
+
+    @property
+    def data(self) -> bytes:
+        return bytes(self._data)
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    async def _monitor(self) -> None:
+        falling_edge: Final = FallingEdge(self._line)
+        edge: Final = Edge(self._line)
+        frame_time_ns: Final = self._decoder.frame_time_ns
+
+        while True:
+            await falling_edge
+            start: float = get_sim_time("ns")
+            edges: list[tuple[float, int]] = [(start, 0)]
+
+            # Only wake up for transitions within the frame, then once more after the last sample.
+            while True:
+                remaining: float = start + frame_time_ns - get_sim_time("ns")
+                if remaining <= 0:
+                    break
+
+                trigger = await First(edge, Timer(remaining, "ns", round_mode="round"))
+                if trigger is not edge:
+                    break
+
+                edges.append((get_sim_time("ns"), int(self._line.value)))
+
+            word: int = self._decoder.decode(edges)
+            self._frames += 1
+
+            if self._callback is not None:
+                self._callback(word)
+            else:
+                self._data.append(word)
+                self.transactions.put_nowait(word)
+
+            if self._log is not None:
+                self._log.info(f"Received: {word:#04x}")
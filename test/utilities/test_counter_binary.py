@@ -17,6 +17,7 @@ from .. import config
     [
         {"MAX_VALUE": "255", "INCREMENT": "1"},
         {"MAX_VALUE": "1", "INCREMENT": "1"},
+        {"MAX_VALUE": "1", "INCREMENT": "2"},
         {"MAX_VALUE": "8", "INCREMENT": "2"},
         {"MAX_VALUE": "256", "INCREMENT": "13"},
     ],